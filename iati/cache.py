@@ -0,0 +1,278 @@
+"""A module containing a thread-safe cache, used to hold loaded data such as the defaults within `iati.default`.
+
+Example:
+    To load a value only if it is not already cached::
+
+        cache = iati.cache.Cache('my cache', max_entries=10)
+        value = cache.get_or_load('key', lambda: load_value('key'))
+
+"""
+import collections
+import threading
+
+
+class Cache(object):
+    """A thread-safe cache with single-flight loading and least-recently-used eviction.
+
+    Single-flight loading means that when multiple threads request the same missing key at the same time, the value is loaded once. The other threads wait for that load to complete, then receive the same value.
+
+    The cache may be limited to a number of entries, a total size, or both. When a limit is exceeded, the least recently used entries are evicted.
+
+    Attributes:
+        name (str): The name of the cache. Used to identify it in statistics.
+        max_entries (int or None): The maximum number of entries to hold. None means that the number of entries is unlimited.
+        max_size (int or None): The maximum total size of the entries to hold, as measured by `sizeof`. None means that the total size is unlimited.
+        sizeof (func): A function that returns the size of a value. The default counts each value as having a size of 1.
+
+    Note:
+        The entry that has most recently been added is never evicted, even if it alone exceeds `max_size`.
+
+    Warning:
+        Values are returned by reference. They should not be modified unless the cache is the only place that they are used.
+
+    """
+
+    def __init__(self, name, max_entries=None, max_size=None, sizeof=None):
+        """Initialise a Cache.
+
+        Args:
+            name (str): The name of the cache.
+            max_entries (int or None): The maximum number of entries to hold. Defaults to None, meaning that the number of entries is unlimited.
+            max_size (int or None): The maximum total size of the entries to hold. Defaults to None, meaning that the total size is unlimited.
+            sizeof (func): A function that returns the size of a value. Defaults to None, meaning that each value has a size of 1.
+
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.sizeof = sizeof if sizeof is not None else (lambda value: 1)
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._sizes = dict()
+        self._size = 0
+        self._in_flight = dict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self, key):
+        """Determine whether a key has a value in the cache, without affecting statistics or recency."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        """Remove all entries from the cache and reset its statistics.
+
+        Loads that are in progress continue, and add their value to the cache once complete.
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def configure(self, max_entries=None, max_size=None, sizeof=None):
+        """Change the limits of the cache, evicting entries if the new limits are exceeded.
+
+        Args:
+            max_entries (int or None): The maximum number of entries to hold. None means that the number of entries is unlimited.
+            max_size (int or None): The maximum total size of the entries to hold. None means that the total size is unlimited.
+            sizeof (func): A function that returns the size of a value. Defaults to None, meaning that the current function is retained. Changing this recalculates the size of existing entries.
+
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_size = max_size
+            if sizeof is not None:
+                self.sizeof = sizeof
+                self._sizes = {key: sizeof(value) for key, value in self._entries.items()}
+                self._size = sum(self._sizes.values())
+            self._evict()
+
+    def get(self, key, default=None):
+        """Return the value for a key, or a default if it is not in the cache.
+
+        Args:
+            key (hashable): The key to return the value for.
+            default: The value to return if the key is not in the cache.
+
+        Returns:
+            The cached value, or `default`.
+
+        """
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                self._misses += 1
+                return default
+            self._entries[key] = value
+            self._hits += 1
+
+            return value
+
+    def get_or_load(self, key, loader):
+        """Return the value for a key, loading it if it is not in the cache.
+
+        Args:
+            key (hashable): The key to return the value for.
+            loader (func): A function that takes no arguments and returns the value for the key. It is only called if the key is not in the cache and is not already being loaded by another thread.
+
+        Returns:
+            The cached or loaded value.
+
+        Raises:
+            Exception: Any exception raised by `loader`. Threads that were waiting for the value also raise it.
+
+        Warning:
+            `loader` must not request the same key from this cache, otherwise it will wait forever.
+
+        """
+        with self._lock:
+            try:
+                value = self._entries.pop(key)
+            except KeyError:
+                pass
+            else:
+                self._entries[key] = value
+                self._hits += 1
+                return value
+
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = _Flight()
+                self._in_flight[key] = flight
+                self._misses += 1
+                is_loader = True
+            else:
+                self._hits += 1
+                is_loader = False
+
+        if not is_loader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+        except BaseException as err:
+            flight.error = err
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._in_flight[key]
+        flight.value = value
+        flight.done.set()
+
+        return value
+
+    def set(self, key, value):
+        """Add a value to the cache, replacing any existing value for the key.
+
+        Args:
+            key (hashable): The key to set the value for.
+            value: The value to cache.
+
+        """
+        with self._lock:
+            self._store(key, value)
+
+    def setdefault(self, key, value):
+        """Add a value to the cache if there is not already a value for the key.
+
+        Args:
+            key (hashable): The key to set the value for.
+            value: The value to cache if there is no existing value.
+
+        Returns:
+            The value that is cached for the key.
+
+        """
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            self._store(key, value)
+
+            return value
+
+    def stats(self):
+        """Return statistics about the use of the cache.
+
+        Returns:
+            dict: Containing the keys `name`, `entries`, `size`, `max_entries`, `max_size`, `hits`, `misses` and `evictions`. A request that waited for another thread to load a value is counted as a hit.
+
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'size': self._size,
+                'max_entries': self.max_entries,
+                'max_size': self.max_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions
+            }
+
+    def _store(self, key, value):
+        """Store a value as the most recently used entry, then evict entries if limits are exceeded.
+
+        Must be called while holding the lock.
+
+        """
+        if key in self._entries:
+            del self._entries[key]
+            self._size -= self._sizes.pop(key)
+        self._entries[key] = value
+        self._sizes[key] = self.sizeof(value)
+        self._size += self._sizes[key]
+        self._evict()
+
+    def _evict(self):
+        """Evict the least recently used entries until the cache is within its limits, always retaining the most recently used entry.
+
+        Must be called while holding the lock.
+
+        """
+        while len(self._entries) > 1 and self._exceeds_limits():
+            key, _ = self._entries.popitem(last=False)
+            self._size -= self._sizes.pop(key)
+            self._evictions += 1
+
+    def _exceeds_limits(self):
+        """Determine whether the cache exceeds its limits.
+
+        Returns:
+            bool: Whether either the number of entries or the total size exceeds its limit.
+
+        """
+        too_many = self.max_entries is not None and len(self._entries) > self.max_entries
+        too_big = self.max_size is not None and self._size > self.max_size
+
+        return too_many or too_big
+
+
+class _Flight(object):
+    """The state of a value that is being loaded by one thread, and which other threads may be waiting for."""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        """Initialise the state of a load that has not yet completed."""
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
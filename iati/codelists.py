@@ -25,6 +25,8 @@ class Codelist(object):
 
     """
 
+    __slots__ = ('complete', 'codes', 'name', '_name_prose', '_description', '_language', '_url', '_ref', '_category_codelist')
+
     # pylint: disable=too-many-instance-attributes
     def __init__(self, name, xml=None):
         """Initialise a Codelist.
@@ -124,6 +126,63 @@ class Codelist(object):
 
         return hash((self.name, self.complete, tuple(sorted_codes)))
 
+    def __reduce__(self):
+        """Reduce the Codelist to its name, completeness and Code values and names for pickling.
+
+        Warning:
+            Attributes that are not yet implemented are not pickled.
+
+        """
+        return (_create_codelist, (self.name, self.complete, self._code_tuples()))
+
+    @property
+    def code_values(self):
+        """frozenset of str: The values of the Codes on the Codelist.
+
+        This is the quickest way to check whether a value is on the Codelist.
+
+        """
+        return frozenset(code.value for code in self.codes)
+
+    def freeze(self):
+        """Return an immutable copy of the Codelist.
+
+        Returns:
+            iati.codelists.FrozenCodelist: An immutable Codelist that is equal to this Codelist.
+
+        """
+        frozen = FrozenCodelist.__new__(FrozenCodelist)
+        for attr in Codelist.__slots__:
+            setattr(frozen, attr, getattr(self, attr))
+        frozen._freeze()  # pylint: disable=protected-access
+
+        return frozen
+
+    def _code_tuples(self):
+        """Return the value and name of each Code on the Codelist.
+
+        Returns:
+            tuple of tuple: The `(value, name)` of each Code on the Codelist.
+
+        """
+        return tuple((code.value, code.name) for code in self.codes)
+
+    def mutable_copy(self):
+        """Return a mutable copy of the Codelist.
+
+        The copy contains copies of the Codes, so may be modified without affecting this Codelist.
+
+        Returns:
+            iati.Codelist: A mutable Codelist that is equal to this Codelist.
+
+        """
+        codelist = Codelist(self.name)
+        for attr in Codelist.__slots__:
+            setattr(codelist, attr, getattr(self, attr))
+        codelist.codes = set(Code(code.value, code.name) for code in self.codes)
+
+        return codelist
+
     @property
     def xsd_restriction(self):
         """Output the Codelist as an XSD simpleType restriction.
@@ -177,6 +236,8 @@ class Code(object):
 
     """
 
+    __slots__ = ('name', 'value', '_description', '_category', '_url', '_public_database', '_status', '_activation_date', '_withdrawal_date')
+
     # pylint: disable=too-many-instance-attributes
     def __init__(self, value, name=''):
         """Initialise a Code.
@@ -237,6 +298,15 @@ class Code(object):
         """
         return hash((self.value))
 
+    def __reduce__(self):
+        """Reduce the Code to its value and name for pickling.
+
+        Warning:
+            Attributes that are not yet implemented are not pickled.
+
+        """
+        return (Code, (self.value, self.name))
+
     @property
     def xsd_enumeration(self):
         """Output the Code as an etree enumeration element.
@@ -255,3 +325,180 @@ class Code(object):
             value=self.value,
             nsmap=iati.constants.NSMAP
         )
+
+
+class FrozenCodelist(Codelist):
+    """An immutable Codelist.
+
+    A FrozenCodelist may be shared between any number of users without them being able to affect one another. This is how default Codelists are provided.
+
+    In comparison to a Codelist, the `codes` attribute is a frozenset of `iati.codelists.FrozenCode`, while the `code_values` and hash are computed once on creation.
+
+    Use `mutable_copy()` or `copy.deepcopy()` to obtain a Codelist that may be modified.
+
+    """
+
+    __slots__ = ('_frozen', '_hash', '_code_values')
+
+    def __init__(self, name, xml=None):
+        """Initialise a FrozenCodelist.
+
+        Args:
+            name (str): The name of the codelist being initialised.
+            xml (str): An XML representation of a codelist.
+
+        """
+        super(FrozenCodelist, self).__init__(name, xml)
+        self._freeze()
+
+    def __setattr__(self, name, value):
+        """Prevent modification once the Codelist is frozen.
+
+        Raises:
+            AttributeError: Always, once the Codelist has been frozen.
+
+        """
+        if getattr(self, '_frozen', False):
+            raise AttributeError('A FrozenCodelist cannot be modified. Use `mutable_copy()` to obtain a Codelist that can be.')
+        super(FrozenCodelist, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        """Prevent deletion of attributes.
+
+        Raises:
+            AttributeError: Always.
+
+        """
+        raise AttributeError('A FrozenCodelist cannot be modified. Use `mutable_copy()` to obtain a Codelist that can be.')
+
+    def __hash__(self):
+        """Return the hash computed when the Codelist was frozen."""
+        return self._hash
+
+    def __copy__(self):
+        """Return the FrozenCodelist itself, since it cannot be modified."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return a mutable copy of the Codelist.
+
+        Deep copies are made when a Codelist is to be modified, so the copy is made mutable.
+
+        """
+        return self.mutable_copy()
+
+    def __reduce__(self):
+        """Reduce the FrozenCodelist to its name, completeness and Code values and names for pickling."""
+        return (_create_frozen_codelist, (self.name, self.complete, self._code_tuples()))
+
+    @property
+    def code_values(self):
+        """frozenset of str: The values of the Codes on the Codelist."""
+        return self._code_values
+
+    def freeze(self):
+        """Return the FrozenCodelist itself, since it is already immutable."""
+        return self
+
+    def _freeze(self):
+        """Convert the content of the Codelist to immutable types, then prevent further modification."""
+        self.codes = frozenset(code if isinstance(code, FrozenCode) else FrozenCode(code.value, code.name) for code in self.codes)
+        self._code_values = frozenset(code.value for code in self.codes)
+        self._hash = super(FrozenCodelist, self).__hash__()
+        self._frozen = True
+
+
+class FrozenCode(Code):
+    """An immutable Code, as contained within a FrozenCodelist."""
+
+    __slots__ = ('_frozen',)
+
+    def __init__(self, value, name=''):
+        """Initialise a FrozenCode.
+
+        Args:
+            value (str): The value of the code being initialised.
+            name (str): The name of the code being initialised.
+
+        """
+        object.__setattr__(self, '_frozen', False)  # avoids a failed attribute lookup on each assignment within `Code.__init__()`
+        super(FrozenCode, self).__init__(value, name)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        """Prevent modification once the Code is frozen.
+
+        Raises:
+            AttributeError: Always, once the Code has been frozen.
+
+        """
+        if getattr(self, '_frozen', False):
+            raise AttributeError('A FrozenCode cannot be modified.')
+        super(FrozenCode, self).__setattr__(name, value)
+
+    def __delattr__(self, name):
+        """Prevent deletion of attributes.
+
+        Raises:
+            AttributeError: Always.
+
+        """
+        raise AttributeError('A FrozenCode cannot be modified.')
+
+    def __hash__(self):
+        """Hash the Code."""
+        return hash((self.value))
+
+    def __copy__(self):
+        """Return the FrozenCode itself, since it cannot be modified."""
+        return self
+
+    def __deepcopy__(self, memo):
+        """Return a mutable copy of the Code."""
+        return Code(self.value, self.name)
+
+    def __reduce__(self):
+        """Reduce the FrozenCode to its value and name for pickling."""
+        return (FrozenCode, (self.value, self.name))
+
+
+def _create_codelist(name, complete, codes):
+    """Create a Codelist from its component parts.
+
+    This is used when unpickling a Codelist.
+
+    Args:
+        name (str): The name of the Codelist.
+        complete (bool or None): Whether the Codelist is complete.
+        codes (tuple of tuple): The `(value, name)` of each Code on the Codelist.
+
+    Returns:
+        iati.Codelist: The described Codelist.
+
+    """
+    codelist = Codelist(name)
+    codelist.complete = complete
+    codelist.codes = set(Code(value, code_name) for value, code_name in codes)
+
+    return codelist
+
+
+def _create_frozen_codelist(name, complete, codes):
+    """Create a FrozenCodelist from its component parts.
+
+    This is used when unpickling a FrozenCodelist.
+
+    Args:
+        name (str): The name of the Codelist.
+        complete (bool or None): Whether the Codelist is complete.
+        codes (tuple of tuple): The `(value, name)` of each Code on the Codelist.
+
+    Returns:
+        iati.codelists.FrozenCodelist: The described Codelist.
+
+    """
+    codelist = Codelist(name)
+    codelist.complete = complete
+    codelist.codes = set(FrozenCode(value, code_name) for value, code_name in codes)
+
+    return codelist.freeze()
@@ -47,3 +47,41 @@ NAMESPACE = '{http://www.w3.org/2001/XMLSchema}'
 """The namespace that IATI Schema XSD files are specified within."""
 NSMAP = {'xsd': 'http://www.w3.org/2001/XMLSchema'}
 """A dictionary for interpreting namespaces in IATI Schemas."""
+
+PARSER_OPTIONS = {
+    'load_dtd': False,
+    'no_network': True,
+    'resolve_entities': False
+}
+"""Options used by every XML parser, so that parsing does not access the network or expand entities.
+
+Note:
+    These are keyword arguments to `lxml.etree.XMLParser`.
+
+"""
+
+PARSER_PROFILES = {
+    'default': {},
+    'compact': {
+        'collect_ids': False,
+        'remove_blank_text': True,
+        'remove_comments': True
+    },
+    'huge': {
+        'huge_tree': True
+    },
+    'huge_compact': {
+        'collect_ids': False,
+        'huge_tree': True,
+        'remove_blank_text': True,
+        'remove_comments': True
+    }
+}
+"""Named sets of XML parser options, applied in addition to `PARSER_OPTIONS`.
+
+`compact` produces smaller trees that take less time to build by discarding comments and whitespace-only text, and by not building an index of `xml:id` attributes. `huge` lifts the limits that libxml2 places on the depth of trees and the size of text, so that very large files may be parsed.
+
+Warning:
+    `compact` trees do not contain comments or whitespace between elements, so modified Datasets will not serialise to the same text.
+
+"""
@@ -1,11 +1,30 @@
 """A module containing a core representation of an IATI Dataset."""
+import array
+import collections
+import copy
+import datetime
+import hashlib
+import mmap
 import sys
 from lxml import etree
+import six
+import iati.constants
+import iati.default
 import iati.exceptions
 import iati.utilities
 import iati.validator
 
 
+_PARSE_CHUNK_SIZE = 65536
+"""int: The number of bytes fed to the XML parser at a time when parsing a buffer that is not a bytes object."""
+
+_ACTIVITY_TAGS = ('iati-activity', 'iati-organisation')
+"""tuple of str: The names of the elements that each describe a single activity or organisation."""
+
+_EPOCH = datetime.date(1970, 1, 1)
+"""datetime.date: The date from which dates in `TransactionColumns` are counted."""
+
+
 class Dataset(object):
     """Representation of an IATI XML file that may be validated against a Schema.
 
@@ -16,6 +35,8 @@ class Dataset(object):
     Note:
         Should it be modified after initialisation, the current content of the Dataset is deemed to be that which was last asigned to either `self.xml_str` or `self.xml_tree`.
 
+        Only the representation that was last assigned is held. The string representation of a Dataset that was assigned a tree is created when `xml_str` is first accessed, so reflects any modifications made to the tree before that point.
+
     Warning:
         The behaviour of simultaneous assignment to both `self.xml_str` and `self.xml_tree` is undefined.
 
@@ -32,20 +53,25 @@ class Dataset(object):
 
     """
 
-    def __init__(self, xml):
+    def __init__(self, xml, keep_xml_str=True, parser_profile='default'):
         """Initialise a Dataset.
 
         Args:
             xml (str or ElementTree): A representation of the XML to encapsulate.
                 May be either a string or a lxml ElementTree.
+            keep_xml_str (bool): Whether a string that is assigned to `xml_str` should be kept once it has been parsed into a tree. Defaults to True. When False, the string is discarded to reduce memory use, then recreated from the tree if `xml_str` is accessed.
+            parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse strings that are assigned to `xml_str` with. Defaults to 'default'.
 
         Raises:
             TypeError: If an attempt to pass something that is not a string or ElementTree is made.
             ValueError: If a provided XML string is not valid XML.
+            ValueError: If `parser_profile` is not the name of a parser profile.
 
         Warning:
             The required parameters to create a Dataset may change. See the TODO.
 
+            A string that is recreated from the tree may differ from the original string. For example, any XML declaration is not included, so line numbers may differ from the `sourceline` of elements.
+
         Todo:
             It should be possible to create a Dataset from a file. In this situation, having `xml` as a required parameter does not seem sensible. Need to better consider this situation.
 
@@ -53,13 +79,119 @@ class Dataset(object):
 
         """
         self._xml_str = None
+        self._xml_bytes = None
         self._xml_tree = None
+        self._xml_str_is_text = False
+        self._keep_xml_str = keep_xml_str
+        self._line_index = None
+        self._index = None
+
+        iati.utilities.parser_options(parser_profile)  # check that the profile exists
+        self._parser_profile = parser_profile
 
         if isinstance(xml, (etree._Element, etree._ElementTree)):  # pylint: disable=W0212
             self.xml_tree = xml
         else:
             self.xml_str = xml
 
+    @classmethod
+    def from_bytes(cls, xml_bytes, keep_xml_str=True, parser_profile='default'):
+        """Create a Dataset from the raw bytes of an XML document, without first decoding them.
+
+        The bytes are given straight to the XML parser, which determines their encoding from any byte order mark or XML declaration. They are only decoded into a string should `xml_str` be accessed.
+
+        Args:
+            xml_bytes (bytes or bytearray or memoryview or mmap.mmap): The raw bytes of an XML document.
+            keep_xml_str (bool): Whether the bytes should be kept once they have been parsed, so that `xml_str` reproduces them. Defaults to True.
+            parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse the bytes with. Defaults to 'default'.
+
+        Returns:
+            iati.Dataset: A Dataset representing the XML.
+
+        Raises:
+            TypeError: If `xml_bytes` is not a bytes-like object.
+            iati.exceptions.ValidationError: If `xml_bytes` does not contain valid XML.
+            ValueError: If the bytes could not be parsed and their encoding could not be detected.
+            ValueError: If `parser_profile` is not the name of a parser profile.
+
+        Note:
+            Should the parser not accept the bytes, they are decoded and parsed as a string, as is done when assigning to `xml_str`. This allows documents with an undeclared encoding other than UTF-8 to be loaded, and provides details of why invalid XML is invalid.
+
+        """
+        if not isinstance(xml_bytes, (bytes, bytearray, memoryview, mmap.mmap)):
+            msg = "Datasets can only be created from bytes-like objects with from_bytes(). Actual type: {0}".format(type(xml_bytes))
+            iati.utilities.log_error(msg)
+            raise TypeError(msg)
+
+        parser_options = iati.utilities.parser_options(parser_profile)
+
+        try:
+            root = _parse_buffer(xml_bytes, parser_profile, parser_options)
+        except (etree.XMLSyntaxError, ValueError):
+            # reject values that are obviously not XML before spending time detecting their encoding
+            not_xml_log = iati.validator._sniff_not_xml(_buffer_to_bytes(xml_bytes))  # pylint: disable=protected-access
+            if not_xml_log is not None:
+                raise iati.exceptions.ValidationError(not_xml_log)
+
+            # let the xml_str setter detect the encoding and explain what is wrong
+            xml_str = iati.utilities._decode(_buffer_to_bytes(xml_bytes))  # pylint: disable=protected-access
+            return cls(xml_str, keep_xml_str=keep_xml_str, parser_profile=parser_profile)
+
+        dataset = cls(root, keep_xml_str=keep_xml_str, parser_profile=parser_profile)
+        dataset._xml_str_is_text = True  # pylint: disable=protected-access
+        if keep_xml_str:
+            dataset._xml_bytes = xml_bytes  # pylint: disable=protected-access
+
+        return dataset
+
+    @classmethod
+    def from_file(cls, xml_file, keep_xml_str=True, parser_profile='default'):
+        """Create a Dataset from a file object that has been opened in binary mode.
+
+        A file on disk that is read from its start is memory-mapped rather than read into memory. Other file objects are read in full.
+
+        Args:
+            xml_file (file): A file object, opened in binary mode, containing an XML document.
+            keep_xml_str (bool): Whether the contents of the file should be kept once they have been parsed, so that `xml_str` reproduces them. Defaults to True.
+            parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse the file with. Defaults to 'default'.
+
+        Returns:
+            iati.Dataset: A Dataset representing the XML in the file.
+
+        Raises:
+            TypeError: If the file does not provide bytes.
+            iati.exceptions.ValidationError: If the file does not contain valid XML.
+            ValueError: If the file could not be parsed and its encoding could not be detected.
+            ValueError: If `parser_profile` is not the name of a parser profile.
+
+        """
+        return cls.from_bytes(_map_or_read(xml_file), keep_xml_str=keep_xml_str, parser_profile=parser_profile)
+
+    @classmethod
+    def from_path(cls, path, keep_xml_str=True, parser_profile='default'):
+        """Create a Dataset from the file at the specified path, memory-mapping rather than decoding it.
+
+        Args:
+            path (str): The path to a file containing an XML document.
+            keep_xml_str (bool): Whether the contents of the file should be kept mapped once they have been parsed, so that `xml_str` reproduces them. Defaults to True.
+            parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse the file with. Defaults to 'default'. Use 'huge' for files that exceed the limits of the default parser.
+
+        Returns:
+            iati.Dataset: A Dataset representing the XML in the file.
+
+        Raises:
+            FileNotFoundError (python3) / IOError (python2): When a file at the specified path does not exist.
+            iati.exceptions.ValidationError: If the file does not contain valid XML.
+            ValueError: If the file could not be parsed and its encoding could not be detected.
+            ValueError: If `parser_profile` is not the name of a parser profile.
+
+        Warning:
+            While a Dataset that keeps its string holds a memory-mapped file, modifying the file on disk may modify `xml_str`.
+
+        """
+        with open(path, 'rb') as xml_file:
+            return cls.from_file(xml_file, keep_xml_str=keep_xml_str, parser_profile=parser_profile)
+
     @property
     def xml_str(self):
         """str: An XML string representation of the Dataset.
@@ -68,12 +200,24 @@ class Dataset(object):
             ValueError: If a value that is being assigned is not a valid XML string.
             TypeError: If a value that is being assigned is not a string.
 
+        Note:
+            An assigned string is parsed once. The resulting tree is kept, so accessing `xml_tree` does not parse the string again.
+
         Todo:
             Clarify error messages, for example when a mismatched encoding is used.
 
             Perhaps pass on the original lxml error message instead of trying to intrepret what might have gone wrong when running `etree.fromstring()`.
 
         """
+        if self._xml_str is None and self._xml_bytes is not None:
+            self._xml_str = iati.utilities._decode(_buffer_to_bytes(self._xml_bytes)).strip()  # pylint: disable=protected-access
+            self._xml_bytes = None
+        elif self._xml_str is None and self._xml_tree is not None:
+            if self._xml_str_is_text:
+                self._xml_str = etree.tostring(self._xml_tree, encoding='unicode')
+            else:
+                self._xml_str = etree.tostring(self._xml_tree, pretty_print=True)
+
         return self._xml_str
 
     @xml_str.setter
@@ -83,6 +227,7 @@ class Dataset(object):
             iati.utilities.log_error(msg)
             raise TypeError(msg)
         else:
+            parser = iati.utilities.get_parser(self._parser_profile)
             try:
                 value_stripped = value.strip()
 
@@ -93,16 +238,21 @@ class Dataset(object):
                 else:
                     value_stripped_bytes = value_stripped
 
-                validation_error_log = iati.validator.validate_is_xml(value_stripped_bytes)
-
-                if not validation_error_log.contains_errors():
-                    self.xml_tree = etree.fromstring(value_stripped_bytes)
-                    self._xml_str = value_stripped
-                else:
+                try:
+                    tree = etree.fromstring(value_stripped_bytes, parser)
+                except (etree.XMLSyntaxError, TypeError, ValueError):
+                    # only work out exactly what the problem is once it is known that there is one
+                    validation_error_log = iati.validator.validate_is_xml(value_stripped_bytes)
                     if validation_error_log.contains_error_of_type(TypeError):
                         raise TypeError
                     else:
                         raise iati.exceptions.ValidationError(validation_error_log)
+
+                self._xml_tree = tree
+                self._xml_str = value_stripped if self._keep_xml_str else None
+                self._xml_bytes = None
+                self._index = None
+                self._xml_str_is_text = not isinstance(value_stripped, bytes)
             except (AttributeError, TypeError):
                 msg = "Datasets can only be ElementTrees or strings containing valid XML, using the xml_tree and xml_str attributes respectively. Actual type: {0}".format(type(value))
                 iati.utilities.log_error(msg)
@@ -127,17 +277,109 @@ class Dataset(object):
     @xml_tree.setter
     def xml_tree(self, value):
         if isinstance(value, etree._Element):  # pylint: disable=W0212
-            self._xml_tree = value
-            self._xml_str = etree.tostring(value, pretty_print=True)
+            root = value
         elif isinstance(value, etree._ElementTree):  # pylint: disable=W0212
             root = value.getroot()
-            self._xml_tree = root
-            self._xml_str = etree.tostring(root, pretty_print=True)
         else:
             msg = "If setting a Dataset with the xml_property, an ElementTree should be provided, not a {0}.".format(type(value))
             iati.utilities.log_error(msg)
             raise TypeError(msg)
 
+        # the string representation is created from the tree when it is first requested
+        self._xml_tree = root
+        self._xml_str = None
+        self._xml_bytes = None
+        self._xml_str_is_text = False
+        self._index = None
+
+    def activity_digests(self):
+        """Return a canonical digest of each `iati-activity` or `iati-organisation` element within the Dataset.
+
+        Returns:
+            list of tuple: A tuple for each activity or organisation, in document order, in the format: `(str, str)` - The identifier, or None where there is no identifier; The digest, as given by `iati.data.activity_digest()`.
+
+        Example:
+            To find the activities that are repeated within a Dataset::
+
+                digests = [digest for _, digest in dataset.activity_digests()]
+                repeated = {digest for digest in digests if digests.count(digest) > 1}
+
+        """
+        return [(_activity_identifier(activity), activity_digest(activity)) for activity in self.iter_activities()]
+
+    def index(self, attributes=None):
+        """Return an index of the activities or organisations within the Dataset, building it on first use.
+
+        The index is reused by later calls until new XML is assigned to the Dataset, `invalidate_index()` is called, or different `attributes` are requested.
+
+        Args:
+            attributes (iterable of str): XPaths, relative to an `iati-activity` or `iati-organisation` element, of the attributes to index by value. Defaults to None, meaning `iati.data.DatasetIndex.DEFAULT_ATTRIBUTES`.
+
+        Returns:
+            iati.data.DatasetIndex: An index of the activities or organisations within the Dataset.
+
+        Raises:
+            lxml.etree.XPathSyntaxError: When one of the `attributes` is not a valid XPath.
+
+        Warning:
+            Modifications made directly to `xml_tree` are not detected. Call `invalidate_index()` after modifying the tree.
+
+        Example:
+            To find an activity by its identifier, then every activity that shares its reporting organisation::
+
+                index = dataset.index()
+                activity = index.by_identifier('AA-AAA-123456789-ABC123')
+                related = index.by_reporting_org(activity.find('reporting-org').get('ref'))
+
+        """
+        attributes = DatasetIndex.DEFAULT_ATTRIBUTES if attributes is None else tuple(attributes)
+
+        if self._index is None or self._index.attributes != attributes:
+            self._index = DatasetIndex(self, attributes)
+
+        return self._index
+
+    def invalidate_index(self):
+        """Discard the index of the Dataset, so that it is rebuilt when next requested.
+
+        This should be called after modifying `xml_tree` in place.
+
+        """
+        self._index = None
+
+    def iter_activities(self):
+        """Iterate over the `iati-activity` or `iati-organisation` elements within the Dataset.
+
+        Yields:
+            etree._Element: Each `iati-activity` or `iati-organisation` element that is a child of the root element, in document order. The `sourceline` attribute of each element gives its line number.
+
+        Note:
+            The Dataset is not modified. To process a file without first loading all of it into memory, use `iati.data.iter_activities()`.
+
+        """
+        for element in self._xml_tree.iterchildren(*_ACTIVITY_TAGS):
+            yield element
+
+    def _lines(self):
+        """Return an index of the lines of the XML source, building it on first use.
+
+        Where the Dataset holds bytes that have not yet been decoded, and they are in an encoding where a newline is a single byte, the bytes are indexed directly so that they need not be decoded as a whole.
+
+        Returns:
+            iati.data._LineIndex: An index of the lines of the source that `sourceline` attributes refer to.
+
+        """
+        if self._xml_str is None and isinstance(self._xml_bytes, (bytes, bytearray, mmap.mmap)):
+            source = self._xml_bytes
+        else:
+            source = self.xml_str
+
+        if self._line_index is None or self._line_index[0] is not source:
+            encoding = self._xml_tree.getroottree().docinfo.encoding
+            self._line_index = (source, _LineIndex(source, encoding))
+
+        return self._line_index[1]
+
     def _raw_source_at_line(self, line_number):
         """Return the raw value of the XML source at the specified line.
 
@@ -158,12 +400,14 @@ class Dataset(object):
         if line_number < 0:
             raise ValueError
 
-        try:
-            # this is led with an empty string since the `sourceline` attribute is 1-indexed.
-            split_lines = [''] + self.xml_str.split('\n')
-            return split_lines[line_number]
-        except IndexError:
+        lines = self._lines()
+        if line_number > len(lines):
             raise ValueError
+        elif line_number == 0:
+            # the `sourceline` attribute is 1-indexed, so there is nothing at line 0
+            return lines.between(1, 0)
+
+        return lines.between(line_number, line_number)
 
     @property
     def version(self):
@@ -237,17 +481,893 @@ class Dataset(object):
             Test with minified XML.
 
         """
+        if not isinstance(line_number, int) or isinstance(line_number, bool):
+            raise TypeError
+
         if not isinstance(surrounding_lines, int) or isinstance(surrounding_lines, bool):
             raise TypeError
 
         if surrounding_lines < 0:
             raise ValueError
 
-        lines_arr = []
+        lines = self._lines()
         lower_line_number = max(line_number - surrounding_lines, 1)
-        upper_line_number = min(line_number + surrounding_lines + 1, len(self.xml_str.split('\n')) + 1)
+        upper_line_number = min(line_number + surrounding_lines, len(lines))
+
+        return lines.between(lower_line_number, upper_line_number)
+
+
+def _buffer_to_bytes(buffer):
+    """Return the contents of a bytes-like object as bytes, without copying a bytes object.
+
+    Args:
+        buffer (bytes or bytearray or memoryview or mmap.mmap): The object to obtain the contents of.
+
+    Returns:
+        bytes: The contents of the buffer.
+
+    """
+    if isinstance(buffer, bytes):
+        return buffer
+    elif isinstance(buffer, memoryview):
+        return buffer.tobytes()
+
+    return buffer[:]
+
+
+def _map_or_read(xml_file):
+    """Memory-map a file object if it is a file on disk positioned at its start, otherwise read its remaining contents.
+
+    Args:
+        xml_file (file): The file object to obtain the contents of.
+
+    Returns:
+        bytes or mmap.mmap: The contents of the file.
+
+    """
+    try:
+        if xml_file.tell() == 0:
+            return mmap.mmap(xml_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, EnvironmentError, ValueError):
+        # the file is not on disk, or is empty and so cannot be mapped
+        pass
+
+    return xml_file.read()
+
+
+def _parse_buffer(buffer, parser_profile, parser_options):
+    """Parse a bytes-like object into an XML tree without copying it in full.
+
+    Leading whitespace is skipped, as would be stripped from a string assigned to `Dataset.xml_str`.
+
+    Args:
+        buffer (bytes or bytearray or memoryview or mmap.mmap): The raw bytes of an XML document.
+        parser_profile (str): The name of the parser profile to parse a bytes object with.
+        parser_options (dict): The options for the parser profile, used to create a parser that is fed other buffers.
+
+    Returns:
+        etree._Element: The root element of the parsed XML.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the buffer does not contain valid XML.
+
+    """
+    if isinstance(buffer, bytes):
+        return etree.fromstring(buffer.lstrip(), iati.utilities.get_parser(parser_profile))
+
+    view = memoryview(buffer)
+    start = 0
+    while start < len(view) and view[start:start + 1].tobytes().isspace():
+        start += 1
+
+    # the feed interface is given its own parser so that a failed parse cannot leave a shared parser part way through a document
+    parser = etree.XMLParser(**parser_options)
+    for offset in range(start, len(view), _PARSE_CHUNK_SIZE):
+        parser.feed(view[offset:offset + _PARSE_CHUNK_SIZE].tobytes())
+
+    return parser.close()
+
+
+def iter_activities(source, parser_profile='default'):
+    """Stream the `iati-activity` or `iati-organisation` elements from a file, without loading all of it into memory.
+
+    Each element is yielded once it has been fully parsed. When iteration continues, the element is cleared and any elements before it are removed from the tree, so memory use depends on the size of the largest activity or organisation rather than the size of the file.
+
+    As with `iati.Dataset`, a UTF-8 byte order mark and whitespace before the start of the XML are skipped. Line numbers are counted from the start of the XML.
+
+    Args:
+        source (str or file): The path to a file containing IATI XML, or a file object opened in binary mode. A file object is read from its current position.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse the file with. Defaults to 'default'.
+
+    Yields:
+        etree._Element: Each `iati-activity` or `iati-organisation` element, in document order. The `sourceline` attribute of each element gives its line number.
+
+    Raises:
+        FileNotFoundError (python3) / IOError (python2): When a file at the specified path does not exist.
+        lxml.etree.XMLSyntaxError: When the file does not contain valid XML. Elements before the point at which the XML becomes invalid are yielded before this is raised.
+        ValueError: When `parser_profile` is not the name of a parser profile.
+
+    Warning:
+        Yielded elements are emptied once iteration continues. Any content that is needed later must be copied, for example with `copy.deepcopy()`, before requesting the next element.
+
+    Example:
+        To count the transactions in each activity in a large file::
+
+            counts = {activity.findtext('iati-identifier'): len(activity.findall('transaction')) for activity in iati.data.iter_activities(path)}
+
+    """
+    parser_options = iati.utilities.parser_options(parser_profile)
+
+    xml_file = open(source, 'rb') if not hasattr(source, 'read') else source
+    try:
+        for _, element in etree.iterparse(_LeadingWhitespaceSkipper(xml_file), events=('end',), tag=_ACTIVITY_TAGS, **parser_options):
+            yield element
+
+            # free the element, along with any siblings that have already been processed
+            # `clear(keep_tail=True)` is not available in all supported versions of lxml
+            tail = element.tail
+            element.clear()
+            element.tail = tail
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+    finally:
+        if xml_file is not source:
+            xml_file.close()
+
+
+class _LeadingWhitespaceSkipper(object):
+    """A file-like object that reads a binary file, skipping a UTF-8 byte order mark and whitespace at its start.
+
+    The XML parser does not permit anything other than a byte order mark before an XML declaration, while `iati.Dataset` strips leading whitespace.
+
+    """
+
+    _UTF8_BOM = b'\xef\xbb\xbf'
+
+    def __init__(self, xml_file):
+        """Initialise the reader, reading from the file until the first byte that is not whitespace.
+
+        Args:
+            xml_file (file): A file object opened in binary mode.
+
+        """
+        self._file = xml_file
+        self._pending = xml_file.read(_PARSE_CHUNK_SIZE)
+        if self._pending.startswith(self._UTF8_BOM):
+            self._pending = self._pending[len(self._UTF8_BOM):]
+        self._pending = self._pending.lstrip()
+
+        while not self._pending:
+            chunk = xml_file.read(_PARSE_CHUNK_SIZE)
+            if not chunk:
+                break
+            self._pending = chunk.lstrip()
+
+    def read(self, size=-1):
+        """Read up to `size` bytes, starting with those read while skipping leading whitespace.
+
+        Args:
+            size (int): The maximum number of bytes to read. Defaults to -1, meaning all remaining bytes.
+
+        Returns:
+            bytes: The bytes that were read. Empty at the end of the file.
+
+        """
+        if not self._pending:
+            return self._file.read(size)
+
+        if size is None or size < 0:
+            data = self._pending + self._file.read()
+            self._pending = b''
+        else:
+            data = self._pending[:size]
+            self._pending = self._pending[size:]
+
+        return data
+
+
+class DatasetIndex(object):
+    """An index of the activities or organisations within a Dataset, built in a single pass over them.
+
+    Activities and organisations may be looked up by their identifier, by the `@ref` of their reporting organisation, and by the value of any of a configurable set of attributes. Each lookup is a dictionary access.
+
+    Attributes:
+        DEFAULT_ATTRIBUTES (tuple of str): The attributes that are indexed when no others are specified. These are commonly mapped to Codelists.
+        attributes (tuple of str): XPaths, relative to an `iati-activity` or `iati-organisation` element, of the attributes that are indexed by value.
+
+    Warning:
+        The index refers to elements within the tree of the Dataset. It is not updated should that tree be modified.
+
+    """
+
+    DEFAULT_ATTRIBUTES = (
+        'activity-status/@code',
+        'recipient-country/@code',
+        'recipient-region/@code',
+        'sector/@code',
+        'transaction/transaction-type/@code'
+    )
+
+    def __init__(self, dataset, attributes=DEFAULT_ATTRIBUTES):
+        """Build an index of a Dataset.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to index.
+            attributes (iterable of str): XPaths, relative to an `iati-activity` or `iati-organisation` element, of the attributes to index by value. Each must select attributes or text. Defaults to `DEFAULT_ATTRIBUTES`.
+
+        Raises:
+            lxml.etree.XPathSyntaxError: When one of the `attributes` is not a valid XPath.
+
+        """
+        self.attributes = tuple(attributes)
+        compiled_attributes = [(path, etree.XPath(path)) for path in self.attributes]
+
+        by_identifier = dict()
+        by_reporting_org = dict()
+        by_attribute = {path: dict() for path in self.attributes}
+        activity_count = 0
+
+        for activity in dataset.iter_activities():
+            activity_count += 1
+
+            identifier = _activity_identifier(activity)
+            if identifier is not None:
+                by_identifier.setdefault(identifier, []).append(activity)
+
+            reporting_org = activity.find('reporting-org')
+            if reporting_org is not None and reporting_org.get('ref') is not None:
+                by_reporting_org.setdefault(reporting_org.get('ref').strip(), []).append(activity)
+
+            for path, xpath in compiled_attributes:
+                # each activity is listed once against a value, however many times that value is used within it
+                for value in set(value.strip() for value in xpath(activity)):
+                    by_attribute[path].setdefault(value, []).append(activity)
+
+        self._len = activity_count
+        self._by_identifier = _freeze_lists(by_identifier)
+        self._by_reporting_org = _freeze_lists(by_reporting_org)
+        self._by_attribute = {path: _freeze_lists(values) for path, values in by_attribute.items()}
+
+    def __len__(self):
+        """Return the number of activities or organisations that were indexed."""
+        return self._len
+
+    def attribute_values(self, path):
+        """Return the values of an indexed attribute that are used within the Dataset.
+
+        Args:
+            path (str): The XPath of an indexed attribute.
+
+        Returns:
+            frozenset of str: The values of the attribute.
+
+        Raises:
+            ValueError: When `path` is not an indexed attribute.
+
+        """
+        return frozenset(self._values_for(path))
+
+    def by_attribute(self, path, value):
+        """Return the activities or organisations that use a value for an indexed attribute.
+
+        Args:
+            path (str): The XPath of an indexed attribute, as provided when building the index.
+            value (str): The value of the attribute to look up.
+
+        Returns:
+            tuple of etree._Element: The activities or organisations, in document order. Empty if none use the value.
+
+        Raises:
+            ValueError: When `path` is not an indexed attribute.
+
+        """
+        return self._values_for(path).get(value, ())
+
+    def by_identifier(self, identifier):
+        """Return the activity or organisation with an identifier.
+
+        Args:
+            identifier (str): The `iati-identifier` or `organisation-identifier` to look up.
+
+        Returns:
+            etree._Element or None: The first activity or organisation with the identifier. None if there is not one.
+
+        """
+        try:
+            return self._by_identifier[identifier][0]
+        except KeyError:
+            return None
+
+    def by_reporting_org(self, ref):
+        """Return the activities or organisations reported by an organisation.
+
+        Args:
+            ref (str): The `reporting-org/@ref` to look up.
+
+        Returns:
+            tuple of etree._Element: The activities or organisations, in document order. Empty if there are none.
+
+        """
+        return self._by_reporting_org.get(ref, ())
+
+    def duplicate_identifiers(self):
+        """Return the identifiers that are used by more than one activity or organisation.
+
+        Returns:
+            dict: Mapping each duplicated identifier to a tuple of the activities or organisations that use it.
+
+        """
+        return {identifier: activities for identifier, activities in self._by_identifier.items() if len(activities) > 1}
+
+    def _values_for(self, path):
+        """Return the index for an attribute.
+
+        Args:
+            path (str): The XPath of an indexed attribute.
+
+        Returns:
+            dict: Mapping values of the attribute to the activities or organisations that use them.
+
+        Raises:
+            ValueError: When `path` is not an indexed attribute.
+
+        """
+        try:
+            return self._by_attribute[path]
+        except KeyError:
+            raise ValueError('{0} is not an indexed attribute. Indexed attributes are: {1}'.format(path, ', '.join(self.attributes)))
+
+
+class TransactionColumns(object):
+    """The transactions within some IATI data, held as a column for each of their properties.
+
+    Each column holds one entry per transaction, in document order:
+
+    * `activity` (array of int): The position of the activity containing the transaction, counting from 0.
+    * `value` (array of float): The value of the transaction. NaN where it is missing or is not a number.
+    * `currency` (array of int): The id of the currency of the transaction, taken from `value/@currency` or the `@default-currency` of the activity.
+    * `value_date` (array of int): The `value/@value-date` of the transaction, as a number of days since 1970-01-01. `MISSING_DATE` where it is missing or is not a date.
+    * `transaction_type` (array of int): The id of the `transaction-type/@code` of the transaction.
+    * `provider_org_ref` (list of str): The `provider-org/@ref` of the transaction. None where it is missing.
+    * `receiver_org_ref` (list of str): The `receiver-org/@ref` of the transaction. None where it is missing.
+
+    Coded columns hold integer ids rather than codes. The id of a code is its position within `code_values[column]`, which lists the codes on the relevant default Codelist in sorted order. Missing codes are given the id `MISSING`, and codes that are not on the Codelist are given the id `NOT_ON_CODELIST`.
+
+    Attributes:
+        CODED_COLUMNS (dict): Mapping the names of columns that hold integer ids to the name of the Codelist that the ids refer to.
+        MISSING (int): The id given to a code that is missing.
+        NOT_ON_CODELIST (int): The id given to a code that is not on the relevant Codelist.
+        MISSING_DATE (int): The value given to a date that is missing or invalid.
+        code_values (dict): Mapping the name of each coded column to a tuple of the codes that its ids refer to.
+        version (str): The version of the Standard whose Codelists the ids refer to.
+
+    """
+
+    CODED_COLUMNS = {
+        'currency': 'Currency',
+        'transaction_type': 'TransactionType'
+    }
+    MISSING = -1
+    NOT_ON_CODELIST = -2
+    MISSING_DATE = -2 ** 31
+
+    def __init__(self, version=None):
+        """Initialise a set of columns containing no transactions.
+
+        Args:
+            version (str): The version of the Standard whose default Codelists are used to map codes to ids. Defaults to None, meaning the latest version.
+
+        """
+        self.version = iati.default.get_default_version_if_none(version)
+        self.code_values = {column: tuple(sorted(iati.default.codelist(name, self.version).code_values)) for column, name in self.CODED_COLUMNS.items()}
+
+        self._code_ids = {column: {code: idx for idx, code in enumerate(codes)} for column, codes in self.code_values.items()}
+        self._date_days = dict()
+        self._columns = {
+            'activity': array.array('l'),
+            'value': array.array('d'),
+            'currency': array.array('l'),
+            'value_date': array.array('l'),
+            'transaction_type': array.array('l'),
+            'provider_org_ref': list(),
+            'receiver_org_ref': list()
+        }
+
+    def __getitem__(self, column):
+        """Return a column."""
+        return self._columns[column]
+
+    def __len__(self):
+        """Return the number of transactions."""
+        return len(self._columns['activity'])
+
+    def keys(self):
+        """Return the names of the columns.
+
+        Returns:
+            list of str: The names of the columns.
+
+        """
+        return list(self._columns.keys())
+
+    def decode(self, column, code_id):
+        """Return the code that an id in a coded column refers to.
+
+        Args:
+            column (str): The name of a coded column.
+            code_id (int): An id from the column.
+
+        Returns:
+            str or None: The code. None if the id is `MISSING` or `NOT_ON_CODELIST`.
+
+        Raises:
+            KeyError: When `column` is not a coded column.
+
+        """
+        if code_id < 0:
+            return None
+
+        return self.code_values[column][code_id]
+
+    def to_numpy(self):
+        """Return the columns as NumPy arrays.
+
+        Numeric columns are converted without copying where possible. `value_date` becomes a `datetime64[D]` array, with missing dates as NaT. Organisation references become arrays of objects.
+
+        Returns:
+            dict: Mapping the name of each column to a NumPy array.
+
+        Raises:
+            ImportError: When NumPy is not installed.
+
+        """
+        try:
+            import numpy  # imported here since NumPy is an optional dependency
+        except ImportError:
+            raise ImportError('NumPy is required to convert transactions to NumPy arrays. Install it with `pip install numpy`.')
+
+        columns = {
+            'activity': numpy.frombuffer(self._columns['activity'], dtype=numpy.dtype('l')),
+            'value': numpy.frombuffer(self._columns['value'], dtype=numpy.float64),
+            'currency': numpy.frombuffer(self._columns['currency'], dtype=numpy.dtype('l')),
+            'transaction_type': numpy.frombuffer(self._columns['transaction_type'], dtype=numpy.dtype('l')),
+            'provider_org_ref': numpy.array(self._columns['provider_org_ref'], dtype=object),
+            'receiver_org_ref': numpy.array(self._columns['receiver_org_ref'], dtype=object)
+        }
+
+        days = numpy.frombuffer(self._columns['value_date'], dtype=numpy.dtype('l'))
+        value_date = days.astype('datetime64[D]')
+        value_date[days == self.MISSING_DATE] = numpy.datetime64('NaT')
+        columns['value_date'] = value_date
+
+        return columns
+
+    def _add_activity(self, activity, activity_position):
+        """Add the transactions within an activity to the columns.
+
+        Args:
+            activity (etree._Element): An `iati-activity` element.
+            activity_position (int): The position of the activity within the data.
+
+        """
+        columns = self._columns
+        default_currency = activity.get('default-currency')
+
+        for transaction in activity.iterchildren('transaction'):
+            value_el = transaction.find('value')
+            if value_el is None:
+                value_el = etree.Element('value')
+            transaction_type_el = transaction.find('transaction-type')
+            provider_org_el = transaction.find('provider-org')
+            receiver_org_el = transaction.find('receiver-org')
+
+            try:
+                value = float(value_el.text)
+            except (TypeError, ValueError):
+                value = float('nan')
+
+            columns['activity'].append(activity_position)
+            columns['value'].append(value)
+            columns['currency'].append(self._code_id('currency', value_el.get('currency', default_currency)))
+            columns['value_date'].append(self._days(value_el.get('value-date')))
+            columns['transaction_type'].append(self._code_id('transaction_type', None if transaction_type_el is None else transaction_type_el.get('code')))
+            columns['provider_org_ref'].append(None if provider_org_el is None else provider_org_el.get('ref'))
+            columns['receiver_org_ref'].append(None if receiver_org_el is None else receiver_org_el.get('ref'))
+
+    def _code_id(self, column, code):
+        """Return the id of a code in a coded column.
+
+        Args:
+            column (str): The name of the coded column.
+            code (str or None): The code.
+
+        Returns:
+            int: The id of the code.
+
+        """
+        if code is None:
+            return self.MISSING
+
+        return self._code_ids[column].get(code.strip(), self.NOT_ON_CODELIST)
+
+    def _days(self, date_str):
+        """Return the number of days between 1970-01-01 and a date, caching the result since dates are frequently repeated.
+
+        Args:
+            date_str (str or None): A date in the format `YYYY-MM-DD`.
+
+        Returns:
+            int: The number of days since 1970-01-01. `MISSING_DATE` if the date is missing or invalid.
+
+        """
+        try:
+            return self._date_days[date_str]
+        except KeyError:
+            pass
+
+        try:
+            days = (datetime.datetime.strptime(date_str.strip()[:10], '%Y-%m-%d').date() - _EPOCH).days
+        except (AttributeError, TypeError, ValueError):
+            days = self.MISSING_DATE
+        self._date_days[date_str] = days
+
+        return days
+
+
+def extract_transactions(source, version=None, as_numpy=False):
+    """Extract the transactions within some IATI data into columns, walking the activities once.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements such as that returned by `iati.dedupe.DigestIndex.filter()`. Files are streamed using `iati.data.iter_activities()`, so need not fit in memory as a tree.
+        version (str): The version of the Standard whose default Codelists are used to map codes to ids. Defaults to None, meaning the version stated by the data, or the latest version should it not state a valid version.
+        as_numpy (bool): Whether to return NumPy arrays rather than a `TransactionColumns`. Defaults to False.
+
+    Returns:
+        iati.data.TransactionColumns or dict: The transactions, as columns. When `as_numpy` is True, a dictionary mapping the name of each column to a NumPy array.
+
+    Raises:
+        ImportError: When `as_numpy` is True and NumPy is not installed.
+        lxml.etree.XMLSyntaxError: When a file does not contain valid XML.
+
+    Example:
+        To total the disbursements, by currency, in a large file::
+
+            transactions = iati.data.extract_transactions(path)
+            columns = transactions.to_numpy()
+            disbursements = columns['transaction_type'] == transactions.code_values['transaction_type'].index('3')
+            totals = numpy.bincount(columns['currency'][disbursements], weights=columns['value'][disbursements])
+
+    """
+    activities, stated_version = _activity_stream(source)
+
+    if version is None and stated_version in iati.constants.STANDARD_VERSIONS:
+        version = stated_version
+
+    transactions = TransactionColumns(version)
+    for position, activity in enumerate(activities):
+        transactions._add_activity(activity, position)  # pylint: disable=protected-access
+
+    if as_numpy:
+        return transactions.to_numpy()
+
+    return transactions
+
+
+class DatasetDiff(object):
+    """The differences between the activities or organisations within two copies of some IATI data.
+
+    Activities are matched by their `iati-identifier`, and organisations by their `organisation-identifier`. An activity has changed when its canonical form differs, so differences in whitespace, attribute order, comments or namespace prefixes alone are not changes.
+
+    Attributes:
+        added (list of str): The identifiers of activities that are only in the new data, in the order that they appear in it.
+        removed (list of str): The identifiers of activities that are only in the old data, in the order that they appear in it.
+        changed (list of str): The identifiers of activities that are in both, but differ, in the order that they appear in the new data.
+        unchanged (list of str): The identifiers of activities that are identical in both, in the order that they appear in the new data.
+
+    Note:
+        Where multiple activities share an identifier, they are compared as a group. The group has changed when any of its activities have changed, been added or been removed.
+
+        Activities without an identifier are grouped under the identifier None.
+
+    """
+
+    def __init__(self, added, removed, changed, unchanged):
+        """Initialise a DatasetDiff.
+
+        Args:
+            added (list of str): The identifiers of activities that are only in the new data.
+            removed (list of str): The identifiers of activities that are only in the old data.
+            changed (list of str): The identifiers of activities that are in both, but differ.
+            unchanged (list of str): The identifiers of activities that are identical in both.
+
+        """
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.unchanged = unchanged
+
+    def __bool__(self):
+        """Determine whether there are any differences."""
+        return bool(self.added or self.removed or self.changed)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        """Return a summary of the differences."""
+        return '<DatasetDiff: {0} added, {1} removed, {2} changed, {3} unchanged>'.format(len(self.added), len(self.removed), len(self.changed), len(self.unchanged))
+
+
+def diff(old, new, parser_profile='default'):
+    """Determine which activities or organisations have been added, removed or changed between two copies of some IATI data.
+
+    Each copy is streamed once. Only the identifier and a digest of each activity are retained, so memory use depends on the number of activities rather than the size of the data.
+
+    Args:
+        old (iati.Dataset or str or file or iterable): The earlier copy of the data. A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements. Files are streamed using `iter_activities()`.
+        new (iati.Dataset or str or file or iterable): The later copy of the data, in the same forms as `old`.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse files with. Defaults to 'default'.
+
+    Returns:
+        iati.data.DatasetDiff: The differences between the two copies.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: When a file does not contain valid XML.
+
+    Example:
+        To find the activities in a publisher's file that have changed since yesterday::
+
+            changes = iati.data.diff(yesterday_path, today_path)
+            for identifier in changes.added + changes.changed:
+                ...
+
+    """
+    old_digests = _digests_by_identifier(old, parser_profile)
+    new_digests = _digests_by_identifier(new, parser_profile)
+
+    added = list()
+    changed = list()
+    unchanged = list()
+    for identifier, digests in new_digests.items():
+        old_group = old_digests.pop(identifier, None)
+        if old_group is None:
+            added.append(identifier)
+        elif sorted(old_group) != sorted(digests):
+            changed.append(identifier)
+        else:
+            unchanged.append(identifier)
+
+    return DatasetDiff(added, list(old_digests.keys()), changed, unchanged)
+
+
+def activity_digest(element):
+    """Return a digest of the canonical form of an `iati-activity` or `iati-organisation` element.
+
+    Activities that differ only in formatting have the same digest, so it may be used to identify activities that are repeated, within or between files.
+
+    The canonical form is Exclusive XML Canonicalization without comments, of a copy of the element in which whitespace surrounding text has been removed. Attribute order, namespace prefixes that are not used, comments and whitespace between elements therefore do not affect the digest.
+
+    Args:
+        element (etree._Element): The element to digest.
+
+    Returns:
+        str: The SHA-256 digest, in hexadecimal.
+
+    Note:
+        Exclusive XML Canonicalization is used rather than C14N 2.0, which offers text stripping natively, since C14N 2.0 is not available in all supported versions of lxml.
+
+    """
+    canonical_element = copy.deepcopy(element)
+    for descendant in canonical_element.iter():
+        if descendant.text is not None:
+            descendant.text = descendant.text.strip() or None
+        if descendant.tail is not None:
+            descendant.tail = descendant.tail.strip() or None
+
+    return hashlib.sha256(etree.tostring(canonical_element, method='c14n', exclusive=True, with_comments=False)).hexdigest()
+
+
+def _digests_by_identifier(source, parser_profile):
+    """Stream the activities or organisations within some IATI data, determining the canonical digest of each.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with.
+
+    Returns:
+        collections.OrderedDict: Mapping the identifier of each activity to a list of the digests of the activities with that identifier, in document order.
+
+    """
+    activities, _ = _activity_stream(source, parser_profile)
+    digests = collections.OrderedDict()
+    for activity in activities:
+        digests.setdefault(_activity_identifier(activity), []).append(activity_digest(activity))
+
+    return digests
+
+
+def _activity_identifier(activity):
+    """Return the identifier of an activity or organisation.
+
+    Args:
+        activity (etree._Element): An `iati-activity` or `iati-organisation` element.
+
+    Returns:
+        str: The `iati-identifier` or `organisation-identifier`, with surrounding whitespace removed. None if there is neither.
+
+    """
+    identifier = activity.findtext('iati-identifier')
+    if identifier is None:
+        identifier = activity.findtext('organisation-identifier')
+    if identifier is not None:
+        return identifier.strip()
+
+    return None
+
+
+def _activity_stream(source, parser_profile='default'):
+    """Return the activities or organisations within a Dataset or a streamed file, along with the version that the data states it is at.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` or `iati-organisation` elements such as that returned by `iter_activities()`. Files are streamed using `iter_activities()`.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with. Defaults to 'default'.
+
+    Returns:
+        tuple: A tuple in the format: `(iterator, str)` - The iterator yields each `iati-activity` or `iati-organisation` element; The `str` is the version of the Standard that the data states it is at. The version is None when it could not be determined, which includes a file containing no activities or organisations.
+
+    """
+    if isinstance(source, Dataset):
+        return source.iter_activities(), source.version
+
+    if isinstance(source, six.string_types) or hasattr(source, 'read'):
+        activities = iter_activities(source, parser_profile)
+    else:
+        activities = iter(source)
+    first = next(activities, None)
+    if first is None:
+        stated_version = None
+    else:
+        # a detached element, or one that is the root of its document, may state its own version
+        parent = first.getparent()
+        stated_version = (first if parent is None else parent).get('version', '1.01').strip()
+
+    return _prepend(first, activities), stated_version
+
+
+def _prepend(first, iterator):
+    """Yield an item, unless it is None, followed by the items from an iterator.
+
+    Args:
+        first: The item to yield first.
+        iterator (iterator): The iterator to yield the remaining items from.
+
+    Yields:
+        The items.
+
+    """
+    if first is not None:
+        yield first
+    for item in iterator:
+        yield item
+
+
+def _freeze_lists(mapping):
+    """Convert the list values of a dictionary to tuples.
+
+    Args:
+        mapping (dict): A dictionary with list values.
+
+    Returns:
+        dict: A dictionary with the same keys, and the values as tuples.
+
+    """
+    return {key: tuple(value) for key, value in mapping.items()}
+
+
+def _ascii_compatible(encoding):
+    """Determine whether an encoding represents ASCII characters, including the newline, as the same single bytes as ASCII.
+
+    Args:
+        encoding (str or None): The name of an encoding, as reported by lxml.
+
+    Returns:
+        bool: Whether the encoding is known to be ASCII-compatible.
+
+    """
+    if not encoding:
+        return False
+    encoding = encoding.upper().replace('_', '-')
+
+    return encoding in ('UTF-8', 'UTF8', 'ASCII', 'US-ASCII') or encoding.startswith('ISO-8859-')
+
+
+def _offset_array():
+    """Return an empty array suitable for holding offsets into a large file.
+
+    Returns:
+        array.array: An array of unsigned integers of at least 64 bits where supported, otherwise of the largest unsigned type available.
+
+    """
+    try:
+        return array.array('Q')
+    except ValueError:  # Python v2 does not support 'Q'
+        return array.array('L')
+
+
+class _LineIndex(object):
+    """An index of the offset at which each line of some XML source starts, allowing any range of lines to be returned as a single slice.
+
+    Leading and trailing whitespace is excluded from the indexed lines, as it is from a string assigned to `Dataset.xml_str`.
+
+    Note:
+        Lines are 1-indexed, in line with the `sourceline` attribute of lxml elements.
+
+    """
+
+    __slots__ = ('_source', '_encoding', '_starts', '_end')
+
+    def __init__(self, source, encoding=None):
+        """Build an index of the lines in some source.
+
+        Args:
+            source (str or bytes or bytearray or mmap.mmap): The source to index.
+            encoding (str or None): The encoding of the source, if it is not text. Bytes in an encoding that is not ASCII-compatible are decoded as a whole before being indexed.
+
+        """
+        if isinstance(source, type(u'')):
+            encoding = None
+            newline = u'\n'
+        elif _ascii_compatible(encoding) and b'\x00' not in source[:4]:
+            # lxml reports a default of UTF-8 for documents that were detected as UTF-16 or UTF-32 from their first bytes
+            newline = b'\n'
+        else:
+            source = iati.utilities._decode(_buffer_to_bytes(source))  # pylint: disable=protected-access
+            encoding = None
+            newline = u'\n'
+
+        start = 0
+        end = len(source)
+        while start < end and source[start:start + 1].isspace():
+            start += 1
+        while end > start and source[end - 1:end].isspace():
+            end -= 1
+
+        starts = _offset_array()
+        starts.append(start)
+        position = source.find(newline, start, end)
+        while position != -1:
+            starts.append(position + 1)
+            position = source.find(newline, position + 1, end)
+
+        self._source = source
+        self._encoding = encoding
+        self._starts = starts
+        self._end = end
+
+    def __len__(self):
+        """Return the number of lines in the source."""
+        return len(self._starts)
+
+    def between(self, first, last):
+        """Return a range of lines from the source.
+
+        Args:
+            first (int): The 1-indexed number of the first line to return.
+            last (int): The 1-indexed number of the last line to return. If this is before `first`, nothing is returned.
+
+        Returns:
+            str: The requested lines, separated by newlines.
+
+        """
+        if last < first:
+            chunk = self._source[0:0]
+        else:
+            start = self._starts[first - 1]
+            end = self._starts[last] - 1 if last < len(self._starts) else self._end
+            chunk = self._source[start:end]
 
-        for line_num in range(lower_line_number, upper_line_number):
-            lines_arr.append(self._raw_source_at_line(line_num))
+        if self._encoding is not None:
+            return chunk.decode(self._encoding, 'replace')
 
-        return '\n'.join(lines_arr)
+        return chunk
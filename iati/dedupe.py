@@ -0,0 +1,133 @@
+"""A module containing a disk-backed index of activity digests, used to identify activities that are repeated across a corpus of IATI data.
+
+Example:
+    To export each distinct activity within a corpus of files once, skipping activities that have been seen before::
+
+        with iati.dedupe.DigestIndex('digests.sqlite') as index:
+            with open('activities.jsonl', 'w') as output:
+                for path in paths:
+                    iati.export.write_jsonl(index.filter(path), output)
+
+"""
+import sqlite3
+import six
+import iati.data
+
+
+class DigestIndex(object):
+    """An index of the digests of activities that have been seen, held in an SQLite database so that it may grow beyond the available memory and persist between runs.
+
+    Digests are given by `iati.data.activity_digest()`, so activities that differ only in formatting are treated as the same activity. The identifier of each activity and the source it was first seen in are recorded alongside its digest.
+
+    Attributes:
+        path (str): The path to the SQLite database. `:memory:` means that the index is held in memory.
+        commit_interval (int): The number of digests to add between each commit to the database.
+
+    Warning:
+        A DigestIndex must only be used by the thread that created it. Separate processes should use separate databases, or take care that only one writes at a time.
+
+    """
+
+    def __init__(self, path=':memory:', commit_interval=10000):
+        """Initialise a DigestIndex, creating the database if it does not already exist.
+
+        Args:
+            path (str): The path to the SQLite database. Defaults to `:memory:`, meaning that the index is held in memory.
+            commit_interval (int): The number of digests to add between each commit to the database. Defaults to 10000.
+
+        """
+        self.path = path
+        self.commit_interval = commit_interval
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS digests (digest TEXT PRIMARY KEY, identifier TEXT, source TEXT)')
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def __contains__(self, digest):
+        """Determine whether a digest is in the index."""
+        return self._connection.execute('SELECT 1 FROM digests WHERE digest = ?', (digest,)).fetchone() is not None
+
+    def __enter__(self):
+        """Return the index for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Commit any uncommitted digests, then close the database."""
+        self.close()
+
+    def __len__(self):
+        """Return the number of digests in the index."""
+        return self._connection.execute('SELECT COUNT(*) FROM digests').fetchone()[0]
+
+    def add(self, digest, identifier=None, source=None):
+        """Add a digest to the index, unless it is already there.
+
+        Args:
+            digest (str): The digest of an activity.
+            identifier (str): The identifier of the activity. Defaults to None.
+            source (str): A description of where the activity was found, such as the path to a file. Defaults to None.
+
+        Returns:
+            bool: Whether the digest was added. False when the digest was already in the index.
+
+        """
+        cursor = self._connection.execute('INSERT OR IGNORE INTO digests (digest, identifier, source) VALUES (?, ?, ?)', (digest, identifier, source))
+        added = cursor.rowcount == 1
+
+        if added:
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_interval:
+                self.commit()
+
+        return added
+
+    def close(self):
+        """Commit any uncommitted digests, then close the database."""
+        self.commit()
+        self._connection.close()
+
+    def commit(self):
+        """Commit any uncommitted digests to the database."""
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def filter(self, source, parser_profile='default', source_name=None):
+        """Stream the activities or organisations within some IATI data that are not in the index, adding each to the index.
+
+        Args:
+            source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` or `iati-organisation` elements. Files are streamed using `iati.data.iter_activities()`.
+            parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with. Defaults to 'default'.
+            source_name (str): A description of the source to record against each added digest. Defaults to None, meaning the path when `source` is a path.
+
+        Yields:
+            etree._Element: Each `iati-activity` or `iati-organisation` element whose digest was not already in the index, in document order. Elements that are repeated within the source are only yielded the first time.
+
+        Note:
+            The elements that are yielded may be passed to functions such as `iati.export.write_csv()` and `iati.data.diff()`, so that repeated activities are skipped.
+
+        """
+        if source_name is None and isinstance(source, six.string_types):
+            source_name = source
+
+        activities, _ = iati.data._activity_stream(source, parser_profile)  # pylint: disable=protected-access
+        for activity in activities:
+            identifier = iati.data._activity_identifier(activity)  # pylint: disable=protected-access
+            if self.add(iati.data.activity_digest(activity), identifier, source_name):
+                yield activity
+
+    def first_seen(self, digest):
+        """Return where an activity was first seen.
+
+        Args:
+            digest (str): The digest of the activity.
+
+        Returns:
+            tuple: A tuple in the format: `(str, str)` - The identifier of the activity; The source it was first seen in. None if the digest is not in the index.
+
+        """
+        row = self._connection.execute('SELECT identifier, source FROM digests WHERE digest = ?', (digest,)).fetchone()
+        if row is None:
+            return None
+
+        return tuple(row)
@@ -7,10 +7,21 @@ Todo:
     Implement more than Codelists.
 """
 
+import gc
+import hashlib
 import json
+import multiprocessing
 import os
+import sys
+import timeit
 from collections import defaultdict
 from copy import deepcopy
+from multiprocessing.pool import ThreadPool
+try:
+    import cPickle as pickle  # Python 2
+except ImportError:
+    import pickle
+import iati.cache
 import iati.codelists
 import iati.constants
 import iati.resources
@@ -39,27 +50,79 @@ def get_default_version_if_none(version):
     return version
 
 
-_CODELISTS = defaultdict(dict)
-"""A cache of loaded Codelists.
+_SNAPSHOT_FORMAT = 4
+"""The version of the snapshot file format. Snapshots in any other format are ignored."""
 
-This removes the need to repeatedly load a Codelist from disk each time it is accessed.
+
+_SNAPSHOT = {'loaded': False, 'entries': {}}
+"""The contents of the prebuilt snapshot of default SSOT content.
+
+The snapshot is read from disk the first time any default data is requested. Each entry is kept as pickled bytes and only unpickled when requested, so that each call returns an independent object and content for unused versions is never unpickled.
 
 The dictionary is structured as:
 
 {
-    "version_number_a": {
-        "codelist_name_1": iati.Codelist(codelist_1),
-        "codelist_name_2": iati.Codelist(codelist_2)
-        [...]
-    },
-    "version_number_b": {
+    "loaded": bool,
+    "entries": {
+        ("codelists", "version_number_a"): bytes,
+        ("codelists_non_embedded",): bytes,
+        ("codelist_mapping", "version_number_a"): bytes,
+        ("ruleset", "version_number_a"): bytes,
+        ("ruleset_schema", "version_number_a"): bytes,
+        ("schema", "version_number_a", "iati-activities"): bytes,
         [...]
-    },
+    }
+}
+
+"""
+
+
+def _snapshot_entry(*key):
+    """Return the snapshot entry with the specified key.
+
+    Args:
+        *key: The components of the key for the entry, such as `('ruleset', '2.03')`.
+
+    Returns:
+        object or None: The unpickled entry. None if there is no snapshot or the snapshot does not contain the entry.
+
+    """
+    if not _SNAPSHOT['loaded']:
+        load_snapshot()
+
+    try:
+        return pickle.loads(_SNAPSHOT['entries'][key])
+    except KeyError:
+        return None
+
+
+_CODELISTS = iati.cache.Cache('codelists')
+"""A cache of loaded Codelists.
+
+This removes the need to repeatedly load a Codelist from disk each time it is accessed.
+
+Keys are versions of the Standard. Each value is a dictionary structured as:
+
+{
+    "codelist_name_1": iati.codelists.FrozenCodelist(codelist_1),
+    "codelist_name_2": iati.codelists.FrozenCodelist(codelist_2)
     [...]
 }
 
-Warning:
-    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, it is highly recommended to perform a `deepcopy()` on any accessed Codelist before it is modified in any way.
+Note:
+    The cached Codelists are immutable, so may be returned by reference. Use `mutable_copy()` or `deepcopy()` to obtain a Codelist that can be modified.
+
+    Non-Embedded Codelists within the cache for each version are the same objects as those in `_CODELISTS_NON_EMBEDDED`.
+
+"""
+
+
+_CODELISTS_NON_EMBEDDED = iati.cache.Cache('codelists_non_embedded')
+"""A cache of loaded Non-Embedded Codelists.
+
+Non-Embedded Codelists are the same at every version of the Standard, so are loaded once and shared between versions.
+
+Keys are Codelist names. Values are iati.codelists.FrozenCodelist() instances.
 
 """
 
@@ -76,7 +139,10 @@ def codelist(name, version=None):
         ValueError: When a specified version is not a valid version of the Standard.
 
     Returns:
-        iati.Codelist: A Codelist with the specified name from the specified version of the Standard. It is populated with all the Codes on the Codelist.
+        iati.codelists.FrozenCodelist: A Codelist with the specified name from the specified version of the Standard. It is populated with all the Codes on the Codelist.
+
+    Note:
+        The returned Codelist is immutable and is shared with all other users of the default Codelist. Use `mutable_copy()` or `deepcopy()` to obtain a Codelist that can be modified.
 
     Warning:
         A name may not be sufficient to act as a UID.
@@ -90,8 +156,7 @@ def codelist(name, version=None):
 
     """
     try:
-        codelist_found = _codelists(version, True)[name]
-        return deepcopy(codelist_found)
+        return _codelists(version, True)[name]
     except (KeyError, TypeError):
         msg = "There is no default Codelist in version {0} of the Standard with the name {1}.".format(version, name)
         iati.utilities.log_warning(msg)
@@ -103,17 +168,16 @@ def _codelists(version=None, use_cache=False):
 
     Args:
         version (str): The version of the Standard to return the Codelists for. Defaults to None. This means that the latest version of the Codelists are returned.
-        use_cache (bool): Whether the cache should be used rather than loading the Codelists from disk again. If used, a `deepcopy()` should be performed on any returned Codelist before it is modified.
+        use_cache (bool): Whether the cache should be used rather than loading the Codelists from disk again. If used, the returned dictionary must not be modified.
 
     Raises:
         ValueError: When a specified version is not a valid version of the IATI Standard.
 
     Returns:
-        dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are iati.Codelist() instances.
+        dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are iati.codelists.FrozenCodelist() instances.
 
     Warning:
-        Setting `use_cache` to `True` is dangerous since it does not return a deep copy of the Codelists. This means that modification of a returned Codelist will modify the Codelist everywhere.
-        A `deepcopy()` should be performed on any returned value before it is modified.
+        The returned dictionary is the one held in the cache. Adding or removing entries from it will modify the cache everywhere.
 
     Note:
         This is a private function so as to prevent the (dangerous) `use_cache` parameter being part of the public API.
@@ -121,17 +185,103 @@ def _codelists(version=None, use_cache=False):
     """
     version = get_default_version_if_none(version)
 
-    paths = iati.resources.get_codelist_paths(version)
+    if use_cache:
+        return _CODELISTS.get_or_load(version, lambda: _load_codelists(version, True))
+
+    codelists_found = _load_codelists(version, False)
+    _CODELISTS.set(version, codelists_found)
+
+    return codelists_found
+
+
+def _load_codelists(version, use_cache):
+    """Load the default Codelists for the specified version of the Standard from the snapshot, or from disk if there is no snapshot.
 
-    for path in paths:
+    Args:
+        version (str): The version of the Standard to load the Codelists for.
+        use_cache (bool): Whether cached Non-Embedded Codelists may be used.
+
+    Returns:
+        dict: A dictionary containing all the Codelists at the specified version of the Standard, as detailed in `_codelists()`.
+
+    """
+    snapshot_content = _snapshot_entry('codelists', version)
+    if snapshot_content is not None:
+        codelists_found, non_embedded_names = snapshot_content
+        for name in non_embedded_names:
+            codelists_found[name] = _non_embedded_codelist(name, iati.resources.create_codelist_path(name, version), use_cache)
+        return codelists_found
+
+    codelists_found = dict()
+    for path in iati.resources.get_codelist_paths(version):
         _, filename = os.path.split(path)
         name = filename[:-len(iati.resources.FILE_CODELIST_EXTENSION)]  # Get the name of the codelist, without the '.xml' file extension
-        if (name not in _CODELISTS[version].keys()) or not use_cache:
-            xml_str = iati.utilities.load_as_string(path)
-            codelist_found = iati.Codelist(name, xml=xml_str)
-            _CODELISTS[version][name] = codelist_found
+        if iati.resources.is_non_embedded_codelist_path(path):
+            codelists_found[name] = _non_embedded_codelist(name, path, use_cache)
+        else:
+            codelists_found[name] = _load_codelist(name, path)
 
-    return _CODELISTS[version]
+    return codelists_found
+
+
+def _non_embedded_codelist(name, path, use_cache):
+    """Locate the Non-Embedded Codelist with the specified name.
+
+    Args:
+        name (str): The name of the Codelist.
+        path (str): The path to the file containing the Codelist at any version of the Standard.
+        use_cache (bool): Whether the cache should be used rather than loading the Codelist again.
+
+    Returns:
+        iati.codelists.FrozenCodelist: The Non-Embedded Codelist with the specified name.
+
+    """
+    if use_cache:
+        return _CODELISTS_NON_EMBEDDED.get_or_load(name, lambda: _load_non_embedded_codelist(name, path))
+
+    codelist_found = _load_non_embedded_codelist(name, path)
+    _CODELISTS_NON_EMBEDDED.set(name, codelist_found)
+
+    return codelist_found
+
+
+def _load_non_embedded_codelist(name, path):
+    """Load the Non-Embedded Codelist with the specified name from the snapshot, or from disk if there is no snapshot.
+
+    When loaded from the snapshot, all other Non-Embedded Codelists that are not yet cached are added to the cache at the same time, since they are unpickled together.
+
+    Args:
+        name (str): The name of the Codelist.
+        path (str): The path to the file containing the Codelist.
+
+    Returns:
+        iati.codelists.FrozenCodelist: The Non-Embedded Codelist with the specified name.
+
+    """
+    snapshot_codelists = _snapshot_entry('codelists_non_embedded')
+    if snapshot_codelists is not None and name in snapshot_codelists:
+        for other_name, other_codelist in snapshot_codelists.items():
+            if other_name != name:
+                _CODELISTS_NON_EMBEDDED.setdefault(other_name, other_codelist)
+        return snapshot_codelists[name]
+
+    return _load_codelist(name, path)
+
+
+def _load_codelist(name, path):
+    """Load the Codelist at the specified path from disk.
+
+    Args:
+        name (str): The name of the Codelist.
+        path (str): The path to the file containing the Codelist.
+
+    Returns:
+        iati.codelists.FrozenCodelist: The Codelist at the specified path.
+
+    """
+    xml_str = iati.utilities.load_as_string(path)
+
+    return iati.codelists.FrozenCodelist(name, xml=xml_str)
 
 
 def codelists(version=None):
@@ -144,10 +294,24 @@ def codelists(version=None):
         ValueError: When a specified version is not a valid version of the IATI Standard.
 
     Returns:
-        dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are iati.Codelist() instances, populated with the relevant Codes.
+        dict: A dictionary containing all the Codelists at the specified version of the Standard. All Non-Embedded Codelists are included. Keys are Codelist names. Values are iati.codelists.FrozenCodelist() instances, populated with the relevant Codes.
+
+    Note:
+        The dictionary is new on each call, but the Codelists within it are immutable and shared with all other users of the default Codelists. Use `mutable_copy()` or `deepcopy()` to obtain a Codelist that can be modified.
 
     """
-    return _codelists(version)
+    return dict(_codelists(version, True))
+
+
+_CODELIST_MAPPINGS = iati.cache.Cache('codelist_mappings')
+"""A cache of loaded Codelist mappings.
+
+Keys are versions of the Standard. Values are mappings, as detailed in `codelist_mapping()`.
+
+Warning:
+    Modifying values directly obtained from this cache will modify the mapping everywhere. As such, the public function returns a `deepcopy()`.
+
+"""
 
 
 def codelist_mapping(version=None):
@@ -166,6 +330,48 @@ def codelist_mapping(version=None):
         Make use of the `version` parameter.
 
     """
+    return deepcopy(_codelist_mapping(version, True))
+
+
+def _codelist_mapping(version=None, use_cache=False):
+    """Locate the Codelist mapping for the specified version of the Standard.
+
+    Args:
+        version (str): The version of the Standard to return the mapping file for. Defaults to None. This means that the mapping file is returned for the latest version of the Standard.
+        use_cache (bool): Whether the cache should be used rather than loading the mapping again. If used, the returned mapping must not be modified.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+
+    Returns:
+        dict of dict: A dictionary containing mapping information, as detailed in `codelist_mapping()`.
+
+    """
+    version = get_default_version_if_none(version)
+
+    if use_cache:
+        return _CODELIST_MAPPINGS.get_or_load(version, lambda: _load_codelist_mapping(version))
+
+    mappings = _load_codelist_mapping(version)
+    _CODELIST_MAPPINGS.set(version, mappings)
+
+    return mappings
+
+
+def _load_codelist_mapping(version):
+    """Load the Codelist mapping for the specified version of the Standard from the snapshot, or from disk if there is no snapshot.
+
+    Args:
+        version (str): The version of the Standard to load the mapping for.
+
+    Returns:
+        dict of dict: A dictionary containing mapping information, as detailed in `codelist_mapping()`.
+
+    """
+    mappings = _snapshot_entry('codelist_mapping', version)
+    if mappings is not None:
+        return mappings
+
     path = iati.resources.create_codelist_mapping_path(version)
     mapping_tree = iati.utilities.load_as_tree(path)
     mappings = defaultdict(list)
@@ -187,6 +393,17 @@ def codelist_mapping(version=None):
     return mappings
 
 
+_RULESETS = iati.cache.Cache('rulesets')
+"""A cache of loaded Standard Rulesets.
+
+Keys are versions of the Standard. Values are iati.Ruleset() instances.
+
+Warning:
+    Modifying values directly obtained from this cache will modify the Ruleset everywhere, including within default Schemas. As such, the public function returns a `deepcopy()`.
+
+"""
+
+
 def ruleset(version=None):
     """Return the Standard Ruleset for the specified version of the Standard.
 
@@ -200,6 +417,48 @@ def ruleset(version=None):
         iati.Ruleset: The default Ruleset for the specified version of the Standard.
 
     """
+    return deepcopy(_ruleset(version, True))
+
+
+def _ruleset(version=None, use_cache=False):
+    """Locate the Standard Ruleset for the specified version of the Standard.
+
+    Args:
+        version (str): The version of the Standard to return the Ruleset for. Defaults to None. This means that the latest Standard Ruleset is returned.
+        use_cache (bool): Whether the cache should be used rather than loading the Ruleset again. If used, the returned Ruleset must not be modified.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+
+    Returns:
+        iati.Ruleset: The default Ruleset for the specified version of the Standard.
+
+    """
+    version = get_default_version_if_none(version)
+
+    if use_cache:
+        return _RULESETS.get_or_load(version, lambda: _load_ruleset(version))
+
+    ruleset_found = _load_ruleset(version)
+    _RULESETS.set(version, ruleset_found)
+
+    return ruleset_found
+
+
+def _load_ruleset(version):
+    """Load the Standard Ruleset for the specified version of the Standard from the snapshot, or from disk if there is no snapshot.
+
+    Args:
+        version (str): The version of the Standard to load the Ruleset for.
+
+    Returns:
+        iati.Ruleset: The default Ruleset for the specified version of the Standard.
+
+    """
+    ruleset_found = _snapshot_entry('ruleset', version)
+    if ruleset_found is not None:
+        return ruleset_found
+
     path = iati.resources.get_ruleset_paths(version)[0]
     ruleset_str = iati.utilities.load_as_string(path)
 
@@ -219,36 +478,27 @@ def ruleset_schema(version=None):
         dict: A dictionary representing the Ruleset schema for the specified version of the Standard.
 
     """
+    version = get_default_version_if_none(version)
+
+    schema_found = _snapshot_entry('ruleset_schema', version)
+    if schema_found is not None:
+        return schema_found
+
     path = iati.resources.create_ruleset_path(iati.resources.FILE_RULESET_SCHEMA_NAME, version)
     schema_str = iati.utilities.load_as_string(path)
 
     return json.loads(schema_str)
 
 
-_SCHEMAS = defaultdict(lambda: defaultdict(dict))
+_SCHEMAS = iati.cache.Cache('schemas')
 """A cache of loaded Schemas.
 
 This removes the need to repeatedly load a Schema from disk each time it is accessed.
 
-{
-    "version_number_a": {
-        "populated": {
-            "iati-activities": iati.ActivitySchema
-            "iati-organisations": iati.OrganisationSchema
-        },
-        "unpopulated": {
-            "iati-activities": iati.ActivitySchema
-            "iati-organisations": iati.OrganisationSchema
-        },
-    },
-    "version_number_b": {
-        [...]
-    },
-    [...]
-}
+Keys are tuples in the format `(version, population_key, root_element_name)`, for example `("2.02", "populated", "iati-activities")`. The population key is either "populated" or "unpopulated". Values are iati.ActivitySchema() or iati.OrganisationSchema() instances.
 
 Warning:
-    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, it is highly recommended to perform a `deepcopy()` on any accessed Schema before it is modified in any way.
+    Modifying values directly obtained from this cache can potentially cause unexpected behavior. As such, the public functions return a `copy()` of any cached Schema, which shares the parsed XSD and compiled validator with the cached Schema until it is modified.
 
 """
 
@@ -275,7 +525,7 @@ def _populate_schema(schema, version=None):
     for codelist_to_add in codelists_to_add.values():
         schema.codelists.add(codelist_to_add)
 
-    schema.rulesets.add(ruleset(version))
+    schema.rulesets.add(_ruleset(version, True))
 
     return schema
 
@@ -288,7 +538,7 @@ def _schema(path_func, schema_class, version=None, populate=True, use_cache=Fals
         schema_class (type): A class definition for the Schema of interest.
         version (str): The version of the Standard to return the Schema for. Defaults to None. This means that the latest version of the Schema is returned.
         populate (bool): Whether the Schema should be populated with auxilliary information such as Codelists and Rulesets.
-        use_cache (bool): Whether the cache should be used rather than loading the Schema from disk again. If used, a `deepcopy()` should be performed on any returned Schema before it is modified.
+        use_cache (bool): Whether the cache should be used rather than loading the Schema from disk again. If used, a `copy()` should be taken of any returned Schema before it is modified.
 
     Raises:
         ValueError: When a specified version is not a valid version of the IATI Standard.
@@ -301,15 +551,46 @@ def _schema(path_func, schema_class, version=None, populate=True, use_cache=Fals
 
     version = get_default_version_if_none(version)
 
-    schema_paths = path_func(version)
+    cache_key = (version, population_key, schema_class.ROOT_ELEMENT_NAME)
+
+    if use_cache:
+        return _SCHEMAS.get_or_load(cache_key, lambda: _load_schema(path_func, schema_class, version, populate, True))
+
+    schema = _load_schema(path_func, schema_class, version, populate, False)
+    _SCHEMAS.set(cache_key, schema)
+
+    return schema
+
+
+def _load_schema(path_func, schema_class, version, populate, use_cache):
+    """Load the default Schema of the specified type for the specified version of the Standard.
 
-    if (schema_class.ROOT_ELEMENT_NAME not in _SCHEMAS[version][population_key].keys()) or not use_cache:
-        schema = schema_class(schema_paths[0])
-        if populate:
-            schema = _populate_schema(schema, version)
-        _SCHEMAS[version][population_key][schema_class.ROOT_ELEMENT_NAME] = schema
+    Args:
+        path_func (func): A function to return the paths at which the relevant Schema can be found.
+        schema_class (type): A class definition for the Schema of interest.
+        version (str): The version of the Standard to load the Schema for.
+        populate (bool): Whether the Schema should be populated with auxilliary information such as Codelists and Rulesets.
+        use_cache (bool): Whether a populated Schema may be derived from the cached unpopulated Schema.
 
-    return _SCHEMAS[version][population_key][schema_class.ROOT_ELEMENT_NAME]
+    Returns:
+        iati.Schema: An instantiated IATI Schema for the specified version.
+
+    """
+    if populate and use_cache:
+        # share the parsed XSD and compiled validator with the cached unpopulated Schema
+        schema = _schema(path_func, schema_class, version, False, True).copy()
+    else:
+        schema_path = path_func(version)[0]
+        schema_source = _snapshot_entry('schema', version, schema_class.ROOT_ELEMENT_NAME)
+        if schema_source is not None:
+            schema = schema_class._from_source(schema_path, schema_source)  # pylint: disable=protected-access
+        else:
+            schema = schema_class(schema_path)
+
+    if populate:
+        schema = _populate_schema(schema, version)
+
+    return schema
 
 
 def activity_schema(version=None, populate=True):
@@ -325,8 +606,11 @@ def activity_schema(version=None, populate=True):
     Returns:
         iati.ActivitySchema: An instantiated IATI Schema for the specified version of the Standard.
 
+    Note:
+        The Schema is loaded once, then a `copy()` of it is returned on each call. Codelists and Rulesets may be added to or removed from the copy without affecting the default Schema. Each copy is given its own copies of the contained Rulesets, so they may also be modified.
+
     """
-    return _schema(iati.resources.get_activity_schema_paths, iati.ActivitySchema, version, populate)
+    return _schema_copy(_schema(iati.resources.get_activity_schema_paths, iati.ActivitySchema, version, populate, True))
 
 
 def organisation_schema(version=None, populate=True):
@@ -342,5 +626,444 @@ def organisation_schema(version=None, populate=True):
     Returns:
         iati.OrganisationSchema: An instantiated IATI Schema for the specified version of the Standard.
 
+    Note:
+        The Schema is loaded once, then a `copy()` of it is returned on each call. Codelists and Rulesets may be added to or removed from the copy without affecting the default Schema. Each copy is given its own copies of the contained Rulesets, so they may also be modified.
+
+    """
+    return _schema_copy(_schema(iati.resources.get_organisation_schema_paths, iati.OrganisationSchema, version, populate, True))
+
+
+def _schema_copy(schema):
+    """Return a copy of a cached Schema that may be modified without affecting the cache.
+
+    Args:
+        schema (iati.Schema): A Schema from the cache.
+
+    Returns:
+        iati.Schema: A `copy()` of the Schema, containing copies of its Rulesets. These would otherwise be the cached Rulesets that are shared by every default Schema and ValidationPlan.
+
     """
-    return _schema(iati.resources.get_organisation_schema_paths, iati.OrganisationSchema, version, populate)
+    schema_copy = schema.copy()
+    schema_copy.rulesets = set(deepcopy(ruleset) for ruleset in schema.rulesets)
+
+    return schema_copy
+
+
+_VALIDATION_PLANS = iati.cache.Cache('validation_plans')
+"""A cache of ValidationPlans compiled from populated default Schemas.
+
+Keys are tuples in the format `(version, root_element_name)`, for example `("2.02", "iati-activities")`. Values are iati.validator.ValidationPlan() instances.
+
+"""
+
+
+def _validation_plan(path_func, schema_class, version=None):
+    """Return a ValidationPlan compiled from the populated default Schema of the specified type for the specified version of the Standard.
+
+    Args:
+        path_func (func): A function to return the paths at which the relevant Schema can be found.
+        schema_class (type): A class definition for the Schema of interest.
+        version (str): The version of the Standard to return the plan for. Defaults to None. This means that the latest version of the Standard is assumed.
+
+    Returns:
+        iati.validator.ValidationPlan: A plan for validating against the populated default Schema.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+        iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+    """
+    version = get_default_version_if_none(version)
+
+    return _VALIDATION_PLANS.get_or_load((version, schema_class.ROOT_ELEMENT_NAME), lambda: _schema(path_func, schema_class, version, True, True).compile())
+
+
+def activity_validation_plan(version=None):
+    """Return a ValidationPlan for the populated default Activity Schema for the specified version of the Standard.
+
+    Args:
+        version (str): The version of the Standard to return the plan for. Defaults to None. This means that the latest version of the Standard is assumed.
+
+    Returns:
+        iati.validator.ValidationPlan: A plan for validating against the populated default Activity Schema.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+        iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+    Note:
+        The plan is compiled once, then shared between all callers. It cannot be modified.
+
+    """
+    return _validation_plan(iati.resources.get_activity_schema_paths, iati.ActivitySchema, version)
+
+
+def organisation_validation_plan(version=None):
+    """Return a ValidationPlan for the populated default Organisation Schema for the specified version of the Standard.
+
+    Args:
+        version (str): The version of the Standard to return the plan for. Defaults to None. This means that the latest version of the Standard is assumed.
+
+    Returns:
+        iati.validator.ValidationPlan: A plan for validating against the populated default Organisation Schema.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+        iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+    Note:
+        The plan is compiled once, then shared between all callers. It cannot be modified.
+
+    """
+    return _validation_plan(iati.resources.get_organisation_schema_paths, iati.OrganisationSchema, version)
+
+
+WARM_KINDS = ['codelists', 'codelist_mapping', 'ruleset', 'activity_schema', 'organisation_schema']
+"""The kinds of default data that may be preloaded by `warm()`.
+
+The Schema kinds are populated Schemas, including their compiled validators.
+
+"""
+
+
+def _warm_one(kind, version):
+    """Load one kind of default data at the specified version of the Standard into the relevant cache.
+
+    Args:
+        kind (str): The kind of default data to load. One of `WARM_KINDS`.
+        version (str): The version of the Standard to load the data for.
+
+    Returns:
+        tuple: In the format `(kind, version, seconds, error)`. `seconds` is the time taken to load the data. `error` is the Exception that occurred during loading, or None if loading succeeded.
+
+    """
+    start = timeit.default_timer()
+    try:
+        if kind == 'codelists':
+            _codelists(version, True)
+        elif kind == 'codelist_mapping':
+            _codelist_mapping(version, True)
+        elif kind == 'ruleset':
+            _ruleset(version, True)
+        elif kind == 'activity_schema':
+            _schema(iati.resources.get_activity_schema_paths, iati.ActivitySchema, version, True, True).validator()
+        elif kind == 'organisation_schema':
+            _schema(iati.resources.get_organisation_schema_paths, iati.OrganisationSchema, version, True, True).validator()
+    except Exception as err:  # pylint: disable=broad-except
+        iati.utilities.log_warning('Failed to warm {0} at version {1} of the Standard: {2}'.format(kind, version, err))
+        return (kind, version, timeit.default_timer() - start, err)
+
+    return (kind, version, timeit.default_timer() - start, None)
+
+
+def warm(versions=None, kinds=None, processes=None):
+    """Preload default data into the caches used by this module, so that later requests for it are quick.
+
+    Loading is performed concurrently in a pool of threads. Much of the work is performed by lxml, which releases the GIL while parsing.
+
+    Args:
+        versions (list of str): The versions of the Standard to load data for. Defaults to None. This means that data is loaded for all supported versions of the Standard.
+        kinds (list of str): The kinds of data to load, from `WARM_KINDS`. Defaults to None. This means that all kinds of data are loaded.
+        processes (int): The number of threads to load data with. Defaults to None. This means that the number of CPUs is used.
+
+    Returns:
+        dict: Details of what was loaded. Structured as:
+
+        {
+            "loaded": {(kind, version): seconds, [...]},
+            "failed": {(kind, version): Exception, [...]},
+            "seconds": float
+        }
+
+        `seconds` within `loaded` is the time taken to load each item. The top-level `seconds` is the total elapsed time.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+        ValueError: When a specified kind is not in `WARM_KINDS`.
+
+    Note:
+        Codelists, Codelist mappings and Rulesets are loaded before Schemas, since populating a Schema requires them.
+
+    Example:
+        To load everything at the latest version of the Standard before forking worker processes::
+
+            report = iati.default.warm([iati.constants.STANDARD_VERSION_LATEST])
+
+    """
+    versions = iati.constants.STANDARD_VERSIONS if versions is None else [get_default_version_if_none(version) for version in versions]
+    kinds = WARM_KINDS if kinds is None else kinds
+    for kind in kinds:
+        if kind not in WARM_KINDS:
+            raise ValueError('{0} is not a kind of default data that can be warmed. Valid kinds are: {1}'.format(kind, ', '.join(WARM_KINDS)))
+
+    schema_kinds = ['activity_schema', 'organisation_schema']
+    stages = [
+        [(kind, version) for version in versions for kind in kinds if kind not in schema_kinds],
+        [(kind, version) for version in versions for kind in kinds if kind in schema_kinds]
+    ]
+
+    report = {'loaded': {}, 'failed': {}}
+    start = timeit.default_timer()
+    pool = ThreadPool(processes)
+    try:
+        for stage in stages:
+            for kind, version, seconds, error in pool.map(lambda task: _warm_one(*task), stage):
+                if error is None:
+                    report['loaded'][(kind, version)] = seconds
+                else:
+                    report['failed'][(kind, version)] = error
+    finally:
+        pool.close()
+        pool.join()
+    report['seconds'] = timeit.default_timer() - start
+
+    return report
+
+
+def worker_pool(processes=None, versions=None, kinds=None, initializer=None, initargs=()):
+    """Create a pool of worker processes that share default data which has been loaded by the current process.
+
+    Default data is warmed in the current process before the workers are forked. Each worker therefore starts with populated caches, with memory pages shared copy-on-write between all processes rather than each worker loading its own copy.
+
+    Where supported (Python 3.7+), loaded objects are moved out of the reach of the garbage collector with `gc.freeze()` while forking. This stops collections within workers from writing to, and so copying, the pages holding shared data.
+
+    Args:
+        processes (int): The number of worker processes to create. Defaults to None. This means that the number of CPUs is used.
+        versions (list of str): The versions of the Standard to warm data for. Defaults to None. This means that data is warmed for all supported versions of the Standard.
+        kinds (list of str): The kinds of data to warm, from `WARM_KINDS`. Defaults to None. This means that all kinds of data are warmed.
+        initializer (func): A function to call in each worker when it starts. Defaults to None.
+        initargs (tuple): Arguments to pass to `initializer`. Defaults to an empty tuple.
+
+    Returns:
+        multiprocessing.pool.Pool: A pool of worker processes. The caller is responsible for closing it.
+
+    Raises:
+        ValueError: When a specified version is not a valid version of the IATI Standard.
+        ValueError: When a specified kind is not in `WARM_KINDS`.
+
+    Warning:
+        Sharing only occurs where processes are started by forking. On platforms that do not support this, such as Windows, each worker loads data as it is requested.
+
+        Workers that replace those which have exited are forked without `gc.freeze()`, so do not benefit from reduced copying.
+
+    Example:
+        To validate many files in parallel against the latest version of the Standard::
+
+            pool = iati.default.worker_pool(versions=[iati.constants.STANDARD_VERSION_LATEST])
+            try:
+                results = pool.map(validate_file, paths)
+            finally:
+                pool.close()
+                pool.join()
+
+    """
+    warm(versions, kinds)
+
+    # move everything that has been loaded into a generation which the garbage collector ignores, so that workers do not touch it
+    can_freeze = hasattr(gc, 'freeze')
+    gc.collect()
+    if can_freeze:
+        gc.freeze()
+    try:
+        pool = _fork_context().Pool(processes, initializer, initargs)
+    finally:
+        if can_freeze:
+            # the workers keep their frozen copy, while the current process returns to normal collection
+            gc.unfreeze()
+
+    return pool
+
+
+def _fork_context():
+    """Return a multiprocessing context which starts processes by forking, where available.
+
+    Returns:
+        module or multiprocessing.context.BaseContext: An object with a `Pool` attribute. This is the fork context where available, or the default context otherwise.
+
+    """
+    try:
+        if 'fork' in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context('fork')
+    except AttributeError:  # Python 2 has no contexts, but always forks on platforms that support it
+        pass
+
+    return multiprocessing
+
+
+def _caches():
+    """Return the caches of default data.
+
+    Returns:
+        list of iati.cache.Cache: The caches of default data.
+
+    """
+    return [_CODELISTS, _CODELISTS_NON_EMBEDDED, _CODELIST_MAPPINGS, _RULESETS, _SCHEMAS, _VALIDATION_PLANS]
+
+
+def cache_stats():
+    """Return statistics about the use of the caches of default data.
+
+    Returns:
+        dict: Keys are the names of caches. Values are statistics, as detailed in `iati.cache.Cache.stats()`.
+
+    """
+    return {cache.name: cache.stats() for cache in _caches()}
+
+
+def clear_caches():
+    """Remove all default data from the caches, so that it is loaded again when next requested."""
+    for cache in _caches():
+        cache.clear()
+
+
+def configure_cache(name, max_entries=None, max_size=None, sizeof=None):
+    """Limit the amount of default data that is cached.
+
+    When a limit is exceeded, the least recently used data is evicted from the cache. It is loaded again when next requested.
+
+    Args:
+        name (str): The name of the cache to configure. One of `codelists`, `codelists_non_embedded`, `codelist_mappings`, `rulesets`, `schemas` or `validation_plans`.
+        max_entries (int or None): The maximum number of entries to hold. Defaults to None, meaning that the number of entries is unlimited.
+        max_size (int or None): The maximum total size of the entries to hold, as measured by `sizeof`. Defaults to None, meaning that the total size is unlimited.
+        sizeof (func): A function that returns the size of a cached value, such as an estimate of the memory it uses. Defaults to None, meaning that the current function is retained. Initially, each value has a size of 1.
+
+    Raises:
+        ValueError: When there is no cache with the specified name.
+
+    Example:
+        To hold the Schemas for at most two versions of the Standard, each of which has two populated and two unpopulated Schemas::
+
+            iati.default.configure_cache('schemas', max_entries=8)
+
+    """
+    for cache in _caches():
+        if cache.name == name:
+            cache.configure(max_entries, max_size, sizeof)
+            return
+
+    raise ValueError('There is no cache of default data called {0}.'.format(name))
+
+
+def load_snapshot(path=None):
+    """Load a prebuilt snapshot of the default SSOT content, to be used in place of the SSOT files.
+
+    This is performed automatically the first time that default data is requested. It only needs to be called directly to load a snapshot from a non-default location.
+
+    Args:
+        path (str): The path to the snapshot file. Defaults to None. This means that the snapshot within the library data folder is loaded.
+
+    Returns:
+        bool: Whether a snapshot was loaded. If not, default data is loaded from the individual SSOT files.
+
+    Note:
+        A snapshot that is missing, unreadable, or was created by an incompatible version of the library or Python is ignored. So is a snapshot that was created from SSOT files that differ from those within the library.
+
+    """
+    if path is None:
+        path = iati.resources.create_lib_data_path(iati.resources.FILE_DEFAULT_SNAPSHOT)
+
+    _SNAPSHOT['loaded'] = True
+    _SNAPSHOT['entries'] = {}
+
+    try:
+        snapshot = pickle.loads(iati.utilities.load_as_bytes(path))
+    except (IOError, OSError):  # there is no snapshot
+        return False
+    except Exception:  # pylint: disable=broad-except
+        iati.utilities.log_warning('The default snapshot at {0} could not be read, so will be ignored.'.format(path))
+        return False
+
+    try:
+        if snapshot['format'] != _SNAPSHOT_FORMAT or snapshot['python'] != sys.version_info[0]:
+            iati.utilities.log_warning('The default snapshot at {0} is in an incompatible format, so will be ignored.'.format(path))
+            return False
+        if snapshot['library'] != iati.__version__ or snapshot['resources'] != _resources_digest():
+            iati.utilities.log_warning('The default snapshot at {0} is out of date, so will be ignored.'.format(path))
+            return False
+        _SNAPSHOT['entries'] = snapshot['entries']
+    except (KeyError, TypeError):
+        iati.utilities.log_warning('The default snapshot at {0} could not be read, so will be ignored.'.format(path))
+        return False
+
+    return True
+
+
+def _resources_digest():
+    """Return a digest of the SSOT files that default data is loaded from.
+
+    Returns:
+        str: A hexadecimal digest of the path and content of each file within the folder of resources related to the IATI Standard.
+
+    """
+    base_path = iati.resources.resource_filesystem_path(iati.resources.BASE_PATH_STANDARD)
+    digest = hashlib.sha256()
+
+    for folder_path, folder_names, file_names in os.walk(base_path):
+        folder_names.sort()
+        for file_name in sorted(file_names):
+            file_path = os.path.join(folder_path, file_name)
+            relative_path = os.path.relpath(file_path, base_path).replace(os.sep, '/')
+            digest.update(relative_path.encode('utf-8') + b'\0')
+            digest.update(hashlib.sha256(iati.utilities.load_as_bytes(file_path)).digest())
+
+    return digest.hexdigest()
+
+
+def write_snapshot(path=None):
+    """Create a snapshot of the default SSOT content for all supported versions of the Standard.
+
+    The snapshot contains parsed Codelists, Codelist mappings, Rulesets, the Ruleset schema and Schema sources. Once created, default data is loaded from the snapshot rather than from the individual SSOT files. This significantly reduces the time taken by the first request for default data.
+
+    Args:
+        path (str): The path to write the snapshot file to. Defaults to None. This means that the snapshot is written to the library data folder, where it will be loaded automatically.
+
+    Returns:
+        str: The path that the snapshot was written to.
+
+    Note:
+        The snapshot records the version of the library and a digest of the SSOT files. It is ignored once either changes, so must then be recreated for it to be used.
+
+        Schemas are stored as the source of their base XSD. Includes are resolved and the XSD compiled when a Schema is first used.
+
+    """
+    if path is None:
+        path = iati.resources.create_lib_data_path(iati.resources.FILE_DEFAULT_SNAPSHOT)
+
+    # ensure that content is read from the SSOT files rather than any existing snapshot or cache
+    _SNAPSHOT['loaded'] = True
+    _SNAPSHOT['entries'] = {}
+    clear_caches()
+
+    entries = {}
+    non_embedded_codelists = {}
+    try:
+        for version in iati.constants.STANDARD_VERSIONS:
+            codelists_found = dict(_codelists(version, True))
+            non_embedded_names = tuple(name for name, codelist_found in codelists_found.items() if _CODELISTS_NON_EMBEDDED.get(name) is codelist_found)
+            for name in non_embedded_names:
+                non_embedded_codelists[name] = codelists_found.pop(name)
+            entries[('codelists', version)] = (codelists_found, non_embedded_names)
+            entries[('codelist_mapping', version)] = _codelist_mapping(version, True)
+            entries[('ruleset', version)] = _ruleset(version, True)
+            try:
+                entries[('ruleset_schema', version)] = ruleset_schema(version)
+            except (IOError, OSError):  # there is not a Ruleset schema at every version
+                pass
+            for schema_paths_func, schema_class in [(iati.resources.get_activity_schema_paths, iati.ActivitySchema), (iati.resources.get_organisation_schema_paths, iati.OrganisationSchema)]:
+                entries[('schema', version, schema_class.ROOT_ELEMENT_NAME)] = iati.utilities.load_as_bytes(schema_paths_func(version)[0])
+        entries[('codelists_non_embedded',)] = non_embedded_codelists
+    finally:
+        _SNAPSHOT['loaded'] = False
+
+    snapshot = {
+        'format': _SNAPSHOT_FORMAT,
+        'python': sys.version_info[0],
+        'library': iati.__version__,
+        'resources': _resources_digest(),
+        'entries': {key: pickle.dumps(value, pickle.HIGHEST_PROTOCOL) for key, value in entries.items()}
+    }
+
+    with open(path, 'wb') as snapshot_file:
+        pickle.dump(snapshot, snapshot_file, pickle.HIGHEST_PROTOCOL)
+
+    return path
@@ -0,0 +1,297 @@
+"""A module containing functionality for exporting IATI activities into flat tables and JSON documents.
+
+Activities are streamed, so files of any size may be exported using a constant amount of memory. The values in each table are located using XPaths that are compiled once for each major version of the Standard.
+
+Example:
+    To export the transactions in a large file to CSV::
+
+        with open('transactions.csv', 'w', newline='') as output:
+            iati.export.write_csv(path, output, table='transactions')
+
+    To export each activity as a line of JSON, ready to be indexed for search::
+
+        with open('activities.jsonl', 'w') as output:
+            iati.export.write_jsonl(path, output)
+
+"""
+import collections
+import csv
+import json
+import threading
+from lxml import etree
+import iati.data
+
+
+TABLES = ('activities', 'budgets', 'sectors', 'transactions')
+"""tuple of str: The names of the tables that activities may be exported to."""
+
+_ROW_PATHS = {
+    'activities': None,
+    'budgets': 'budget',
+    'sectors': 'sector',
+    'transactions': 'transaction'
+}
+"""dict: Mapping the name of each table to an XPath, relative to an activity, that locates the elements that each form a row. None means that the activity itself forms the row."""
+
+_COLUMNS = {
+    'activities': (
+        ('iati_identifier', 'iati-identifier/text()', 'iati-identifier/text()'),
+        ('reporting_org_ref', 'reporting-org/@ref', 'reporting-org/@ref'),
+        ('title', 'title[1]/text()', 'title/narrative[1]/text()'),
+        ('description', 'description[1]/text()', 'description[1]/narrative[1]/text()'),
+        ('activity_status', 'activity-status/@code', 'activity-status/@code'),
+        ('default_currency', '@default-currency', '@default-currency'),
+        ('start_planned', 'activity-date[@type="start-planned"]/@iso-date', 'activity-date[@type="1"]/@iso-date'),
+        ('start_actual', 'activity-date[@type="start-actual"]/@iso-date', 'activity-date[@type="2"]/@iso-date'),
+        ('end_planned', 'activity-date[@type="end-planned"]/@iso-date', 'activity-date[@type="3"]/@iso-date'),
+        ('end_actual', 'activity-date[@type="end-actual"]/@iso-date', 'activity-date[@type="4"]/@iso-date')
+    ),
+    'budgets': (
+        ('type', '@type', '@type'),
+        ('status', '@status', '@status'),
+        ('period_start', 'period-start/@iso-date', 'period-start/@iso-date'),
+        ('period_end', 'period-end/@iso-date', 'period-end/@iso-date'),
+        ('value', 'value/text()', 'value/text()'),
+        ('currency', '(../@default-currency | value/@currency)[last()]', '(../@default-currency | value/@currency)[last()]'),
+        ('value_date', 'value/@value-date', 'value/@value-date')
+    ),
+    'sectors': (
+        ('vocabulary', '@vocabulary', '@vocabulary'),
+        ('code', '@code', '@code'),
+        ('percentage', '@percentage', '@percentage'),
+        ('name', 'text()', 'narrative[1]/text()')
+    ),
+    'transactions': (
+        ('ref', '@ref', '@ref'),
+        ('transaction_type', 'transaction-type/@code', 'transaction-type/@code'),
+        ('transaction_date', 'transaction-date/@iso-date', 'transaction-date/@iso-date'),
+        ('value', 'value/text()', 'value/text()'),
+        ('currency', '(../@default-currency | value/@currency)[last()]', '(../@default-currency | value/@currency)[last()]'),
+        ('value_date', 'value/@value-date', 'value/@value-date'),
+        ('provider_org_ref', 'provider-org/@ref', 'provider-org/@ref'),
+        ('receiver_org_ref', 'receiver-org/@ref', 'receiver-org/@ref'),
+        ('description', 'description/text()', 'description/narrative[1]/text()')
+    )
+}
+"""dict: Mapping the name of each table to its columns. Each column is a tuple in the format: `(str, str, str)` - The name of the column; An XPath locating its value at version 1 of the Standard; An XPath locating its value at version 2 of the Standard. XPaths are relative to the element forming the row."""
+
+_IDENTIFIER_COLUMN = 'iati_identifier'
+"""str: The name of the column, from the `activities` table, that starts each row of the other tables so that they may be joined."""
+
+_EXTRACTORS = threading.local()
+"""threading.local: Holds the compiled XPaths for each table and major version, since compiled XPaths should not be shared between threads."""
+
+
+def column_names(table):
+    """Return the names of the columns in a table.
+
+    Args:
+        table (str): The name of a table in `TABLES`.
+
+    Returns:
+        list of str: The names of the columns, in the order that values are given by `iter_rows()`.
+
+    Raises:
+        ValueError: When `table` is not the name of a table.
+
+    """
+    columns = [name for name, _, _ in _table_columns(table)]
+    if _ROW_PATHS[table] is not None:
+        columns.insert(0, _IDENTIFIER_COLUMN)
+
+    return columns
+
+
+def iter_rows(source, table='activities', version=None, parser_profile='default'):
+    """Stream the rows of a table from some IATI data.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements such as that returned by `iati.dedupe.DigestIndex.filter()`. Files are streamed using `iati.data.iter_activities()`.
+        table (str): The name of a table in `TABLES`. Defaults to 'activities'.
+        version (str): The version of the Standard whose paths are used to locate values. Defaults to None, meaning the version stated by the data.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with. Defaults to 'default'.
+
+    Yields:
+        tuple: The values in a row, in the order given by `column_names()`. Missing values are None, while other values have surrounding whitespace removed. Rows that are not about activities start with the `iati_identifier` of the activity that contains them.
+
+    Raises:
+        ValueError: When `table` is not the name of a table.
+        lxml.etree.XMLSyntaxError: When a file does not contain valid XML. Rows before the point at which the XML becomes invalid are yielded before this is raised.
+
+    """
+    activities, stated_version = iati.data._activity_stream(source, parser_profile)  # pylint: disable=protected-access
+    row_xpath, column_xpaths = _extractors(table, version or stated_version)
+    identifier_xpath = _extractors('activities', version or stated_version)[1][0]
+
+    for activity in activities:
+        if activity.tag != 'iati-activity':
+            continue
+
+        if row_xpath is None:
+            yield tuple(_first_value(xpath(activity)) for xpath in column_xpaths)
+            continue
+
+        identifier = _first_value(identifier_xpath(activity))
+        for row_element in row_xpath(activity):
+            yield (identifier,) + tuple(_first_value(xpath(row_element)) for xpath in column_xpaths)
+
+
+def iter_documents(source, version=None, parser_profile='default'):
+    """Stream a JSON-compatible document for each activity within some IATI data.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements such as that returned by `iati.dedupe.DigestIndex.filter()`. Files are streamed using `iati.data.iter_activities()`.
+        version (str): The version of the Standard whose paths are used to locate values. Defaults to None, meaning the version stated by the data.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with. Defaults to 'default'.
+
+    Yields:
+        collections.OrderedDict: The columns of the `activities` table for an activity, along with `budgets`, `sectors` and `transactions` keys. Each of these is a list containing the columns of the relevant table for each budget, sector or transaction within the activity, excluding the `iati_identifier`.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: When a file does not contain valid XML. Documents before the point at which the XML becomes invalid are yielded before this is raised.
+
+    """
+    activities, stated_version = iati.data._activity_stream(source, parser_profile)  # pylint: disable=protected-access
+    extractors = {table: _extractors(table, version or stated_version) for table in TABLES}
+    names = {table: [name for name, _, _ in _table_columns(table)] for table in TABLES}
+
+    for activity in activities:
+        if activity.tag != 'iati-activity':
+            continue
+
+        document = collections.OrderedDict(zip(names['activities'], (_first_value(xpath(activity)) for xpath in extractors['activities'][1])))
+        for table in TABLES[1:]:
+            row_xpath, column_xpaths = extractors[table]
+            document[table] = [
+                collections.OrderedDict(zip(names[table], (_first_value(xpath(row_element)) for xpath in column_xpaths)))
+                for row_element in row_xpath(activity)
+            ]
+
+        yield document
+
+
+def write_csv(source, output, table='activities', version=None, parser_profile='default'):
+    """Write a table of the activities within some IATI data as CSV, a row at a time.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements such as that returned by `iati.dedupe.DigestIndex.filter()`. Files are streamed using `iati.data.iter_activities()`.
+        output (file): A file object to write to. It should be opened in text mode with `newline=''`.
+        table (str): The name of a table in `TABLES`. Defaults to 'activities'.
+        version (str): The version of the Standard whose paths are used to locate values. Defaults to None, meaning the version stated by the data.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with. Defaults to 'default'.
+
+    Returns:
+        int: The number of rows written, excluding the header row.
+
+    Raises:
+        ValueError: When `table` is not the name of a table.
+        lxml.etree.XMLSyntaxError: When a file does not contain valid XML. Rows before the point at which the XML becomes invalid are written before this is raised.
+
+    Note:
+        The first row written contains the names of the columns. Missing values are written as empty strings.
+
+    """
+    writer = csv.writer(output)
+    writer.writerow(column_names(table))
+
+    row_count = 0
+    for row in iter_rows(source, table, version, parser_profile):
+        writer.writerow(row)
+        row_count += 1
+
+    return row_count
+
+
+def write_jsonl(source, output, version=None, parser_profile='default'):
+    """Write a JSON document for each activity within some IATI data, one per line.
+
+    Args:
+        source (iati.Dataset or str or file or iterable): A Dataset, or the path to a file containing IATI XML, or a file object opened in binary mode, or an iterable of `iati-activity` elements such as that returned by `iati.dedupe.DigestIndex.filter()`. Files are streamed using `iati.data.iter_activities()`.
+        output (file): A file object to write to, opened in text mode.
+        version (str): The version of the Standard whose paths are used to locate values. Defaults to None, meaning the version stated by the data.
+        parser_profile (str): The name of the profile in `iati.constants.PARSER_PROFILES` to parse a file with. Defaults to 'default'.
+
+    Returns:
+        int: The number of documents written.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: When a file does not contain valid XML. Documents before the point at which the XML becomes invalid are written before this is raised.
+
+    Note:
+        See `iter_documents()` for the structure of each document. Missing values are written as `null`.
+
+    """
+    document_count = 0
+    for document in iter_documents(source, version, parser_profile):
+        output.write(json.dumps(document, ensure_ascii=False, separators=(',', ':')))
+        output.write('\n')
+        document_count += 1
+
+    return document_count
+
+
+def _extractors(table, version):
+    """Return the compiled XPaths that locate the rows and values of a table.
+
+    Args:
+        table (str): The name of a table in `TABLES`.
+        version (str): The version of the Standard that the data is at. None means the latest version.
+
+    Returns:
+        tuple: A tuple in the format: `(etree.XPath, list of etree.XPath)` - The XPath that locates the elements forming each row, or None if the activity forms the row; The XPath that locates the value of each column.
+
+    Raises:
+        ValueError: When `table` is not the name of a table.
+
+    """
+    major_version = 1 if version is not None and version.startswith('1.') else 2
+
+    try:
+        extractors = _EXTRACTORS.extractors
+    except AttributeError:
+        extractors = _EXTRACTORS.extractors = dict()
+
+    try:
+        return extractors[(table, major_version)]
+    except KeyError:
+        columns = _table_columns(table)
+        row_xpath = None if _ROW_PATHS[table] is None else etree.XPath(_ROW_PATHS[table])
+        column_xpaths = [etree.XPath(v1_path if major_version == 1 else v2_path, smart_strings=False) for _, v1_path, v2_path in columns]
+        extractors[(table, major_version)] = (row_xpath, column_xpaths)
+
+        return row_xpath, column_xpaths
+
+
+def _table_columns(table):
+    """Return the columns of a table.
+
+    Args:
+        table (str): The name of a table in `TABLES`.
+
+    Returns:
+        tuple: The columns, in the format given in `_COLUMNS`.
+
+    Raises:
+        ValueError: When `table` is not the name of a table.
+
+    """
+    try:
+        return _COLUMNS[table]
+    except (KeyError, TypeError):
+        raise ValueError('{0} is not a table that can be exported. Tables are: {1}'.format(table, ', '.join(TABLES)))
+
+
+def _first_value(xpath_results):
+    """Return the first value located by an XPath, with surrounding whitespace removed.
+
+    Args:
+        xpath_results (list of str): The results of evaluating an XPath that locates text or attribute values.
+
+    Returns:
+        str: The first value. None if there are no values.
+
+    """
+    for value in xpath_results:
+        return value.strip()
+
+    return None
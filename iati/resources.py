@@ -7,12 +7,14 @@ Warning:
 
     The location of SSOT content may change. It may also require network access to perform certain tasks.
 
+Note:
+    The location of the package and the SSOT content within it are determined once, then reused. The filesystem is not scanned each time that a path is requested.
+
 Todo:
     Determine how to distribute SSOT content - with package, or separately (being downloaded at runtime).
 
 """
 import os
-import pkg_resources
 import iati.constants
 
 
@@ -31,6 +33,8 @@ BASE_PATH_LIB_DATA = os.path.join(BASE_PATH, 'lib_data')
 """The relative location of resources not related to the IATI Standard."""
 PATH_CODELISTS = 'codelists'
 """The location of the folder containing Codelists from the SSOT."""
+PATH_CODELISTS_NON_EMBEDDED = 'codelists_non_embedded'
+"""The name of the folder containing Non-Embedded Codelists from the SSOT. The Codelists within the folder for each version link to the files here."""
 PATH_SCHEMAS = 'schemas'
 """The location of the folder containing Schemas from the SSOT."""
 PATH_RULESETS = 'rulesets'
@@ -42,6 +46,8 @@ FILE_CODELIST_MAPPING = 'codelist-mapping.xml'
 """The name of a file containing definitions of how Codelist values map to data."""
 FILE_DATA_EXTENSION = '.xml'
 """The expected extension of a file containing IATI data."""
+FILE_DEFAULT_SNAPSHOT = 'default_snapshot.pickle'
+"""The name of a file containing a prebuilt snapshot of the default SSOT content. See `iati.default.write_snapshot()`."""
 FILE_RULESET_EXTENSION = '.json'
 """The expected extension of a file containing a Ruleset."""
 FILE_SCHEMA_EXTENSION = '.xsd'
@@ -57,6 +63,87 @@ FILE_SCHEMA_ORGANISATION_NAME = 'iati-organisations-schema'
 """The name of a file containing an Organisation Schema."""
 
 
+_LOCATIONS = dict()
+"""A cache of the location of the package and an index of the SSOT content within it.
+
+Each is determined the first time that it is needed.
+
+The dictionary is structured as:
+
+{
+    "package_path": str,
+    "index": {
+        ("version_number_a", "codelists"): {
+            "codelist_name_1": "/path/to/codelist_name_1.xml",
+            [...]
+        },
+        ("version_number_a", "rulesets"): {
+            [...]
+        },
+        ("version_number_a", "schemas"): {
+            [...]
+        },
+        [...]
+    }
+}
+
+"""
+
+
+def _package_path():
+    """Determine the file system path of the folder containing the resources folder.
+
+    Returns:
+        str: The file system path of the package.
+
+    Note:
+        Where the package has been installed in a way that does not provide a standard filesystem, such as within a zip file, the resources are extracted using `pkg_resources`. This only occurs on the first call.
+
+    """
+    try:
+        return _LOCATIONS['package_path']
+    except KeyError:
+        pass
+
+    package_path = os.path.dirname(__file__)
+    if not os.path.isdir(os.path.join(package_path, BASE_PATH)):
+        import pkg_resources
+        package_path = os.path.dirname(pkg_resources.resource_filename(PACKAGE, BASE_PATH))
+
+    _LOCATIONS['package_path'] = package_path
+
+    return package_path
+
+
+def _resource_index():
+    """Return an index of the SSOT content for all versions of the Standard.
+
+    The index is built on the first call, by listing the folders for each version once.
+
+    Returns:
+        dict: Keys are `(version, kind)` tuples, where `kind` is one of `PATH_CODELISTS`, `PATH_RULESETS` or `PATH_SCHEMAS`. Values are dictionaries mapping the name of each resource, without a file extension, to its file system path.
+
+    """
+    try:
+        return _LOCATIONS['index']
+    except KeyError:
+        pass
+
+    index = dict()
+    for version in iati.constants.STANDARD_VERSIONS:
+        for kind in [PATH_CODELISTS, PATH_RULESETS, PATH_SCHEMAS]:
+            folder_path = path_for_version(kind, version)
+            try:
+                file_names = sorted(os.listdir(folder_path))
+            except OSError:  # not all kinds of resource exist at every version
+                file_names = []
+            index[(version, kind)] = {os.path.splitext(file_name)[0]: os.path.join(folder_path, file_name) for file_name in file_names}
+
+    _LOCATIONS['index'] = index
+
+    return index
+
+
 def get_codelist_paths(version=None):
     """Find the paths for all Codelists at the specified version of the Standard.
 
@@ -77,10 +164,12 @@ def get_codelist_paths(version=None):
         Provide an argument that allows the returned list to be restricted to only Embedded or only Non-Embedded Codelists.
 
     """
-    folder_path = path_for_version(PATH_CODELISTS, version)
-    files = pkg_resources.resource_listdir(PACKAGE, folder_path[len(resource_filesystem_path('')):])
-    files_codelists_only = [file_name for file_name in files if file_name[-4:] == FILE_CODELIST_EXTENSION]
-    paths = [create_codelist_path(file_name, version) for file_name in files_codelists_only]
+    if version is None:
+        version = iati.constants.STANDARD_VERSION_LATEST
+    folder_name_for_version(version)  # check that the version is valid
+
+    codelist_paths = _resource_index()[(version, PATH_CODELISTS)].values()
+    paths = [path for path in codelist_paths if path[-4:] == FILE_CODELIST_EXTENSION]
 
     return paths
 
@@ -218,6 +307,48 @@ def create_codelist_path(codelist_name, version=None):
     return path_for_version(os.path.join(PATH_CODELISTS, '{0}'.format(codelist_name) + FILE_CODELIST_EXTENSION), version)
 
 
+def is_non_embedded_codelist_path(path):
+    """Determine whether a path locates a Non-Embedded Codelist.
+
+    Non-Embedded Codelists are the same at every version of the Standard. A single shared copy of each is held in the `PATH_CODELISTS_NON_EMBEDDED` folder.
+
+    Args:
+        path (str): The path to a Codelist, as returned by `create_codelist_path()`.
+
+    Returns:
+        bool: Whether the path locates a Non-Embedded Codelist.
+
+    Note:
+        The decision is made by name rather than by following links, since links are copied as plain files when the package is built.
+
+    """
+    return os.path.basename(path) in _non_embedded_codelist_file_names()
+
+
+def _non_embedded_codelist_file_names():
+    """Return the names of the files in the `PATH_CODELISTS_NON_EMBEDDED` folder.
+
+    The folder is listed on the first call.
+
+    Returns:
+        frozenset of str: The file names of the Non-Embedded Codelists, including the file extension.
+
+    """
+    try:
+        return _LOCATIONS['non_embedded']
+    except KeyError:
+        pass
+
+    folder_path = resource_filesystem_path(os.path.join(BASE_PATH_STANDARD, PATH_CODELISTS_NON_EMBEDDED))
+    try:
+        file_names = frozenset(file_name for file_name in os.listdir(folder_path) if file_name.endswith(FILE_CODELIST_EXTENSION))
+    except OSError:
+        file_names = frozenset()
+    _LOCATIONS['non_embedded'] = file_names
+
+    return file_names
+
+
 def create_codelist_mapping_path(version=None):
     """Determine the path of the Codelist mapping file.
 
@@ -362,4 +493,7 @@ def resource_filesystem_path(path):
         When other functions in this module are reviewed, this will be too.
 
     """
-    return pkg_resources.resource_filename(PACKAGE, path)
+    if not path:
+        return _package_path()
+
+    return os.path.join(_package_path(), path)
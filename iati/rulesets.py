@@ -13,7 +13,7 @@ import json
 import re
 import sre_constants
 from datetime import datetime
-import jsonschema
+from lxml import etree
 import six
 import iati.default
 import iati.utilities
@@ -21,6 +21,15 @@ import iati.utilities
 
 _VALID_RULE_TYPES = ["atleast_one", "dependent", "sum", "date_order", "no_more_than_one", "regex_matches", "regex_no_matches", "startswith", "unique"]
 
+_INVALID = object()
+"""object: A placeholder for the result of checking a context element that contains a value that the Rule is unable to interpret."""
+
+_FIXED_POINT = re.compile(r'^([+-]?)([0-9]*)(?:\.([0-9]*))?$')
+"""Pattern: Matches a plain decimal number, capturing its sign, whole part and fractional part."""
+
+_TIMEZONE = re.compile(r'^([+-]([01][0-9]|2[0-3]):([0-5][0-9])|Z)?$')
+"""Pattern: Matches the permitted timezone characters that may follow a `YYYY-MM-DD` date."""
+
 
 def constructor_for_rule_type(rule_type):
     """Locate the constructor for specific Rule types.
@@ -108,6 +117,14 @@ class Ruleset(object):
         """
         return hash(id(self))
 
+    def __reduce__(self):
+        """Reduce the Ruleset to its Rules for pickling.
+
+        The Ruleset is not validated against the Ruleset Schema when unpickled.
+
+        """
+        return (_create_ruleset, (tuple(self.rules),))
+
     def is_valid_for(self, dataset):
         """Validate a Dataset against the Ruleset.
 
@@ -143,6 +160,7 @@ class Ruleset(object):
             ValueError: When `ruleset_dict` does not validate against the Ruleset Schema.
 
         """
+        import jsonschema  # imported here since it is slow to import and only needed when loading Rulesets
         try:
             jsonschema.validate(ruleset_dict, iati.default.ruleset_schema())
         except jsonschema.ValidationError:
@@ -165,6 +183,45 @@ class Ruleset(object):
                     self.rules.add(new_rule)
 
 
+def _create_ruleset(rules):
+    """Create a Ruleset from the Rules that it contains.
+
+    This is used when unpickling a Ruleset.
+
+    Args:
+        rules (tuple of iati.Rule): The Rules contained within the Ruleset.
+
+    Returns:
+        iati.Ruleset: The described Ruleset.
+
+    """
+    ruleset = Ruleset.__new__(Ruleset)
+    ruleset.rules = set(rules)
+
+    return ruleset
+
+
+def _create_rule(rule_class, name, context, case):
+    """Create a Rule from its component parts, without validating its case.
+
+    This is used when unpickling a Rule.
+
+    Args:
+        rule_class (type): The class of Rule to create.
+        name (str): The type of Rule.
+        context (str): The XPath expression that selects XML elements that the Rule acts against.
+        case (tuple of tuple): The `(key, value)` pairs of a case that has previously been validated for this type of Rule.
+
+    Returns:
+        iati.Rule: The described Rule.
+
+    """
+    rule = rule_class.__new__(rule_class)
+    rule._restore(name, context, dict(case))  # pylint: disable=protected-access
+
+    return rule
+
+
 class Rule(object):
     """Representation of a Rule contained within a Ruleset.
 
@@ -215,6 +272,14 @@ class Rule(object):
         """
         return hash((self.name, str(self)))
 
+    def __reduce__(self):
+        """Reduce the Rule to its class, name, context and case for pickling.
+
+        The case is reduced to a tuple of `(key, value)` pairs, sorted by key. It was validated when the Rule was created, so is not validated against the Ruleset Schema again when unpickled.
+
+        """
+        return (_create_rule, (self.__class__, self.name, self.context, tuple(sorted(self._case.items()))))
+
     @property
     def context(self):
         """str: An XPath expression to locate the elements that the Rule is to be checked against."""
@@ -225,6 +290,22 @@ class Rule(object):
         """str: The type of Rule, as specified in a JSON Ruleset."""
         return self._name
 
+    def _restore(self, name, context, case):
+        """Set the state of the Rule from a name, context and case that are known to be valid.
+
+        Args:
+            name (str): The type of Rule.
+            context (str): The XPath expression that selects XML elements that the Rule acts against.
+            case (dict): A case that has previously been validated for this type of Rule.
+
+        """
+        self._name = name
+        self._case = case
+        self._context = context
+        for attrib, value in case.items():
+            setattr(self, attrib, value)
+        self._normalize_xpaths()
+
     def _validated_context(self, context):
         """Check that a valid `context` is given for a Rule.
 
@@ -295,6 +376,7 @@ class Rule(object):
             The `name` attribute on the class must be set to a valid rule_type before this function is called.
 
         """
+        import jsonschema  # imported here since it is slow to import and only needed when loading Rulesets
         try:
             jsonschema.validate(case, self._ruleset_schema_section())
         except jsonschema.ValidationError:
@@ -392,6 +474,49 @@ class Rule(object):
         results = [result if isinstance(result, six.string_types) else result.text for result in xpath_results]
         return ['' if result is None else result for result in results]
 
+    def _extract_text_for_each(self, context_elements, path):
+        """Return the text values located by an XPath within each of a number of context elements.
+
+        The XPath is compiled once, rather than for each context element.
+
+        Args:
+            context_elements (list of etree._Element): The elements to evaluate the XPath against.
+            path (str): An XPath query string.
+
+        Returns:
+            list of list of str: The text values located within each context element, in the same order as `context_elements`. See `_extract_text_from_element_or_attribute()`.
+
+        """
+        try:
+            xpath = etree.XPath(path)
+        except etree.XPathSyntaxError:
+            # leave the error to be raised upon evaluation, as with `_extract_text_from_element_or_attribute()`
+            def xpath(context):
+                """Evaluate the XPath against a context element."""
+                return context.xpath(path)
+
+        texts_for_each = list()
+        for context in context_elements:
+            results = [result if isinstance(result, six.string_types) else result.text for result in xpath(context)]
+            texts_for_each.append(['' if result is None else result for result in results])
+
+        return texts_for_each
+
+    def _check_context_elements(self, context_elements):
+        """Check each of a number of context elements against the Rule.
+
+        Args:
+            context_elements (list of etree._Element): The elements to check.
+
+        Returns:
+            iterable: The result of checking each context element, in the same order as `context_elements`. See `_check_against_Rule()`.
+
+        Note:
+            May be overridden in child classes that are able to check all context elements at once. Such classes should return `_INVALID` in place of raising a ValueError, since results are only acted upon in document order.
+
+        """
+        return (self._check_against_Rule(context_element) for context_element in context_elements)
+
     def _condition_met_for(self, context_element):
         """Check for condtions of a given case.
 
@@ -453,12 +578,15 @@ class Rule(object):
         if context_elements == list():
             return None
 
+        results = iter(self._check_context_elements(context_elements))
         for context_element in context_elements:
             if self._condition_met_for(context_element):
                 return None
 
-            rule_check_result = self._check_against_Rule(context_element)
-            if rule_check_result is False:
+            rule_check_result = next(results)
+            if rule_check_result is _INVALID:
+                raise ValueError
+            elif rule_check_result is False:
                 return False
             elif rule_check_result is None:
                 return None
@@ -546,6 +674,12 @@ class RuleDateOrder(Rule):
 
         super(RuleDateOrder, self).__init__(context, case)
 
+    def _restore(self, name, context, case):
+        """Set the state of the Rule from a name, context and case that are known to be valid."""
+        self.special_case = 'NOW'
+
+        super(RuleDateOrder, self)._restore(name, context, case)
+
     def __str__(self):
         """Return string stating what RuleDateOrder is checking."""
         if self.less == self.special_case and self.more == self.special_case:
@@ -562,10 +696,10 @@ class RuleDateOrder(Rule):
     def _normalize_xpaths(self):
         """Normalize xpaths by combining them with `context`."""
         self.normalized_paths = list()
-        if self.less is not self.special_case:
+        if self.less != self.special_case:
             self.normalized_paths.append(self._normalize_xpath(self.less))
 
-        if self.more is not self.special_case:
+        if self.more != self.special_case:
             self.normalized_paths.append(self._normalize_xpath(self.more))
 
         self._normalize_condition()
@@ -596,18 +730,68 @@ class RuleDateOrder(Rule):
         if path == self.special_case:
             return datetime.today()
 
-        dates = self._extract_text_from_element_or_attribute(context_element, path)
+        return self._date_from_text(self._extract_text_from_element_or_attribute(context_element, path))
+
+    def _date_from_text(self, dates):
+        """Convert the text values located for a `less` or `more` value into a datetime object.
+
+        Args:
+            dates (list of str): The text values located by a `less` or `more` XPath.
+
+        Returns:
+            datetime.datetime: A datetime object. None if there are no dates.
+
+        Raises:
+            ValueError:
+                When a non-permitted number of unique dates are given.
+                When datetime cannot convert a string of non-permitted characters.
+                When non-permitted trailing characters are found after the core date string characters.
+
+        """
         if dates == list() or not dates[0]:
             return None
         # Checks that anything after the YYYY-MM-DD string is a permitted timezone character
-        pattern = re.compile(r'^([+-]([01][0-9]|2[0-3]):([0-5][0-9])|Z)?$')
-        if (len(set(dates)) == 1) and pattern.match(dates[0][10:]):
+        if (len(set(dates)) == 1) and _TIMEZONE.match(dates[0][10:]):
             if len(dates[0]) < 10:
                 # '%d' and '%m' are documented as requiring zero-padded dates.as input. This is actually for output. As such, a separate length check is required to ensure zero-padded values.
                 raise ValueError
             return datetime.strptime(dates[0][:10], '%Y-%m-%d')
         raise ValueError
 
+    def _dates_for_each(self, context_elements, path, parsed_dates):
+        """Retrieve the date located by a `less` or `more` value within each of a number of context elements.
+
+        Args:
+            context_elements (list of etree._Element): The elements to locate dates within.
+            path (str): The `less` or `more` value.
+            parsed_dates (dict): The datetime objects for date strings that have already been converted, or `_INVALID` for those that could not be. Added to as further strings are converted.
+
+        Returns:
+            list: The datetime object within each context element, in the same order as `context_elements`. None where there is no date, and `_INVALID` where the date is not permitted.
+
+        """
+        if path == self.special_case:
+            return [datetime.today()] * len(context_elements)
+
+        dates_for_each = list()
+        for dates in self._extract_text_for_each(context_elements, path):
+            if dates == list() or not dates[0]:
+                dates_for_each.append(None)
+            elif len(set(dates)) != 1:
+                dates_for_each.append(_INVALID)
+            else:
+                try:
+                    date = parsed_dates[dates[0]]
+                except KeyError:
+                    try:
+                        date = self._date_from_text(dates[:1])
+                    except ValueError:
+                        date = _INVALID
+                    parsed_dates[dates[0]] = date
+                dates_for_each.append(date)
+
+        return dates_for_each
+
     def _check_against_Rule(self, context_element):
         """Assert that the date value of `less` is chronologically before the date value of `more`.
 
@@ -641,6 +825,33 @@ class RuleDateOrder(Rule):
             return None
         return True
 
+    def _check_context_elements(self, context_elements):
+        """Assert that the date value of `less` is chronologically before the date value of `more` within each of a number of context elements.
+
+        The dates for all context elements are located first, with each distinct date string being converted once.
+
+        Args:
+            context_elements (list of etree._Element): The elements to check.
+
+        Returns:
+            list: The result of checking each context element, in the same order as `context_elements`. See `_check_against_Rule()`. `_INVALID` where a date is not in the correct xsd:date format.
+
+        """
+        parsed_dates = dict()
+        early_dates = self._dates_for_each(context_elements, self.less, parsed_dates)
+        later_dates = self._dates_for_each(context_elements, self.more, parsed_dates)
+
+        results = list()
+        for early_date, later_date in zip(early_dates, later_dates):
+            if early_date is _INVALID or later_date is _INVALID:
+                results.append(_INVALID)
+            elif early_date is None or later_date is None:
+                results.append(None)
+            else:
+                results.append(early_date <= later_date)
+
+        return results
+
 
 class RuleDependent(Rule):
     """Representation of a Rule that checks that if one of the Elements or Attributes in a given `path` exists then all its dependent Elements or Attributes must also exist.
@@ -948,6 +1159,118 @@ class RuleSum(Rule):
             return False
         return True
 
+    def _check_context_elements(self, context_elements):
+        """Assert that the total of the values given in `paths` match the given `sum` value within each of a number of context elements.
+
+        The values for all context elements are located first, with each distinct value being parsed once. Values are summed as fixed-point integers, falling back to `decimal.Decimal` arithmetic where a total could not be held exactly at the precision of the current decimal context.
+
+        Args:
+            context_elements (list of etree._Element): The elements to check.
+
+        Returns:
+            list: The result of checking each context element, in the same order as `context_elements`. See `_check_against_Rule()`. `_INVALID` where a value is not numeric.
+
+        """
+        values_for_each = [list() for _ in context_elements]
+        for path in set(self.paths):
+            for values, texts in zip(values_for_each, self._extract_text_for_each(context_elements, path)):
+                values.extend(texts)
+
+        target = decimal.Decimal(str(self.sum))
+        fixed_target = _fixed_point_from_decimal(target)
+        parsed_values = dict()
+
+        results = list()
+        for values in values_for_each:
+            numbers = list()
+            for value in values:
+                try:
+                    number = parsed_values[value]
+                except KeyError:
+                    number = parsed_values[value] = _parse_fixed_point(value)
+                numbers.append(number)
+
+            if numbers == list():
+                results.append(None)
+            elif any(number is _INVALID for number in numbers):
+                results.append(_INVALID)
+            else:
+                results.append(_fixed_point_sum_matches(numbers, fixed_target, values, target))
+
+        return results
+
+
+def _parse_fixed_point(value):
+    """Parse a numeric string into a fixed-point integer.
+
+    Args:
+        value (str): The string to parse. Any string that `decimal.Decimal` accepts is permitted.
+
+    Returns:
+        tuple or decimal.Decimal: A tuple in the format: `(int, int)` - The value multiplied by `10 ** places`; The number of decimal places. A `decimal.Decimal` for values that are not finite, or have too many digits before or after the decimal point to sensibly be held as an integer. `_INVALID` for values that are not numeric.
+
+    """
+    match = _FIXED_POINT.match(value)
+    if match:
+        sign, whole, fraction = match.groups()
+        fraction = fraction or ''
+        if (whole or fraction) and len(fraction) <= decimal.getcontext().prec:
+            coefficient = int(whole + fraction)
+            return (-coefficient if sign == '-' else coefficient, len(fraction))
+
+    try:
+        number = decimal.Decimal(value)
+    except decimal.InvalidOperation:
+        return _INVALID
+
+    return _fixed_point_from_decimal(number)
+
+
+def _fixed_point_from_decimal(number):
+    """Convert a Decimal into a fixed-point integer.
+
+    Args:
+        number (decimal.Decimal): The Decimal to convert.
+
+    Returns:
+        tuple or decimal.Decimal: A tuple in the format: `(int, int)` - The value multiplied by `10 ** places`; The number of decimal places. The Decimal itself if it is not finite or the magnitude of its exponent is greater than the precision of the current decimal context.
+
+    """
+    # a huge exponent, such as that of `1e-9999999`, would otherwise be scaled into an integer with millions of digits
+    if not number.is_finite() or abs(number.as_tuple().exponent) > decimal.getcontext().prec:
+        return number
+
+    sign, digits, exponent = number.as_tuple()
+    coefficient = int(''.join(str(digit) for digit in digits)) * (-1 if sign else 1)
+    if exponent >= 0:
+        return (coefficient * 10 ** exponent, 0)
+
+    return (coefficient, -exponent)
+
+
+def _fixed_point_sum_matches(numbers, fixed_target, values, target):
+    """Determine whether some numbers total to a target value.
+
+    Args:
+        numbers (list): The numbers to total, as returned by `_parse_fixed_point()`.
+        fixed_target (tuple or decimal.Decimal): The value that the numbers must total to, as returned by `_fixed_point_from_decimal()`.
+        values (list of str): The strings that `numbers` were parsed from. Used should the total need to be calculated using `decimal.Decimal` arithmetic.
+        target (decimal.Decimal): The value that the numbers must total to.
+
+    Returns:
+        bool: Whether the numbers total to the target value, to the same result as summing them using `decimal.Decimal` arithmetic.
+
+    """
+    if all(isinstance(number, tuple) for number in numbers + [fixed_target]):
+        places = max(number_places for _, number_places in numbers + [fixed_target])
+        scaled = [coefficient * 10 ** (places - number_places) for coefficient, number_places in numbers]
+        # Decimal arithmetic rounds totals that exceed the precision of the context, so only compare exactly when no total can
+        if sum(abs(number) for number in scaled) < 10 ** decimal.getcontext().prec:
+            target_coefficient, target_places = fixed_target
+            return sum(scaled) == target_coefficient * 10 ** (places - target_places)
+
+    return sum(decimal.Decimal(value) for value in values) == target
+
 
 class RuleUnique(Rule):
     """Representation of a Rule that checks that the text of each given path must be unique.
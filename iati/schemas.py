@@ -1,11 +1,13 @@
 """A module containing a core representation of IATI Schemas."""
 import collections
+import copy
 from lxml import etree
 import iati.codelists
 import iati.constants
 import iati.exceptions
 import iati.resources
 import iati.utilities
+import iati.validator
 
 
 class Schema(object):
@@ -50,6 +52,9 @@ class Schema(object):
             Create test instance where the SchemaError is raised.
 
         """
+        self._base_tree = None
+        self._shared_tree = None
+        self._validator_cache = _ValidatorCache()
         self._schema_base_tree = None
         self._source_path = path
         self.codelists = set()
@@ -64,6 +69,116 @@ class Schema(object):
         else:
             self._schema_base_tree = loaded_tree
 
+    @classmethod
+    def _from_source(cls, path, source):
+        """Create a Schema from the contents of an XSD file, without reading the file from disk.
+
+        Args:
+            path (str): The path that the XSD was originally located at. This is used to resolve includes and imports.
+            source (bytes): The contents of the XSD file.
+
+        Returns:
+            iati.Schema: A Schema of the class this is called on. It is equivalent to one initialised with `path`.
+
+        Raises:
+            iati.exceptions.SchemaError: The source could not be parsed.
+
+        """
+        schema = cls.__new__(cls)
+        schema._source_path = path  # pylint: disable=protected-access
+        schema.codelists = set()
+        schema.rulesets = set()
+
+        try:
+            schema._schema_base_tree = etree.ElementTree(etree.fromstring(source, iati.utilities.get_parser(), base_url=path))  # pylint: disable=protected-access
+        except (etree.XMLSyntaxError, ValueError):
+            msg = "Failed to parse source for '{0}' when creating Schema.".format(path)
+            iati.utilities.log_error(msg)
+            raise iati.exceptions.SchemaError
+
+        return schema
+
+    @property
+    def _schema_base_tree(self):
+        """etree._ElementTree: The tree representing the base XSD of the Schema.
+
+        Accessing the tree is assumed to be in order to modify it. As such, a Schema that is sharing its tree with others (see `copy()`) first takes a copy of the tree, and stops sharing their compiled validator.
+
+        Warning:
+            A validator that has already been compiled by this Schema is not discarded when the tree is modified in place. Assign the modified tree back to the Schema to discard it.
+
+        """
+        if self._base_tree is None and self._shared_tree is not None:
+            self._base_tree = copy.deepcopy(self._shared_tree)
+            self._shared_tree = None
+            self._validator_cache = _ValidatorCache()
+
+        return self._base_tree
+
+    @_schema_base_tree.setter
+    def _schema_base_tree(self, value):
+        self._base_tree = value
+        self._shared_tree = None
+        self._validator_cache = _ValidatorCache()
+
+    def _read_only_tree(self):
+        """Return the tree representing the base XSD of the Schema, without taking a copy of a shared tree.
+
+        Returns:
+            etree._ElementTree: The tree representing the base XSD of the Schema. It must not be modified.
+
+        """
+        return self._base_tree if self._base_tree is not None else self._shared_tree
+
+    def copy(self):
+        """Return a copy of the Schema that may be customised without affecting this Schema.
+
+        This is significantly quicker than a `deepcopy()`. The XSD tree and compiled validator are shared with this Schema until the copy's tree is accessed. The sets of Codelists and Rulesets are copied.
+
+        Returns:
+            iati.Schema: A Schema equal to this Schema.
+
+        Warning:
+            The Rulesets within the sets are not copied. A Ruleset should be copied before it is modified.
+
+        """
+        schema_copy = self.__class__.__new__(self.__class__)
+        schema_copy._base_tree = None  # pylint: disable=protected-access
+        schema_copy._shared_tree = self._read_only_tree()  # pylint: disable=protected-access
+        schema_copy._validator_cache = self._validator_cache  # pylint: disable=protected-access
+        schema_copy._source_path = self._source_path  # pylint: disable=protected-access
+        schema_copy.codelists = set(self.codelists)
+        schema_copy.rulesets = set(self.rulesets)
+
+        return schema_copy
+
+    def __reduce__(self):
+        """Reduce the Schema to its class, path, XSD source, Codelists and Rulesets for pickling.
+
+        The compiled validator is not pickled. It is compiled again when first needed after unpickling.
+
+        """
+        source = etree.tostring(self._read_only_tree())
+        return (_create_schema, (self.__class__, self._source_path, source, tuple(self.codelists), tuple(self.rulesets)))
+
+    def compile(self):
+        """Create a plan for validating Datasets against the Schema, including its Codelists and Rulesets.
+
+        Returns:
+            iati.validator.ValidationPlan: An immutable plan that may be reused, shared between threads and pickled.
+
+        Raises:
+            iati.exceptions.SchemaError: An error occurred in the creation of the validator.
+
+        Example:
+            To validate many Datasets against the same Schema::
+
+                plan = iati.default.activity_schema().compile()
+                error_logs = [plan.validate(dataset) for dataset in datasets]
+
+        """
+        return iati.validator.ValidationPlan(self)
+
     def __eq__(self, other):
         """Check Schema equality.
 
@@ -79,9 +194,9 @@ class Schema(object):
         if (len(self.codelists) != len(other.codelists)) or (len(self.rulesets) != len(other.rulesets)):
             return False
 
-        # turn the tree into something that can be easily compared
-        self_tree_str = etree.tostring(self.flatten_includes(self._schema_base_tree), pretty_print=True)
-        other_tree_str = etree.tostring(other.flatten_includes(other._schema_base_tree), pretty_print=True)  # pylint: disable=protected-access
+        # turn the tree into something that can be easily compared - `flatten_includes()` modifies the tree, so work on copies
+        self_tree_str = etree.tostring(self.flatten_includes(copy.deepcopy(self._read_only_tree())), pretty_print=True)
+        other_tree_str = etree.tostring(other.flatten_includes(copy.deepcopy(other._read_only_tree())), pretty_print=True)  # pylint: disable=protected-access
 
         # compare Rulesets - cannot use `collections.Counter` since it works on hash values, which differ between equal Rulesets
         self_rulesets = list(self.rulesets)
@@ -164,7 +279,7 @@ class Schema(object):
             str or None: The version stated for the schema, according to the value defined in the 'version' attribute at root of the XSD schema. Returns None if there is no 'version' attribute.
 
         """
-        return self._schema_base_tree.getroot().get('version')
+        return self._read_only_tree().getroot().get('version')
 
     def flatten_includes(self, tree):
         """Flatten includes so that all nodes are accessible through lxml.
@@ -211,18 +326,26 @@ class Schema(object):
 
         Takes the base schema and converts it into an object that lxml can deal with.
 
+        The conversion is performed once, then the result is reused until the base schema is next accessed.
+
         Returns:
             etree.XMLSchema: A schema that can be used for validation.
 
         Raises:
             iati.exceptions.SchemaError: An error occurred in the creation of the validator.
 
+        Warning:
+            The returned validator may be shared with copies of this Schema. Its `error_log` should not be relied upon when validating from multiple threads.
+
         """
-        try:
-            return iati.utilities.convert_tree_to_schema(self._schema_base_tree)
-        except etree.XMLSchemaParseError as err:
-            iati.utilities.log_error(err)
-            raise iati.exceptions.SchemaError('Problem parsing Schema')
+        if self._validator_cache.validator is None:
+            try:
+                self._validator_cache.validator = iati.utilities.convert_tree_to_schema(self._read_only_tree())
+            except etree.XMLSchemaParseError as err:
+                iati.utilities.log_error(err)
+                raise iati.exceptions.SchemaError('Problem parsing Schema')
+
+        return self._validator_cache.validator
 
 
 class ActivitySchema(Schema):
@@ -235,3 +358,52 @@ class OrganisationSchema(Schema):
     """Representation of an IATI Organisation Schema as defined within the IATI SSOT."""
 
     ROOT_ELEMENT_NAME = 'iati-organisations'
+
+
+def _create_schema(schema_class, path, source, codelists, rulesets):
+    """Create a Schema from its component parts.
+
+    This is used when unpickling a Schema.
+
+    Args:
+        schema_class (type): The class of Schema to create.
+        path (str): The path that the XSD was originally located at.
+        source (bytes): The contents of the XSD.
+        codelists (tuple of iati.Codelist): The Codelists associated with the Schema.
+        rulesets (tuple of iati.Ruleset): The Rulesets associated with the Schema.
+
+    Returns:
+        iati.Schema: The described Schema.
+
+    """
+    schema = schema_class._from_source(path, source)  # pylint: disable=protected-access
+    schema.codelists = set(codelists)
+    schema.rulesets = set(rulesets)
+
+    return schema
+
+
+class _ValidatorCache(object):
+    """A holder for a compiled validator, shared between a Schema and its copies.
+
+    Compiled validators cannot be copied or pickled, so a copy of the holder is always empty.
+
+    """
+
+    __slots__ = ('validator',)
+
+    def __init__(self):
+        """Initialise an empty holder."""
+        self.validator = None
+
+    def __copy__(self):
+        """Return an empty holder."""
+        return _ValidatorCache()
+
+    def __deepcopy__(self, memo):
+        """Return an empty holder."""
+        return _ValidatorCache()
+
+    def __reduce__(self):
+        """Reduce to an empty holder for pickling."""
+        return (_ValidatorCache, ())
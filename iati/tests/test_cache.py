@@ -0,0 +1,191 @@
+"""A module containing tests for the library implementation of caching."""
+import threading
+import pytest
+import iati.cache
+
+
+class TestCache(object):
+    """A container for tests relating to Caches."""
+
+    @pytest.fixture
+    def cache(self):
+        """Return an empty, unlimited Cache."""
+        return iati.cache.Cache('test')
+
+    def test_cache_init(self, cache):
+        """Check that a new Cache is empty and unlimited."""
+        stats = cache.stats()
+
+        assert len(cache) == 0
+        assert stats['name'] == 'test'
+        assert stats['max_entries'] is None
+        assert stats['max_size'] is None
+        assert stats['hits'] == 0
+        assert stats['misses'] == 0
+
+    def test_cache_get_missing(self, cache):
+        """Check that getting a key that is not cached returns the default and counts a miss."""
+        assert cache.get('key') is None
+        assert cache.get('key', 'default') == 'default'
+        assert cache.stats()['misses'] == 2
+
+    def test_cache_set_get(self, cache):
+        """Check that a value that has been set is returned by reference and counts a hit."""
+        value = ['a value']
+        cache.set('key', value)
+
+        assert 'key' in cache
+        assert cache.get('key') is value
+        assert cache.stats()['hits'] == 1
+
+    def test_cache_setdefault(self, cache):
+        """Check that setdefault only adds a value when there is not already one for the key."""
+        assert cache.setdefault('key', 'first') == 'first'
+        assert cache.setdefault('key', 'second') == 'first'
+        assert cache.get('key') == 'first'
+
+    def test_cache_get_or_load(self, cache):
+        """Check that a loader is only called when its key is not cached."""
+        calls = []
+
+        def loader():
+            """Record the call, then return a value."""
+            calls.append(True)
+            return 'value'
+
+        assert cache.get_or_load('key', loader) == 'value'
+        assert cache.get_or_load('key', loader) == 'value'
+        assert len(calls) == 1
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+
+    def test_cache_get_or_load_error(self, cache):
+        """Check that an error raised by a loader is propagated and nothing is cached."""
+        def loader():
+            """Fail to load a value."""
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            cache.get_or_load('key', loader)
+
+        assert 'key' not in cache
+        assert cache.get_or_load('key', lambda: 'value') == 'value'
+
+    def test_cache_get_or_load_single_flight(self, cache):
+        """Check that concurrent requests for a missing key result in a single load, with every thread receiving the same value."""
+        thread_count = 8
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def loader():
+            """Record the call, then wait until released before returning a new value."""
+            calls.append(True)
+            started.set()
+            release.wait(5)
+            return object()
+
+        def request():
+            """Request the key from the cache."""
+            results.append(cache.get_or_load('key', loader))
+
+        threads = [threading.Thread(target=request) for _ in range(thread_count)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == thread_count
+        assert all(result is results[0] for result in results)
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == thread_count - 1
+
+    def test_cache_get_or_load_single_flight_error(self, cache):
+        """Check that threads waiting for a load receive the error raised by the loader."""
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def loader():
+            """Wait until released, then fail to load a value."""
+            started.set()
+            release.wait(5)
+            raise ValueError
+
+        def request():
+            """Request the key from the cache, recording any error."""
+            try:
+                cache.get_or_load('key', loader)
+            except ValueError as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=request) for _ in range(3)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(errors) == 3
+        assert 'key' not in cache
+
+    def test_cache_evicts_least_recently_used(self, cache):
+        """Check that a Cache limited to a number of entries evicts the least recently used entry."""
+        cache.configure(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.stats()['evictions'] == 1
+
+    def test_cache_evicts_by_size(self, cache):
+        """Check that a Cache limited to a total size evicts entries until it is within its limit."""
+        cache.configure(max_size=10, sizeof=len)
+        cache.set('a', 'x' * 4)
+        cache.set('b', 'x' * 4)
+        cache.set('c', 'x' * 4)
+
+        assert 'a' not in cache
+        assert cache.stats()['size'] == 8
+
+    def test_cache_retains_oversized_entry(self, cache):
+        """Check that the most recently added entry is retained even when it alone exceeds the size limit."""
+        cache.configure(max_size=2, sizeof=len)
+        cache.set('a', 'x' * 5)
+
+        assert 'a' in cache
+        assert len(cache) == 1
+
+    def test_cache_configure_evicts_existing(self, cache):
+        """Check that reducing the limits of a Cache evicts existing entries."""
+        for key in range(5):
+            cache.set(key, key)
+
+        cache.configure(max_entries=2)
+
+        assert len(cache) == 2
+        assert 3 in cache
+        assert 4 in cache
+
+    def test_cache_clear(self, cache):
+        """Check that clearing a Cache removes its entries and resets its statistics."""
+        cache.set('key', 'value')
+        cache.get('key')
+
+        cache.clear()
+        stats = cache.stats()
+
+        assert len(cache) == 0
+        assert stats['hits'] == 0
+        assert stats['size'] == 0
@@ -2,6 +2,7 @@
 import copy
 import pytest
 from lxml import etree
+from six.moves import cPickle as pickle
 import iati.codelists
 
 
@@ -161,6 +162,47 @@ class TestCodes(object):
         assert enum_el.attrib['value'] == value_to_set
         assert enum_el.nsmap == iati.constants.NSMAP
 
+    def test_code_pickle(self):
+        """Check that a Code is equal to the original when pickled and unpickled."""
+        code = iati.Code('test Code value', 'test Code name')
+
+        unpickled_code = pickle.loads(pickle.dumps(code, pickle.HIGHEST_PROTOCOL))
+
+        assert type(unpickled_code) is iati.Code  # pylint: disable=unidiomatic-typecheck
+        assert unpickled_code == code
+
+
+class TestCodelistPickling(object):
+    """A container for tests relating to pickling Codelists."""
+
+    @pytest.fixture
+    def codelist(self):
+        """Return a mutable Codelist containing Codes."""
+        codelist = iati.Codelist('test Codelist name')
+        codelist.complete = True
+        codelist.codes.add(iati.Code('value 1', 'name 1'))
+        codelist.codes.add(iati.Code('value 2', 'name 2'))
+
+        return codelist
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_codelist_pickle(self, codelist, protocol):
+        """Check that a Codelist remains mutable and equal when pickled and unpickled with any protocol."""
+        unpickled_codelist = pickle.loads(pickle.dumps(codelist, protocol))
+
+        assert type(unpickled_codelist) is iati.Codelist  # pylint: disable=unidiomatic-typecheck
+        assert unpickled_codelist == codelist
+        assert {code.value: code.name for code in unpickled_codelist.codes} == {code.value: code.name for code in codelist.codes}
+        unpickled_codelist.codes.add(iati.Code('value 3'))
+        assert len(codelist.codes) == 2
+
+    def test_codelist_pickle_compact(self, codelist):
+        """Check that a pickled Codelist does not contain attributes that are not yet implemented."""
+        pickled_codelist = pickle.dumps(codelist, pickle.HIGHEST_PROTOCOL)
+
+        assert b'_name_prose' not in pickled_codelist
+        assert b'_public_database' not in pickled_codelist
+
 
 class TestCodelistEquality(object):
     """A container for tests relating to Codelist equality - both direct and via hashing."""
@@ -250,3 +292,91 @@ class TestCodelistEquality(object):
         codelist_copy.codes.add(code)
 
         assert cmp_func_different_val_and_hash(codelist, codelist_copy)
+
+
+class TestFrozenCodelists(object):
+    """A container for tests relating to immutable Codelists."""
+
+    @pytest.fixture
+    def codelist(self):
+        """Return a mutable Codelist containing a number of Codes."""
+        codelist = iati.Codelist('test Codelist name')
+        codelist.complete = True
+        for value in ['1', '2', '3']:
+            codelist.codes.add(iati.Code(value, 'name ' + value))
+
+        return codelist
+
+    @pytest.fixture
+    def frozen_codelist(self, codelist):
+        """Return an immutable copy of a Codelist."""
+        return codelist.freeze()
+
+    def test_frozen_codelist_equal_to_mutable(self, codelist, frozen_codelist, cmp_func_equal_val_and_hash):
+        """Check that a frozen Codelist is equal to, and has the same hash as, the Codelist that it was frozen from."""
+        assert isinstance(frozen_codelist, iati.codelists.FrozenCodelist)
+        assert cmp_func_equal_val_and_hash(codelist, frozen_codelist)
+
+    def test_frozen_codelist_code_values(self, frozen_codelist):
+        """Check that the values of Codes on a frozen Codelist are available as a frozenset."""
+        assert frozen_codelist.code_values == frozenset(['1', '2', '3'])
+
+    @pytest.mark.parametrize('attr_name, value', [
+        ('name', 'a different name'),
+        ('complete', False),
+        ('codes', set())
+    ])
+    def test_frozen_codelist_cannot_set_attributes(self, frozen_codelist, attr_name, value):
+        """Check that attributes on a frozen Codelist cannot be assigned to."""
+        with pytest.raises(AttributeError):
+            setattr(frozen_codelist, attr_name, value)
+
+    def test_frozen_codelist_cannot_modify_codes(self, frozen_codelist):
+        """Check that Codes cannot be added to a frozen Codelist, and that the Codes on it cannot be modified."""
+        code = next(iter(frozen_codelist.codes))
+
+        with pytest.raises(AttributeError):
+            frozen_codelist.codes.add(iati.Code('4'))
+        with pytest.raises(AttributeError):
+            code.name = 'a different name'
+
+    @pytest.mark.parametrize('copy_func', [
+        lambda codelist: codelist.mutable_copy(),
+        copy.deepcopy
+    ])
+    def test_frozen_codelist_mutable_copy(self, frozen_codelist, copy_func):
+        """Check that a mutable copy of a frozen Codelist may be modified without affecting the frozen Codelist."""
+        codelist_copy = copy_func(frozen_codelist)
+        code = codelist_copy.codes.pop()
+        code.name = 'a different name'
+        codelist_copy.codes.add(code)
+        codelist_copy.codes.add(iati.Code('4'))
+
+        assert not isinstance(codelist_copy, iati.codelists.FrozenCodelist)
+        assert len(codelist_copy.codes) == 4
+        assert len(frozen_codelist.codes) == 3
+        assert all(frozen_code.name != 'a different name' for frozen_code in frozen_codelist.codes)
+
+    def test_frozen_codelist_shallow_copy_is_self(self, frozen_codelist):
+        """Check that a shallow copy of a frozen Codelist is the Codelist itself, since it cannot be modified."""
+        assert copy.copy(frozen_codelist) is frozen_codelist
+        assert frozen_codelist.freeze() is frozen_codelist
+
+    def test_frozen_codelist_pickle(self, frozen_codelist):
+        """Check that a frozen Codelist remains frozen and equal when pickled and unpickled."""
+        unpickled_codelist = pickle.loads(pickle.dumps(frozen_codelist, pickle.HIGHEST_PROTOCOL))
+
+        assert isinstance(unpickled_codelist, iati.codelists.FrozenCodelist)
+        assert unpickled_codelist == frozen_codelist
+        assert {code.value: code.name for code in unpickled_codelist.codes} == {code.value: code.name for code in frozen_codelist.codes}
+        with pytest.raises(AttributeError):
+            unpickled_codelist.name = 'a different name'
+
+    def test_frozen_codelist_from_xml(self):
+        """Check that a frozen Codelist may be created directly from XML."""
+        xml_str = iati.utilities.load_as_string(iati.resources.create_codelist_path('Country'))
+
+        frozen_codelist = iati.codelists.FrozenCodelist('Country', xml=xml_str)
+
+        assert frozen_codelist == iati.Codelist('Country', xml=xml_str)
+        assert all(isinstance(code, iati.codelists.FrozenCode) for code in frozen_codelist.codes)
@@ -4,6 +4,7 @@ Todo:
     Implement tests for strict checking once validation work is underway.
 """
 import collections
+import io
 import math
 from future.standard_library import install_aliases
 from lxml import etree
@@ -11,6 +12,7 @@ import pytest
 import iati.data
 import iati.default
 import iati.tests.utilities
+import iati.validator
 
 install_aliases()
 
@@ -171,6 +173,41 @@ class TestDatasets(object):
 
         assert 'If setting a Dataset with the xml_property, an ElementTree should be provided, not a' in str(excinfo.value)
 
+    def test_dataset_tree_serialised_lazily(self):
+        """Test that a Dataset created from a tree only creates its string representation when it is first accessed, so reflecting modifications made to the tree before then."""
+        tree = etree.fromstring(etree.tostring(iati.tests.utilities.XML_TREE_VALID))
+        data = iati.Dataset(tree)
+
+        assert data._xml_str is None  # pylint: disable=protected-access
+
+        data.xml_tree.getroot().set('lazy', 'yes')
+
+        assert b'lazy="yes"' in data.xml_str
+        assert data.xml_str is data.xml_str
+
+    def test_dataset_xml_str_parsed_once(self, monkeypatch):
+        """Test that a valid XML string is parsed into a tree without separately checking that it is XML."""
+        xml_str = iati.tests.resources.load_as_string('valid_not_iati')
+
+        def fail(*args, **kwargs):
+            """Fail if called."""
+            raise AssertionError('A valid XML string should not need checking')
+
+        monkeypatch.setattr(iati.validator, 'validate_is_xml', fail)
+        data = iati.Dataset(xml_str)
+
+        assert data.xml_tree.getroot().tag == 'parent'
+        assert data.xml_str == xml_str.strip()
+
+    def test_dataset_drop_xml_str(self):
+        """Test that a Dataset told not to keep its string discards it after parsing, then recreates it from the tree when accessed."""
+        xml_str = iati.tests.resources.load_as_string('valid_not_iati')
+        data = iati.Dataset(xml_str, keep_xml_str=False)
+
+        assert data._xml_str is None  # pylint: disable=protected-access
+        assert isinstance(data.xml_str, type(xml_str))
+        assert etree.tostring(etree.fromstring(data.xml_str.encode())) == etree.tostring(data.xml_tree)
+
 
 class TestDatasetWithEncoding(object):
     """A container for tests relating to creating a Dataset from various types of input.
@@ -280,6 +317,101 @@ class TestDatasetWithEncoding(object):
         assert excinfo.value.error_log.contains_error_called('err-encoding-unsupported')
 
 
+class TestDatasetFromBytes(object):
+    """A container for tests relating to creating a Dataset from raw bytes, files and paths."""
+
+    @pytest.fixture
+    def xml_str(self):
+        """An XML string with a declared encoding of ISO-8859-1."""
+        return u"""<?xml version="1.0" encoding="ISO-8859-1"?>
+<iati-activities version="2.02">
+  <iati-activity>
+    <iati-identifier>caf\u00e9</iati-identifier>
+  </iati-activity>
+</iati-activities>"""
+
+    @pytest.fixture(params=[bytes, bytearray, memoryview])
+    def buffer_type(self, request):
+        """A type of bytes-like object."""
+        return request.param
+
+    @pytest.mark.parametrize("encoding", ["UTF-8", "UTF-16", "ISO-8859-1"])
+    def test_from_bytes(self, xml_str, encoding, buffer_type):
+        """Test that a Dataset created from bytes is parsed in line with its encoding, without decoding the bytes until the string is requested."""
+        xml_encoded = buffer_type(xml_str.replace('ISO-8859-1', encoding).encode(encoding))
+
+        dataset = iati.Dataset.from_bytes(xml_encoded)
+
+        assert dataset._xml_str is None  # pylint: disable=protected-access
+        assert dataset.xml_tree.find('iati-activity/iati-identifier').text == u'caf\u00e9'
+        assert dataset.xml_str == xml_str.replace('ISO-8859-1', encoding)
+
+    def test_from_bytes_leading_whitespace(self, xml_str, buffer_type):
+        """Test that leading whitespace is ignored, as when creating a Dataset from a string."""
+        dataset = iati.Dataset.from_bytes(buffer_type(b'\n  ' + xml_str.encode('ISO-8859-1')))
+
+        assert dataset.xml_tree.getroot().tag == 'iati-activities'
+
+    def test_from_bytes_undeclared_encoding(self, xml_str):
+        """Test that bytes in an encoding other than that assumed by the parser are decoded and parsed as a string."""
+        xml_str = xml_str.replace(' encoding="ISO-8859-1"', '')
+
+        dataset = iati.Dataset.from_bytes(xml_str.encode('ISO-8859-1'))
+
+        assert dataset.xml_tree.find('iati-activity/iati-identifier').text == u'caf\u00e9'
+
+    @pytest.mark.parametrize("not_xml", [b'', b'  ', b'not xml'])
+    def test_from_bytes_not_xml(self, not_xml, buffer_type):
+        """Test that bytes that are not XML raise the same error as a string that is not XML."""
+        with pytest.raises(iati.exceptions.ValidationError):
+            iati.Dataset.from_bytes(buffer_type(not_xml))
+
+    @pytest.mark.parametrize("not_bytes", [u'<a/>', 1, None, etree.Element('a')])
+    def test_from_bytes_not_bytes(self, not_bytes):
+        """Test that a value that is not bytes-like raises a TypeError."""
+        with pytest.raises(TypeError) as excinfo:
+            iati.Dataset.from_bytes(not_bytes)
+
+        assert 'Datasets can only be created from bytes-like objects with from_bytes().' in str(excinfo.value)
+
+    def test_from_bytes_drop_xml_str(self, xml_str):
+        """Test that a Dataset told not to keep its string does not hold on to the bytes."""
+        dataset = iati.Dataset.from_bytes(xml_str.encode('ISO-8859-1'), keep_xml_str=False)
+
+        assert dataset._xml_bytes is None  # pylint: disable=protected-access
+        assert u'caf\u00e9' in dataset.xml_str
+
+    def test_from_file(self, xml_str):
+        """Test that a Dataset may be created from a file object that is not on disk."""
+        xml_file = io.BytesIO(xml_str.encode('ISO-8859-1'))
+
+        dataset = iati.Dataset.from_file(xml_file)
+
+        assert dataset.xml_str == xml_str
+
+    @pytest.mark.parametrize("keep_xml_str", [True, False])
+    def test_from_path(self, xml_str, tmpdir, keep_xml_str):
+        """Test that a Dataset may be created from the path to a file, with the string matching that obtained by loading the file as a string."""
+        path = tmpdir.join('dataset.xml')
+        path.write_binary(xml_str.encode('ISO-8859-1'))
+
+        dataset = iati.Dataset.from_path(str(path), keep_xml_str=keep_xml_str)
+
+        assert dataset.xml_tree.find('iati-activity/iati-identifier').text == u'caf\u00e9'
+        if keep_xml_str:
+            assert dataset.xml_str == iati.utilities.load_as_string(str(path))
+
+    def test_from_path_empty(self, tmpdir):
+        """Test that an empty file raises the same error as an empty string."""
+        path = tmpdir.join('empty.xml')
+        path.write_binary(b'')
+
+        with pytest.raises(iati.exceptions.ValidationError) as excinfo:
+            iati.Dataset.from_path(str(path))
+
+        assert excinfo.value.error_log.contains_error_called('err-not-xml-empty-document')
+
+
 class TestDatasetSourceFinding(object):
     """A container for tests relating to finding source context within a Dataset."""
 
@@ -453,6 +585,455 @@ class TestDatasetSourceFinding(object):
                 data.source_around_line(line_num, invalid_value)
 
 
+class TestDatasetLineIndex(object):
+    """A container for tests relating to the index of lines used to find source context within a Dataset."""
+
+    @pytest.fixture
+    def xml_str(self):
+        """An XML string spanning a number of lines, with trailing whitespace."""
+        return u"""<iati-activities version="2.02">
+  <iati-activity>
+    <iati-identifier>caf\u00e9</iati-identifier>
+  </iati-activity>
+</iati-activities>
+
+"""
+
+    def test_line_index_built_once(self, xml_str):
+        """Test that the index of lines is built on first use, then reused for every lookup."""
+        data = iati.Dataset(xml_str)
+
+        assert data._line_index is None  # pylint: disable=protected-access
+
+        data.source_at_line(1)
+        line_index = data._line_index  # pylint: disable=protected-access
+        data.source_around_line(3)
+
+        assert data._line_index is line_index  # pylint: disable=protected-access
+
+    def test_line_index_rebuilt_on_assignment(self, xml_str):
+        """Test that the index of lines reflects new XML that is assigned to a Dataset."""
+        data = iati.Dataset(xml_str)
+        data.source_at_line(1)
+
+        data.xml_str = '<a>\n<b/>\n</a>'
+
+        assert data.source_at_line(2) == '<b/>'
+
+    @pytest.mark.parametrize("encoding", ["UTF-8", "UTF-16"])
+    def test_line_index_bytes(self, xml_str, encoding, tmpdir):
+        """Test that source is found in a Dataset loaded from a file matches the elements at each line, without decoding the whole file as a string where the encoding allows."""
+        path = tmpdir.join('dataset.xml')
+        path.write_binary(xml_str.encode(encoding))
+        data = iati.Dataset.from_path(str(path))
+
+        for element in data.xml_tree.iter():
+            assert data.source_at_line(element.sourceline).startswith('<' + element.tag)
+
+        assert data.source_at_line(3) == u'<iati-identifier>caf\u00e9</iati-identifier>'
+        assert data.source_at_line(5) == u'</iati-activities>'
+        assert data.source_around_line(1, 0) == u'<iati-activities version="2.02">'
+        if encoding == 'UTF-8':
+            assert data._xml_str is None  # pylint: disable=protected-access
+
+    def test_line_index_tree(self):
+        """Test that source may be found in a Dataset created from a tree."""
+        tree = etree.fromstring('<a>\n<b/>\n</a>')
+        data = iati.Dataset(tree)
+
+        assert data.source_at_line(2).strip() == '<b/>'
+        assert data.source_around_line(2) == '<a>\n<b/>\n</a>'
+
+
+class TestIterActivities(object):
+    """A container for tests relating to iterating over the activities within IATI XML."""
+
+    @pytest.fixture
+    def xml_bytes(self):
+        """The bytes of an XML document containing a number of activities, each on its own line."""
+        activities = ''.join('  <iati-activity><iati-identifier>AA-{0}</iati-identifier></iati-activity>\n'.format(idx) for idx in range(5))
+
+        return '<iati-activities version="2.02">\n{0}</iati-activities>'.format(activities).encode('utf-8')
+
+    def test_dataset_iter_activities(self, xml_bytes):
+        """Test that a Dataset yields each of its activities in order, without modifying them."""
+        dataset = iati.Dataset.from_bytes(xml_bytes)
+
+        identifiers = [activity.findtext('iati-identifier') for activity in dataset.iter_activities()]
+
+        assert identifiers == ['AA-{0}'.format(idx) for idx in range(5)]
+        assert len(dataset.xml_tree.getroot()) == 5
+
+    def test_dataset_iter_organisations(self):
+        """Test that a Dataset of organisations yields each organisation."""
+        dataset = iati.Dataset('<iati-organisations><iati-organisation/><iati-organisation/></iati-organisations>')
+
+        assert len(list(dataset.iter_activities())) == 2
+
+    @pytest.mark.parametrize("as_path", [True, False])
+    def test_iter_activities(self, xml_bytes, tmpdir, as_path):
+        """Test that activities are streamed from a path or file object with their line numbers, with processed activities being removed from the tree."""
+        path = tmpdir.join('dataset.xml')
+        path.write_binary(xml_bytes)
+        source = str(path) if as_path else io.BytesIO(xml_bytes)
+
+        seen = []
+        for activity in iati.data.iter_activities(source):
+            seen.append((activity.findtext('iati-identifier'), activity.sourceline))
+            preceding = list(activity.itersiblings(preceding=True))
+            assert len(preceding) <= 1
+            assert all(len(element) == 0 for element in preceding)
+
+        assert seen == [('AA-{0}'.format(idx), idx + 2) for idx in range(5)]
+
+    def test_iter_activities_clears_elements(self, xml_bytes):
+        """Test that an activity is emptied once iteration continues."""
+        activities = iati.data.iter_activities(io.BytesIO(xml_bytes))
+        first = next(activities)
+        next(activities)
+
+        assert len(first) == 0
+
+    def test_iter_activities_keeps_tails(self, xml_bytes):
+        """Test that clearing a processed activity retains the whitespace that follows it."""
+        activities = iati.data.iter_activities(io.BytesIO(xml_bytes))
+        first = next(activities)
+        next(activities)
+
+        assert first.tail == '\n  '
+
+    @pytest.mark.parametrize("prefix", [
+        b'\n  ',
+        b'\xef\xbb\xbf',
+        b'\xef\xbb\xbf\n'
+    ])
+    @pytest.mark.parametrize("declaration", [b'', b'<?xml version="1.0" encoding="UTF-8"?>\n'])
+    def test_iter_activities_leading_whitespace(self, xml_bytes, prefix, declaration):
+        """Test that a byte order mark and whitespace before the XML are skipped, as they are by a Dataset."""
+        xml_bytes = prefix + declaration + xml_bytes
+        streamed = [activity.findtext('iati-identifier') for activity in iati.data.iter_activities(io.BytesIO(xml_bytes))]
+        loaded = [activity.findtext('iati-identifier') for activity in iati.Dataset(xml_bytes.decode('utf-8-sig')).iter_activities()]
+
+        assert streamed == loaded == ['AA-{0}'.format(idx) for idx in range(5)]
+
+    def test_iter_activities_invalid_xml(self, xml_bytes):
+        """Test that invalid XML raises an error once the invalid part is reached."""
+        activities = iati.data.iter_activities(io.BytesIO(xml_bytes[:-10]))
+
+        with pytest.raises(etree.XMLSyntaxError):
+            list(activities)
+
+
+class TestDatasetParserProfiles(object):
+    """A container for tests relating to parsing Datasets with different parser profiles."""
+
+    def test_compact_profile(self):
+        """Test that the compact profile discards comments and whitespace, while the string is retained as provided."""
+        xml_str = iati.tests.resources.load_as_string('valid_not_iati')
+
+        dataset = iati.Dataset(xml_str, parser_profile='compact')
+
+        assert not [node for node in dataset.xml_tree.iter() if not isinstance(node.tag, str)]
+        assert dataset.xml_tree.getroot().text is None
+        assert dataset.xml_str == xml_str.strip()
+
+    def test_huge_profile(self):
+        """Test that the huge profile parses text that exceeds the limits of the default parser."""
+        xml_bytes = b'<iati-activities>' + b'x' * 10000001 + b'</iati-activities>'
+
+        with pytest.raises(iati.exceptions.ValidationError):
+            iati.Dataset.from_bytes(xml_bytes)
+        dataset = iati.Dataset.from_bytes(xml_bytes, parser_profile='huge')
+
+        assert len(dataset.xml_tree.getroot().text) == 10000001
+
+    def test_iter_activities_profile(self):
+        """Test that activities are streamed with the specified profile."""
+        xml_bytes = b'<iati-activities><iati-activity> <!-- comment --> <title/></iati-activity></iati-activities>'
+
+        activities = [len(activity) for activity in iati.data.iter_activities(io.BytesIO(xml_bytes), parser_profile='compact')]
+
+        assert activities == [1]
+
+    @pytest.mark.parametrize("not_a_profile", ['not a profile', None])
+    def test_unknown_profile(self, not_a_profile):
+        """Test that an unknown profile raises a ValueError."""
+        with pytest.raises(ValueError):
+            iati.Dataset('<a/>', parser_profile=not_a_profile)
+        with pytest.raises(ValueError):
+            iati.Dataset.from_bytes(b'<a/>', parser_profile=not_a_profile)
+
+
+class TestDatasetIndex(object):
+    """A container for tests relating to indexing the activities within a Dataset."""
+
+    @pytest.fixture
+    def dataset(self):
+        """A Dataset containing a number of activities."""
+        return iati.Dataset("""<iati-activities version="2.02">
+  <iati-activity>
+    <iati-identifier>AA-1</iati-identifier>
+    <reporting-org ref="AA"/>
+    <sector code="11110"/>
+    <sector code="11110"/>
+    <recipient-country code="AF"/>
+  </iati-activity>
+  <iati-activity>
+    <iati-identifier> AA-2 </iati-identifier>
+    <reporting-org ref="AA"/>
+    <sector code="11120"/>
+  </iati-activity>
+  <iati-activity>
+    <iati-identifier>BB-1</iati-identifier>
+    <reporting-org ref="BB"/>
+    <sector code="11110"/>
+    <recipient-country code="AX"/>
+  </iati-activity>
+</iati-activities>""")
+
+    def test_index_by_identifier(self, dataset):
+        """Test that activities are found by their identifier, ignoring surrounding whitespace."""
+        index = dataset.index()
+
+        assert len(index) == 3
+        assert index.by_identifier('AA-1').find('sector').get('code') == '11110'
+        assert index.by_identifier('AA-2').findtext('iati-identifier') == ' AA-2 '
+        assert index.by_identifier('CC-1') is None
+
+    def test_index_by_reporting_org(self, dataset):
+        """Test that activities are found by their reporting organisation, in document order."""
+        index = dataset.index()
+
+        assert [activity.findtext('iati-identifier').strip() for activity in index.by_reporting_org('AA')] == ['AA-1', 'AA-2']
+        assert index.by_reporting_org('CC') == ()
+
+    def test_index_by_attribute(self, dataset):
+        """Test that activities are found by the value of an indexed attribute, being listed once however many times they use the value."""
+        index = dataset.index()
+
+        assert [activity.findtext('iati-identifier') for activity in index.by_attribute('sector/@code', '11110')] == ['AA-1', 'BB-1']
+        assert index.by_attribute('recipient-country/@code', 'AX') == (index.by_identifier('BB-1'),)
+        assert index.attribute_values('sector/@code') == frozenset(['11110', '11120'])
+
+    def test_index_custom_attributes(self, dataset):
+        """Test that a custom set of attributes may be indexed, with other attributes being unavailable."""
+        index = dataset.index(['reporting-org/@ref'])
+
+        assert len(index.by_attribute('reporting-org/@ref', 'AA')) == 2
+        with pytest.raises(ValueError):
+            index.by_attribute('sector/@code', '11110')
+
+    def test_index_reused(self, dataset):
+        """Test that the index is built once and reused, unless different attributes are requested."""
+        index = dataset.index()
+
+        assert dataset.index() is index
+        assert dataset.index(iati.data.DatasetIndex.DEFAULT_ATTRIBUTES) is index
+        assert dataset.index(['sector/@code']) is not index
+
+    def test_index_invalidated(self, dataset):
+        """Test that the index is rebuilt once new XML is assigned or it has been invalidated."""
+        index = dataset.index()
+        dataset.xml_tree.getroot().remove(index.by_identifier('BB-1'))
+        dataset.invalidate_index()
+
+        assert dataset.index().by_identifier('BB-1') is None
+
+        dataset.xml_str = '<iati-activities><iati-activity><iati-identifier>CC-1</iati-identifier></iati-activity></iati-activities>'
+
+        assert dataset.index().by_identifier('CC-1') is not None
+        assert dataset.index().by_identifier('AA-1') is None
+
+    def test_index_duplicate_identifiers(self, dataset):
+        """Test that identifiers used by more than one activity are reported."""
+        dataset.xml_tree.getroot()[1].find('iati-identifier').text = 'AA-1'
+        dataset.invalidate_index()
+
+        duplicates = dataset.index().duplicate_identifiers()
+
+        assert list(duplicates.keys()) == ['AA-1']
+        assert len(duplicates['AA-1']) == 2
+
+    def test_index_organisations(self):
+        """Test that organisations are indexed by their identifier."""
+        dataset = iati.Dataset('<iati-organisations><iati-organisation><organisation-identifier>AA</organisation-identifier></iati-organisation></iati-organisations>')
+
+        assert dataset.index().by_identifier('AA') is not None
+
+
+class TestExtractTransactions(object):
+    """A container for tests relating to extracting transactions into columns."""
+
+    @pytest.fixture
+    def transactions_xml(self):
+        """Return IATI XML containing two activities, with three transactions between them."""
+        return b"""<iati-activities version="2.02">
+            <iati-activity default-currency="GBP">
+                <transaction>
+                    <transaction-type code="3" />
+                    <value value-date="2017-01-02">10.5</value>
+                    <provider-org ref="AA-AAA" />
+                    <receiver-org ref="BB-BBB" />
+                </transaction>
+                <transaction>
+                    <transaction-type code="not-a-code" />
+                    <value currency="USD">not-a-number</value>
+                </transaction>
+            </iati-activity>
+            <iati-activity>
+                <transaction>
+                    <value value-date="not-a-date">20</value>
+                </transaction>
+            </iati-activity>
+        </iati-activities>"""
+
+    @pytest.fixture(params=['dataset', 'file'])
+    def transactions(self, request, transactions_xml):
+        """Return the transactions extracted from a Dataset or a streamed file."""
+        if request.param == 'dataset':
+            return iati.data.extract_transactions(iati.Dataset.from_bytes(transactions_xml))
+
+        return iati.data.extract_transactions(io.BytesIO(transactions_xml))
+
+    def test_extract_transactions_columns(self, transactions):
+        """Test that each transaction is given an entry in each column, in document order."""
+        assert len(transactions) == 3
+        assert list(transactions['activity']) == [0, 0, 1]
+        assert transactions['value'][0] == 10.5
+        assert math.isnan(transactions['value'][1])
+        assert transactions['value'][2] == 20
+        assert transactions['provider_org_ref'] == ['AA-AAA', None, None]
+        assert transactions['receiver_org_ref'] == ['BB-BBB', None, None]
+
+    def test_extract_transactions_codes(self, transactions):
+        """Test that codes are mapped to ids that may be decoded, with the default currency of an activity used where a value does not state one."""
+        assert transactions.version == '2.02'
+        assert transactions.decode('transaction_type', transactions['transaction_type'][0]) == '3'
+        assert transactions.decode('currency', transactions['currency'][0]) == 'GBP'
+        assert transactions.decode('currency', transactions['currency'][1]) == 'USD'
+        assert transactions['transaction_type'][1] == iati.data.TransactionColumns.NOT_ON_CODELIST
+        assert transactions['transaction_type'][2] == iati.data.TransactionColumns.MISSING
+        assert transactions['currency'][2] == iati.data.TransactionColumns.MISSING
+        assert transactions.decode('currency', transactions['currency'][2]) is None
+
+    def test_extract_transactions_dates(self, transactions):
+        """Test that value dates are given as days since 1970-01-01."""
+        assert list(transactions['value_date']) == [17168, iati.data.TransactionColumns.MISSING_DATE, iati.data.TransactionColumns.MISSING_DATE]
+
+    def test_extract_transactions_no_activities(self):
+        """Test that data with no activities results in empty columns."""
+        transactions = iati.data.extract_transactions(io.BytesIO(b'<iati-activities version="2.02"></iati-activities>'))
+
+        assert len(transactions) == 0
+        assert list(transactions['value']) == []
+
+    def test_extract_transactions_numpy(self, transactions_xml):
+        """Test that transactions may be returned as NumPy arrays."""
+        numpy = pytest.importorskip('numpy')
+
+        columns = iati.data.extract_transactions(iati.Dataset.from_bytes(transactions_xml), as_numpy=True)
+
+        assert columns['value'].dtype == numpy.float64
+        assert columns['value_date'][0] == numpy.datetime64('2017-01-02')
+        assert numpy.isnat(columns['value_date'][1])
+        assert list(columns['activity']) == [0, 0, 1]
+        assert list(columns['provider_org_ref']) == ['AA-AAA', None, None]
+
+
+class TestDiff(object):
+    """A container for tests relating to determining the differences between two copies of some IATI data."""
+
+    @pytest.fixture
+    def old_xml(self):
+        """Return IATI XML containing three activities."""
+        return b"""<iati-activities version="2.02">
+            <iati-activity default-currency="GBP" hierarchy="1">
+                <iati-identifier>AA-AAA-1</iati-identifier>
+                <title><narrative>Unchanged</narrative></title>
+            </iati-activity>
+            <iati-activity>
+                <iati-identifier>AA-AAA-2</iati-identifier>
+                <title><narrative>Changed</narrative></title>
+            </iati-activity>
+            <iati-activity>
+                <iati-identifier>AA-AAA-3</iati-identifier>
+            </iati-activity>
+        </iati-activities>"""
+
+    @pytest.fixture
+    def new_xml(self):
+        """Return the XML from `old_xml` with one activity changed, one removed and one added, along with changes to formatting, attribute order and comments that are not differences."""
+        return b"""<iati-activities version="2.02"><!-- a comment -->
+            <iati-activity hierarchy="1" default-currency="GBP"><iati-identifier> AA-AAA-1 </iati-identifier><title><narrative>Unchanged</narrative></title></iati-activity>
+            <iati-activity>
+                <iati-identifier>AA-AAA-4</iati-identifier>
+            </iati-activity>
+            <iati-activity>
+                <iati-identifier>AA-AAA-2</iati-identifier>
+                <title><narrative>Changed again</narrative></title>
+            </iati-activity>
+        </iati-activities>"""
+
+    @pytest.fixture(params=['dataset', 'file'])
+    def source_type(self, request):
+        """Return a function that converts XML into a Dataset or a file to be streamed."""
+        if request.param == 'dataset':
+            return iati.Dataset.from_bytes
+
+        return io.BytesIO
+
+    def test_diff(self, old_xml, new_xml, source_type):
+        """Test that added, removed, changed and unchanged activities are identified by their identifier."""
+        result = iati.data.diff(source_type(old_xml), source_type(new_xml))
+
+        assert result.added == ['AA-AAA-4']
+        assert result.removed == ['AA-AAA-3']
+        assert result.changed == ['AA-AAA-2']
+        assert result.unchanged == ['AA-AAA-1']
+        assert result
+
+    def test_diff_identical(self, old_xml, source_type):
+        """Test that there are no differences between identical data."""
+        result = iati.data.diff(source_type(old_xml), source_type(old_xml))
+
+        assert not result
+        assert len(result.unchanged) == 3
+
+    def test_diff_duplicate_identifiers(self):
+        """Test that activities sharing an identifier are compared as a group, regardless of their order."""
+        first = b'<iati-activity><iati-identifier>AA</iati-identifier><title>1</title></iati-activity>'
+        second = b'<iati-activity><iati-identifier>AA</iati-identifier><title>2</title></iati-activity>'
+        old = iati.Dataset.from_bytes(b'<iati-activities>' + first + second + b'</iati-activities>')
+        reordered = iati.Dataset.from_bytes(b'<iati-activities>' + second + first + b'</iati-activities>')
+        reduced = iati.Dataset.from_bytes(b'<iati-activities>' + first + b'</iati-activities>')
+
+        assert not iati.data.diff(old, reordered)
+        assert iati.data.diff(old, reduced).changed == ['AA']
+
+    def test_diff_activity_iterables(self, old_xml, new_xml):
+        """Test that streams of activities may be compared."""
+        result = iati.data.diff(iati.data.iter_activities(io.BytesIO(old_xml)), iati.data.iter_activities(io.BytesIO(new_xml)))
+
+        assert result.changed == ['AA-AAA-2']
+
+    def test_activity_digests(self, old_xml, new_xml):
+        """Test that each activity within a Dataset is given a digest that ignores its formatting."""
+        old_digests = iati.Dataset.from_bytes(old_xml).activity_digests()
+        new_digests = iati.Dataset.from_bytes(new_xml).activity_digests()
+
+        assert [identifier for identifier, _ in old_digests] == ['AA-AAA-1', 'AA-AAA-2', 'AA-AAA-3']
+        assert old_digests[0][1] == new_digests[0][1]
+        assert old_digests[1][1] != new_digests[2][1]
+        assert len(old_digests[0][1]) == 64
+
+    def test_diff_text_change(self):
+        """Test that a change to text within an activity, other than to surrounding whitespace, is a difference."""
+        old = iati.Dataset('<iati-activities><iati-activity><iati-identifier>AA</iati-identifier><title>A title</title></iati-activity></iati-activities>')
+        new = iati.Dataset('<iati-activities><iati-activity><iati-identifier>AA</iati-identifier><title>A  title</title></iati-activity></iati-activities>')
+
+        assert iati.data.diff(old, new).changed == ['AA']
+
+
 class TestDatasetVersionDetection(object):
     """A container for tests relating to detecting the version of a Dataset."""
 
@@ -0,0 +1,91 @@
+"""A module containing tests for identifying activities that are repeated across a corpus of IATI data."""
+import io
+import json
+import pytest
+import iati.data
+import iati.dedupe
+import iati.export
+
+
+class TestDigestIndex(object):
+    """A container for tests relating to DigestIndexes."""
+
+    @pytest.fixture
+    def index(self):
+        """Return an empty DigestIndex held in memory."""
+        index = iati.dedupe.DigestIndex()
+        yield index
+        index.close()
+
+    @pytest.fixture
+    def first_xml(self):
+        """Return IATI XML containing two activities, one of which is repeated."""
+        return b"""<iati-activities version="2.02">
+            <iati-activity><iati-identifier>AA-1</iati-identifier></iati-activity>
+            <iati-activity><iati-identifier>AA-2</iati-identifier></iati-activity>
+            <iati-activity><iati-identifier>AA-1</iati-identifier></iati-activity>
+        </iati-activities>"""
+
+    @pytest.fixture
+    def second_xml(self):
+        """Return IATI XML containing an activity from `first_xml` with different formatting, along with a new activity."""
+        return b"""<iati-activities version="2.02">
+            <iati-activity>
+                <iati-identifier> AA-2 </iati-identifier>
+            </iati-activity>
+            <iati-activity><iati-identifier>BB-1</iati-identifier></iati-activity>
+        </iati-activities>"""
+
+    def test_add(self, index):
+        """Test that a digest is only added the first time."""
+        assert index.add('digest', 'AA-1', 'first.xml') is True
+        assert index.add('digest', 'AA-1', 'second.xml') is False
+
+        assert 'digest' in index
+        assert len(index) == 1
+        assert index.first_seen('digest') == ('AA-1', 'first.xml')
+
+    def test_first_seen_missing(self, index):
+        """Test that None is returned for a digest that is not in the index."""
+        assert 'digest' not in index
+        assert index.first_seen('digest') is None
+
+    def test_filter(self, index, first_xml, second_xml):
+        """Test that activities are only yielded the first time they are seen, within and between sources."""
+        first = [iati.data._activity_identifier(activity) for activity in index.filter(io.BytesIO(first_xml), source_name='first')]  # pylint: disable=protected-access
+        second = [iati.data._activity_identifier(activity) for activity in index.filter(iati.Dataset.from_bytes(second_xml), source_name='second')]  # pylint: disable=protected-access
+
+        assert first == ['AA-1', 'AA-2']
+        assert second == ['BB-1']
+        assert len(index) == 3
+        assert index.first_seen(iati.Dataset.from_bytes(second_xml).activity_digests()[0][1]) == ('AA-2', 'first')
+
+    def test_filter_records_path(self, index, first_xml, tmpdir):
+        """Test that the path to a file is recorded as the source of its activities."""
+        path = str(tmpdir.join('first.xml'))
+        with open(path, 'wb') as xml_file:
+            xml_file.write(first_xml)
+
+        digest = next(activity_digest for _, activity_digest in iati.Dataset.from_bytes(first_xml).activity_digests())
+        list(index.filter(path))
+
+        assert index.first_seen(digest) == ('AA-1', path)
+
+    def test_filter_export(self, index, first_xml):
+        """Test that the activities yielded by `filter()` may be exported."""
+        output = io.StringIO()
+
+        iati.export.write_jsonl(index.filter(io.BytesIO(first_xml)), output)
+
+        assert [json.loads(line)['iati_identifier'] for line in output.getvalue().splitlines()] == ['AA-1', 'AA-2']
+
+    def test_persists(self, first_xml, tmpdir):
+        """Test that digests are retained when the index is reopened."""
+        path = str(tmpdir.join('digests.sqlite'))
+
+        with iati.dedupe.DigestIndex(path, commit_interval=1) as index:
+            list(index.filter(io.BytesIO(first_xml)))
+
+        with iati.dedupe.DigestIndex(path) as index:
+            assert len(index) == 2
+            assert list(index.filter(io.BytesIO(first_xml))) == []
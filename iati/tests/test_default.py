@@ -1,10 +1,20 @@
 """A module containing tests for the library representation of default values."""
+import gc
+from lxml import etree
 import pytest
 import iati.codelists
 import iati.constants
 import iati.default
 import iati.schemas
 import iati.tests.utilities
+import iati.validator
+
+
+def _ruleset_cache_stats_in_worker(version):
+    """Request the default Ruleset at the specified version, then return the statistics of the Ruleset cache within the current process."""
+    iati.default.ruleset(version)
+
+    return iati.default.cache_stats()['rulesets']
 
 
 class TestDefault(object):
@@ -112,6 +122,14 @@ class TestDefaultCodelists(object):
             for code in codelist.codes:
                 assert isinstance(code, iati.Code)
 
+    @pytest.mark.parametrize("codelist_name", ['Country', 'Currency', 'Sector'])
+    def test_default_non_embedded_codelists_shared(self, codelist_name):
+        """Check that a Non-Embedded Codelist is loaded once and shared between versions of the Standard."""
+        codelists_by_version = [iati.default.codelist(codelist_name, version) for version in iati.constants.STANDARD_VERSIONS]
+
+        for codelist in codelists_by_version:
+            assert codelist is codelists_by_version[0]
+
     def test_default_codelists_codes_have_name(self, standard_version_optional, codelists_with_no_name_codes):
         """Check that Codelists with Codes that should have names do have names.
 
@@ -301,6 +319,273 @@ class TestDefaultSchemas(object):
         assert schema.rulesets == set()
 
 
+class TestDefaultSnapshot(object):
+    """A container for tests relating to the prebuilt snapshot of default data."""
+
+    @staticmethod
+    def reset_caches():
+        """Empty the caches of default data so that subsequent requests load it from the snapshot or SSOT files."""
+        iati.default.clear_caches()
+
+    @pytest.fixture(autouse=True)
+    def reset_snapshot(self):
+        """Empty the caches of default data before each test, then restore the default snapshot state after it."""
+        self.reset_caches()
+        yield
+        self.reset_caches()
+        iati.default.load_snapshot()
+
+    @pytest.fixture
+    def snapshot_path(self, tmpdir):
+        """Return the path to a newly written snapshot."""
+        return iati.default.write_snapshot(str(tmpdir.join('snapshot.pickle')))
+
+    def test_snapshot_load(self, snapshot_path):
+        """Check that a written snapshot can be loaded."""
+        assert iati.default.load_snapshot(snapshot_path)
+
+    def test_snapshot_load_missing_file(self, tmpdir):
+        """Check that a missing snapshot is ignored and default data is loaded from the SSOT files."""
+        assert not iati.default.load_snapshot(str(tmpdir.join('missing.pickle')))
+        assert isinstance(iati.default.ruleset(), iati.Ruleset)
+
+    def test_snapshot_load_other_library_version(self, snapshot_path, monkeypatch):
+        """Check that a snapshot created by a different version of the library is ignored."""
+        monkeypatch.setattr(iati, '__version__', 'a different version')
+
+        assert not iati.default.load_snapshot(snapshot_path)
+
+    def test_snapshot_load_modified_resources(self, snapshot_path, monkeypatch):
+        """Check that a snapshot created from different SSOT files is ignored."""
+        monkeypatch.setattr(iati.default, '_resources_digest', lambda: 'a different digest')
+
+        assert not iati.default.load_snapshot(snapshot_path)
+
+    @pytest.mark.parametrize("snapshot_content", [b'', b'not a pickle', b'\x80\x02}q\x00.'])
+    def test_snapshot_load_invalid_file(self, tmpdir, snapshot_content):
+        """Check that an invalid snapshot is ignored."""
+        path = tmpdir.join('invalid.pickle')
+        path.write_binary(snapshot_content)
+
+        assert not iati.default.load_snapshot(str(path))
+
+    @pytest.mark.parametrize("default_func", [
+        iati.default.codelists,
+        iati.default.codelist_mapping,
+        iati.default.ruleset
+    ])
+    def test_snapshot_content_matches_ssot(self, snapshot_path, default_func, standard_version_optional):
+        """Check that content loaded from a snapshot matches that loaded from the SSOT files."""
+        iati.default.load_snapshot(str(snapshot_path) + '.missing')
+        expected = default_func(*standard_version_optional)
+
+        self.reset_caches()
+        iati.default.load_snapshot(snapshot_path)
+        result = default_func(*standard_version_optional)
+
+        assert result == expected
+
+    @pytest.mark.parametrize("schema_func", [
+        iati.default.activity_schema,
+        iati.default.organisation_schema
+    ])
+    def test_snapshot_schema_matches_ssot(self, snapshot_path, schema_func, standard_version_mandatory):
+        """Check that a Schema loaded from a snapshot is equivalent to one loaded from the SSOT files."""
+        iati.default.load_snapshot(str(snapshot_path) + '.missing')
+        expected = schema_func(*standard_version_mandatory)
+
+        self.reset_caches()
+        iati.default.load_snapshot(snapshot_path)
+        schema = schema_func(*standard_version_mandatory)
+
+        assert etree.tostring(schema._schema_base_tree) == etree.tostring(expected._schema_base_tree)  # pylint: disable=protected-access
+        assert schema._schema_base_tree.docinfo.URL == expected._schema_base_tree.docinfo.URL  # pylint: disable=protected-access
+        assert len(schema.codelists) == len(expected.codelists)
+        assert len(schema.rulesets) == len(expected.rulesets)
+
+    def test_snapshot_returns_independent_objects(self, snapshot_path):
+        """Check that each request for snapshot content returns a separate object."""
+        iati.default.load_snapshot(snapshot_path)
+
+        assert iati.default.ruleset() is not iati.default.ruleset()
+
+    def test_snapshot_non_embedded_codelists_shared(self, snapshot_path):
+        """Check that Non-Embedded Codelists loaded from a snapshot are shared between versions of the Standard."""
+        iati.default.load_snapshot(snapshot_path)
+
+        codelists_by_version = [iati.default.codelists(version) for version in ['1.04', '2.02', '2.03']]
+
+        assert codelists_by_version[0]['Country'] is codelists_by_version[1]['Country']
+        assert codelists_by_version[1]['Country'] is codelists_by_version[2]['Country']
+
+
+class TestDefaultWarm(object):
+    """A container for tests relating to preloading default data."""
+
+    @pytest.mark.parametrize("kinds", [
+        ['codelists'],
+        ['codelist_mapping', 'ruleset'],
+        ['activity_schema']
+    ])
+    def test_warm_loads_requested_data(self, kinds):
+        """Check that the requested kinds of default data are reported as loaded at the requested versions."""
+        versions = ['2.01', '2.02']
+
+        report = iati.default.warm(versions, kinds)
+
+        assert set(report['loaded'].keys()) == set((kind, version) for kind in kinds for version in versions)
+        assert report['failed'] == {}
+        assert all(seconds >= 0 for seconds in report['loaded'].values())
+        assert report['seconds'] >= 0
+
+    def test_warm_populates_caches(self):
+        """Check that warmed default data is placed in the caches that are used to return it."""
+        report = iati.default.warm(['2.02'], ['codelists', 'codelist_mapping', 'ruleset', 'organisation_schema'])
+
+        assert report['failed'] == {}
+        assert '2.02' in iati.default._CODELISTS  # pylint: disable=protected-access
+        assert '2.02' in iati.default._CODELIST_MAPPINGS  # pylint: disable=protected-access
+        assert '2.02' in iati.default._RULESETS  # pylint: disable=protected-access
+        cached_schema = iati.default._SCHEMAS.get(('2.02', 'populated', iati.OrganisationSchema.ROOT_ELEMENT_NAME))  # pylint: disable=protected-access
+        assert iati.default.organisation_schema('2.02').validator() is cached_schema.validator()
+
+    def test_warm_version_none(self):
+        """Check that a version of None is taken to be the latest version of the Standard."""
+        report = iati.default.warm([None], ['codelist_mapping'])
+
+        assert list(report['loaded'].keys()) == [('codelist_mapping', iati.constants.STANDARD_VERSION_LATEST)]
+
+    @pytest.mark.parametrize("invalid_version", ['1.00', '2.99', 'not a version'])
+    def test_warm_invalid_version(self, invalid_version):
+        """Check that an invalid version of the Standard cannot be warmed."""
+        with pytest.raises(ValueError):
+            iati.default.warm([invalid_version])
+
+    def test_warm_invalid_kind(self):
+        """Check that a kind of data that does not exist cannot be warmed."""
+        with pytest.raises(ValueError):
+            iati.default.warm(['2.02'], ['not a kind of data'])
+
+
+class TestDefaultValidationPlans(object):
+    """A container for tests relating to ValidationPlans compiled from default Schemas."""
+
+    @pytest.fixture(params=[
+        (iati.default.activity_validation_plan, iati.default.activity_schema),
+        (iati.default.organisation_validation_plan, iati.default.organisation_schema)
+    ])
+    def plan_and_schema_funcs(self, request):
+        """Return a function that returns a default ValidationPlan, and the function that returns the default Schema it is compiled from."""
+        return request.param
+
+    def test_validation_plan_cached(self, plan_and_schema_funcs):
+        """Check that the same plan is returned for each request at a version."""
+        plan_func, _ = plan_and_schema_funcs
+
+        assert plan_func('2.02') is plan_func('2.02')
+        assert isinstance(plan_func('2.02'), iati.validator.ValidationPlan)
+
+    def test_validation_plan_populated(self, plan_and_schema_funcs):
+        """Check that a default plan is compiled from the populated default Schema."""
+        plan_func, schema_func = plan_and_schema_funcs
+
+        assert plan_func('2.02').schema == schema_func('2.02')
+
+    @pytest.mark.parametrize("invalid_version", ['1.00', '2.99', 'not a version'])
+    def test_validation_plan_invalid_version(self, plan_and_schema_funcs, invalid_version):
+        """Check that a plan cannot be obtained for an invalid version of the Standard."""
+        plan_func, _ = plan_and_schema_funcs
+
+        with pytest.raises(ValueError):
+            plan_func(invalid_version)
+
+
+class TestDefaultWorkerPool(object):
+    """A container for tests relating to pools of worker processes that share default data."""
+
+    def test_worker_pool_shares_warm_data(self):
+        """Check that workers are started with default data that was warmed in the parent, so do not load it again."""
+        pool = iati.default.worker_pool(2, ['2.02'], ['ruleset'])
+        parent_stats = iati.default.cache_stats()['rulesets']
+        try:
+            worker_stats = pool.map(_ruleset_cache_stats_in_worker, ['2.02'] * 4)
+        finally:
+            pool.close()
+            pool.join()
+
+        assert all(stats['hits'] > parent_stats['hits'] for stats in worker_stats)
+        assert all(stats['misses'] == parent_stats['misses'] for stats in worker_stats)
+
+    def test_worker_pool_restores_gc(self):
+        """Check that the current process does not leave objects frozen after forking workers."""
+        if not hasattr(gc, 'get_freeze_count'):
+            pytest.skip('gc.freeze() is not available on this version of Python')
+
+        pool = iati.default.worker_pool(1, ['2.02'], ['ruleset'])
+        pool.close()
+        pool.join()
+
+        assert gc.get_freeze_count() == 0
+
+    def test_worker_pool_invalid_kind(self):
+        """Check that a pool cannot be created when asked to warm a kind of data that does not exist."""
+        with pytest.raises(ValueError):
+            iati.default.worker_pool(1, ['2.02'], ['not a kind'])
+
+
+class TestDefaultCaches(object):
+    """A container for tests relating to the caches of default data."""
+
+    @pytest.fixture(autouse=True)
+    def reset_caches(self):
+        """Restore the caches of default data to their unlimited state after each test."""
+        yield
+        for name in iati.default.cache_stats().keys():
+            iati.default.configure_cache(name)
+
+    def test_cache_stats_names(self):
+        """Check that statistics are returned for each cache of default data."""
+        stats = iati.default.cache_stats()
+
+        assert set(stats.keys()) == set(['codelists', 'codelists_non_embedded', 'codelist_mappings', 'rulesets', 'schemas', 'validation_plans'])
+        assert all(cache_stats['name'] == name for name, cache_stats in stats.items())
+
+    def test_cache_stats_count_requests(self):
+        """Check that repeated requests for default data are counted as cache hits."""
+        iati.default.clear_caches()
+
+        iati.default.ruleset('2.02')
+        iati.default.ruleset('2.02')
+        stats = iati.default.cache_stats()['rulesets']
+
+        assert stats['entries'] == 1
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+
+    def test_clear_caches(self):
+        """Check that clearing the caches removes all default data from them."""
+        iati.default.codelist_mapping('2.02')
+
+        iati.default.clear_caches()
+
+        assert all(cache_stats['entries'] == 0 for cache_stats in iati.default.cache_stats().values())
+
+    def test_configure_cache_evicts(self):
+        """Check that a cache limited to a number of entries evicts the least recently used data, which is reloaded when next requested."""
+        iati.default.configure_cache('rulesets', max_entries=1)
+        ruleset_202 = iati.default.ruleset('2.02')
+        iati.default.ruleset('2.01')
+
+        assert '2.02' not in iati.default._RULESETS  # pylint: disable=protected-access
+        assert iati.default.cache_stats()['rulesets']['evictions'] >= 1
+        assert iati.default.ruleset('2.02') == ruleset_202
+
+    def test_configure_cache_unknown_name(self):
+        """Check that attempting to configure a cache that does not exist raises an error."""
+        with pytest.raises(ValueError):
+            iati.default.configure_cache('not a cache', max_entries=1)
+
+
 class TestDefaultModifications(object):
     """A container for tests relating to the ability to modify defaults."""
 
@@ -329,25 +614,116 @@ class TestDefaultModifications(object):
         default_codelist = iati.default.codelist(codelist_name, *standard_version_optional)
         base_default_codelist_length = len(default_codelist.codes)
 
-        default_codelist.codes.add(new_code)
+        with pytest.raises(AttributeError):
+            default_codelist.codes.add(new_code)
+        unmodified_codelist = iati.default.codelist(codelist_name, *standard_version_optional)
+
+        assert len(default_codelist.codes) == base_default_codelist_length
+        assert len(unmodified_codelist.codes) == base_default_codelist_length
+
+    def test_default_codelist_copy_modification(self, codelist_name, new_code, standard_version_optional):
+        """Check that a mutable copy of a default Codelist may be modified without modifying the default."""
+        default_codelist = iati.default.codelist(codelist_name, *standard_version_optional)
+        base_default_codelist_length = len(default_codelist.codes)
+
+        modified_codelist = default_codelist.mutable_copy()
+        modified_codelist.codes.add(new_code)
         unmodified_codelist = iati.default.codelist(codelist_name, *standard_version_optional)
 
-        assert len(default_codelist.codes) == base_default_codelist_length + 1
+        assert len(modified_codelist.codes) == base_default_codelist_length + 1
         assert len(unmodified_codelist.codes) == base_default_codelist_length
 
+    def test_default_codelist_shared(self, codelist_name, standard_version_optional):
+        """Check that the same immutable default Codelist is returned each time it is requested."""
+        default_codelist = iati.default.codelist(codelist_name, *standard_version_optional)
+        default_codelists = iati.default.codelists(*standard_version_optional)
+
+        assert isinstance(default_codelist, iati.codelists.FrozenCodelist)
+        assert default_codelist is iati.default.codelist(codelist_name, *standard_version_optional)
+        assert default_codelist is default_codelists[codelist_name]
+
     def test_default_codelists_modification(self, codelist_name, new_code, standard_version_optional):
         """Check that default Codelists cannot be modified by adding Codes to returned lists with default parameters."""
         default_codelists = iati.default.codelists(*standard_version_optional)
         codelist_of_interest = default_codelists[codelist_name]
         base_default_codelist_length = len(codelist_of_interest.codes)
 
-        codelist_of_interest.codes.add(new_code)
+        with pytest.raises(AttributeError):
+            codelist_of_interest.codes.add(new_code)
+        default_codelists[codelist_name] = codelist_of_interest.mutable_copy()
+        default_codelists[codelist_name].codes.add(new_code)
         unmodified_codelists = iati.default.codelists(*standard_version_optional)
         unmodified_codelist_of_interest = unmodified_codelists[codelist_name]
 
-        assert len(codelist_of_interest.codes) == base_default_codelist_length + 1
+        assert len(default_codelists[codelist_name].codes) == base_default_codelist_length + 1
         assert len(unmodified_codelist_of_interest.codes) == base_default_codelist_length
 
+    def test_default_codelist_mapping_modification(self, standard_version_optional):
+        """Check that a default Codelist mapping cannot be modified by modifying returned mappings."""
+        default_mapping = iati.default.codelist_mapping(*standard_version_optional)
+        base_mapping_length = len(default_mapping)
+
+        default_mapping.clear()
+        unmodified_mapping = iati.default.codelist_mapping(*standard_version_optional)
+
+        assert len(unmodified_mapping) == base_mapping_length
+
+    def test_default_ruleset_modification(self, standard_version_optional):
+        """Check that a default Ruleset cannot be modified by modifying returned Rulesets."""
+        default_ruleset = iati.default.ruleset(*standard_version_optional)
+        base_rule_count = len(default_ruleset.rules)
+
+        default_ruleset.rules.pop()
+        unmodified_ruleset = iati.default.ruleset(*standard_version_optional)
+
+        assert len(unmodified_ruleset.rules) == base_rule_count
+
+    @pytest.mark.parametrize("default_call", [
+        iati.default.activity_schema,
+        iati.default.organisation_schema
+    ])
+    def test_default_x_schema_ruleset_modification(self, default_call, standard_version_optional):
+        """Check that the Rulesets and Rules within a default Schema may be modified without modifying the default."""
+        default_schema = default_call(*standard_version_optional)
+        default_ruleset = next(iter(default_schema.rulesets))
+        base_rule_count = len(default_ruleset.rules)
+        base_contexts = sorted(rule.context for rule in default_ruleset.rules)
+
+        default_ruleset.rules.pop()
+        next(iter(default_ruleset.rules))._context = 'a different context'  # pylint: disable=protected-access
+        unmodified_ruleset = next(iter(default_call(*standard_version_optional).rulesets))
+
+        assert unmodified_ruleset is not default_ruleset
+        assert len(unmodified_ruleset.rules) == base_rule_count
+        assert sorted(rule.context for rule in unmodified_ruleset.rules) == base_contexts
+        assert len(next(iter(iati.default.activity_schema(*standard_version_optional).rulesets)).rules) == base_rule_count
+
+    @pytest.mark.parametrize("default_call", [
+        iati.default.activity_schema,
+        iati.default.organisation_schema
+    ])
+    @pytest.mark.parametrize("populate", [True, False])
+    def test_default_x_schema_tree_modification(self, default_call, populate, standard_version_mandatory):
+        """Check that the base tree of a default Schema may be modified without modifying the default."""
+        default_schema = default_call(standard_version_mandatory[0], populate)
+        expected_version = default_schema._get_version()  # pylint: disable=protected-access
+
+        default_schema._schema_base_tree.getroot().set('version', 'a different version')  # pylint: disable=protected-access
+        unmodified_schema = default_call(standard_version_mandatory[0], populate)
+
+        assert unmodified_schema._get_version() == expected_version  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize("default_call", [
+        iati.default.activity_schema,
+        iati.default.organisation_schema
+    ])
+    def test_default_x_schema_shared_validator(self, default_call):
+        """Check that populated and unpopulated default Schemas share a single validator."""
+        default_schema = default_call('2.02', True)
+
+        assert default_schema.validator() is default_call('2.02', True).validator()
+        assert default_schema.validator() is default_call('2.02', False).validator()
+
     @pytest.mark.parametrize("default_call", [
         iati.default.activity_schema,
         iati.default.organisation_schema
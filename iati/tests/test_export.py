@@ -0,0 +1,161 @@
+"""A module containing tests for exporting activities into flat tables and JSON documents."""
+import copy
+import csv
+import io
+import json
+import pytest
+import iati.data
+import iati.export
+
+
+class TestExport(object):
+    """A container for tests relating to exporting activities."""
+
+    @pytest.fixture
+    def v2_xml(self):
+        """Return version 2 IATI XML containing two activities."""
+        return b"""<iati-activities version="2.02">
+            <iati-activity default-currency="GBP">
+                <iati-identifier> AA-AAA-1 </iati-identifier>
+                <title><narrative>First activity</narrative></title>
+                <activity-date type="1" iso-date="2017-01-01" />
+                <budget type="1">
+                    <period-start iso-date="2017-01-01" />
+                    <period-end iso-date="2017-12-31" />
+                    <value currency="USD" value-date="2017-01-01">100</value>
+                </budget>
+                <sector code="11110" percentage="100"><narrative>Education policy</narrative></sector>
+                <transaction>
+                    <transaction-type code="3" />
+                    <value value-date="2017-01-02">10</value>
+                    <receiver-org ref="BB-BBB" />
+                </transaction>
+                <transaction>
+                    <transaction-type code="4" />
+                    <value currency="EUR">20</value>
+                </transaction>
+            </iati-activity>
+            <iati-activity>
+                <iati-identifier>AA-AAA-2</iati-identifier>
+            </iati-activity>
+        </iati-activities>"""
+
+    @pytest.fixture
+    def v1_xml(self):
+        """Return version 1 IATI XML containing an activity."""
+        return b"""<iati-activities version="1.05">
+            <iati-activity version="1.05">
+                <iati-identifier>AA-AAA-1</iati-identifier>
+                <title>First activity</title>
+                <activity-date type="start-planned" iso-date="2017-01-01" />
+                <sector code="11110">Education policy</sector>
+            </iati-activity>
+        </iati-activities>"""
+
+    @pytest.fixture(params=['dataset', 'file'])
+    def source(self, request, v2_xml):
+        """Return the version 2 XML as a Dataset or a file to be streamed."""
+        if request.param == 'dataset':
+            return iati.Dataset.from_bytes(v2_xml)
+
+        return io.BytesIO(v2_xml)
+
+    def test_iter_rows_activities(self, source):
+        """Test that each activity forms a row, with whitespace removed from values and missing values given as None."""
+        rows = [dict(zip(iati.export.column_names('activities'), row)) for row in iati.export.iter_rows(source)]
+
+        assert len(rows) == 2
+        assert rows[0]['iati_identifier'] == 'AA-AAA-1'
+        assert rows[0]['title'] == 'First activity'
+        assert rows[0]['start_planned'] == '2017-01-01'
+        assert rows[0]['start_actual'] is None
+        assert rows[1]['iati_identifier'] == 'AA-AAA-2'
+        assert rows[1]['default_currency'] is None
+
+    def test_iter_rows_transactions(self, source):
+        """Test that each transaction forms a row starting with the identifier of its activity, with the currency defaulting to that of the activity."""
+        rows = [dict(zip(iati.export.column_names('transactions'), row)) for row in iati.export.iter_rows(source, 'transactions')]
+
+        assert len(rows) == 2
+        assert [row['iati_identifier'] for row in rows] == ['AA-AAA-1', 'AA-AAA-1']
+        assert [row['transaction_type'] for row in rows] == ['3', '4']
+        assert [row['currency'] for row in rows] == ['GBP', 'EUR']
+        assert rows[0]['receiver_org_ref'] == 'BB-BBB'
+        assert rows[1]['value_date'] is None
+
+    def test_iter_rows_version_1(self, v1_xml):
+        """Test that the paths for version 1 of the Standard are used for version 1 data."""
+        activity = next(iati.export.iter_rows(io.BytesIO(v1_xml)))
+        sector = next(iati.export.iter_rows(io.BytesIO(v1_xml), 'sectors'))
+
+        assert activity[iati.export.column_names('activities').index('title')] == 'First activity'
+        assert activity[iati.export.column_names('activities').index('start_planned')] == '2017-01-01'
+        assert sector[iati.export.column_names('sectors').index('name')] == 'Education policy'
+
+    def test_iter_rows_bare_activity(self):
+        """Test that an activity that is the root element of its file forms a row."""
+        xml = b'<iati-activity version="1.05"><iati-identifier>AA-AAA-1</iati-identifier><title>First activity</title></iati-activity>'
+
+        rows = [dict(zip(iati.export.column_names('activities'), row)) for row in iati.export.iter_rows(io.BytesIO(xml))]
+
+        assert len(rows) == 1
+        assert rows[0]['iati_identifier'] == 'AA-AAA-1'
+        assert rows[0]['title'] == 'First activity'
+
+    def test_iter_rows_detached_activities(self, v1_xml):
+        """Test that activities that have been detached from their document form rows, with the paths used being for the version the activities state."""
+        dataset = iati.Dataset.from_bytes(v1_xml)
+        activities = [copy.deepcopy(activity) for activity in dataset.xml_tree.findall('iati-activity')]
+
+        rows = [dict(zip(iati.export.column_names('activities'), row)) for row in iati.export.iter_rows(activities)]
+
+        assert len(rows) == 1
+        assert rows[0]['iati_identifier'] == 'AA-AAA-1'
+        assert rows[0]['title'] == 'First activity'
+
+    def test_iter_rows_skips_organisations(self):
+        """Test that organisations do not form rows."""
+        xml = b'<iati-organisations version="2.02"><iati-organisation><organisation-identifier>AA</organisation-identifier></iati-organisation></iati-organisations>'
+
+        assert list(iati.export.iter_rows(io.BytesIO(xml))) == []
+
+    @pytest.mark.parametrize("table", ['not-a-table', None])
+    def test_column_names_invalid_table(self, table):
+        """Test that requesting a table that does not exist raises a ValueError."""
+        with pytest.raises(ValueError):
+            iati.export.column_names(table)
+
+    def test_iter_documents(self, source):
+        """Test that each activity forms a document containing its budgets, sectors and transactions."""
+        documents = list(iati.export.iter_documents(source))
+
+        assert len(documents) == 2
+        assert documents[0]['iati_identifier'] == 'AA-AAA-1'
+        assert documents[0]['budgets'][0]['currency'] == 'USD'
+        assert documents[0]['sectors'][0]['name'] == 'Education policy'
+        assert len(documents[0]['transactions']) == 2
+        assert 'iati_identifier' not in documents[0]['transactions'][0]
+        assert documents[1]['transactions'] == []
+
+    def test_write_csv(self, source):
+        """Test that a table is written as CSV, starting with a header row, with missing values written as empty strings."""
+        output = io.StringIO()
+
+        row_count = iati.export.write_csv(source, output, 'transactions')
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+
+        assert row_count == 2
+        assert rows[0] == iati.export.column_names('transactions')
+        assert len(rows) == 3
+        assert rows[2][rows[0].index('value_date')] == ''
+
+    def test_write_jsonl(self, source):
+        """Test that a JSON document is written on each line for each activity."""
+        output = io.StringIO()
+
+        document_count = iati.export.write_jsonl(source, output)
+        lines = output.getvalue().splitlines()
+
+        assert document_count == 2
+        assert [json.loads(line)['iati_identifier'] for line in lines] == ['AA-AAA-1', 'AA-AAA-2']
+        assert json.loads(lines[1])['title'] is None
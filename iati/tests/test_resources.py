@@ -1,4 +1,5 @@
 """A module containing tests for the library implementation of accessing resources."""
+import os
 from lxml import etree
 import pytest
 import iati.constants
@@ -23,6 +24,31 @@ class TestResources(object):
         assert len(filename) > len(path)
         assert filename.endswith(path)
 
+    @pytest.mark.parametrize('path', [
+        '',
+        iati.resources.PATH_SCHEMAS,
+        iati.resources.BASE_PATH_STANDARD,
+        os.path.join(iati.resources.folder_path_for_version(), iati.resources.PATH_CODELISTS)
+    ])
+    def test_resource_filesystem_path_matches_pkg_resources(self, path):
+        """Check that resource file names are the same as those located by `pkg_resources`."""
+        import pkg_resources
+
+        assert iati.resources.resource_filesystem_path(path) == pkg_resources.resource_filename(iati.resources.PACKAGE, path)
+
+    def test_resource_index(self, standard_version_mandatory):
+        """Check that the index of resources locates files that exist, with names matching their file names."""
+        version = standard_version_mandatory[0]
+
+        for kind in [iati.resources.PATH_CODELISTS, iati.resources.PATH_RULESETS, iati.resources.PATH_SCHEMAS]:
+            resources = iati.resources._resource_index()[(version, kind)]  # pylint: disable=protected-access
+
+            assert resources
+            for name, path in resources.items():
+                assert os.path.isfile(path)
+                assert os.path.basename(path).startswith(name + '.')
+                assert path.startswith(iati.resources.path_for_version(kind, version))
+
 
 class TestResourceFolders(object):
     """A container for tests relating to resource folders."""
@@ -123,6 +149,28 @@ class TestResourceCodelists(object):
         assert path.count(iati.resources.FILE_CODELIST_EXTENSION) == 1
         assert iati.resources.PATH_CODELISTS in path
 
+    @pytest.mark.parametrize('codelist, expected_non_embedded', [
+        ('Country', True),
+        ('Sector', True),
+        ('ActivityStatus', False),
+        ('BudgetType', False)
+    ])
+    def test_is_non_embedded_codelist_path(self, standard_version_optional, codelist, expected_non_embedded):
+        """Check that Non-Embedded Codelists are distinguished from Embedded Codelists."""
+        path = iati.resources.create_codelist_path(codelist, *standard_version_optional)
+
+        assert iati.resources.is_non_embedded_codelist_path(path) == expected_non_embedded
+
+    def test_is_non_embedded_codelist_path_without_links(self, standard_version_optional, tmpdir):
+        """Check that Non-Embedded Codelists are identified when the files are not links, as is the case once the package is built."""
+        path = iati.resources.create_codelist_path('Country', *standard_version_optional)
+        copied_path = tmpdir.join(os.path.basename(path))
+        with open(path, 'rb') as codelist_file:
+            copied_path.write_binary(codelist_file.read())
+
+        assert not os.path.islink(str(copied_path))
+        assert iati.resources.is_non_embedded_codelist_path(str(copied_path))
+
     def test_get_codelist_mapping_paths(self, standard_version_optional):
         """Check that all codelist mapping paths are found."""
         codelist_mapping_paths = iati.resources.get_codelist_mapping_paths(*standard_version_optional)
@@ -9,6 +9,7 @@ Todo:
 # pylint: disable=protected-access,too-many-lines
 from copy import deepcopy
 import pytest
+from six.moves import cPickle as pickle
 import iati.default
 import iati.rulesets
 import iati.resources
@@ -245,6 +246,55 @@ class TestRulesetEquality(RulesetFixtures):
         assert cmp_func_different_val_and_hash(ruleset, ruleset_copy)
 
 
+class TestRulesetPickling(RulesetFixtures):
+    """A container for tests relating to pickling Rulesets."""
+
+    @pytest.fixture
+    def no_case_validation(self, monkeypatch):
+        """Cause an error to be raised should a case be validated against the Ruleset Schema."""
+        def fail_validation(*args):
+            """Fail the test, since a case should not be validated."""
+            pytest.fail('A case was validated against the Ruleset Schema.')
+
+        monkeypatch.setattr(iati.rulesets.Rule, '_valid_rule_configuration', fail_validation)
+        monkeypatch.setattr(iati.rulesets.Ruleset, '_validate_ruleset', fail_validation)
+
+    def test_ruleset_pickle(self, ruleset, no_case_validation):
+        """Check that a Ruleset is equal to the original when pickled and unpickled, without its Rules being validated again."""
+        unpickled_ruleset = pickle.loads(pickle.dumps(ruleset, pickle.HIGHEST_PROTOCOL))
+
+        assert isinstance(unpickled_ruleset, iati.Ruleset)
+        assert unpickled_ruleset == ruleset
+
+    def test_ruleset_pickle_default(self):
+        """Check that a default Ruleset is equal to the original when pickled and unpickled."""
+        ruleset = iati.default.ruleset('2.02')
+
+        unpickled_ruleset = pickle.loads(pickle.dumps(ruleset, pickle.HIGHEST_PROTOCOL))
+
+        assert unpickled_ruleset == ruleset
+
+    @pytest.mark.parametrize("rule_type, case", [
+        ('atleast_one', {'paths': ['test_path'], 'condition': 'test_condition'}),
+        ('date_order', {'less': 'NOW', 'more': 'test_path'}),
+        ('regex_matches', {'paths': ['test_path'], 'regex': '[a-z]+'}),
+        ('startswith', {'start': 'test_start', 'paths': ['test_path']}),
+        ('sum', {'paths': ['test_path'], 'sum': 100})
+    ])
+    def test_rule_pickle(self, rule_type, case):
+        """Check that a Rule has the same attributes as the original when pickled and unpickled."""
+        rule = iati.rulesets.constructor_for_rule_type(rule_type)('CONTEXT', case)
+
+        unpickled_rule = pickle.loads(pickle.dumps(rule, pickle.HIGHEST_PROTOCOL))
+
+        assert type(unpickled_rule) is type(rule)  # pylint: disable=unidiomatic-typecheck
+        assert unpickled_rule == rule
+        assert unpickled_rule.context == rule.context
+        assert unpickled_rule.normalized_paths == rule.normalized_paths
+        for attrib, value in case.items():
+            assert getattr(unpickled_rule, attrib) == value
+
+
 class TestRule(object):
     """A container for tests relating to Rules."""
 
@@ -870,6 +920,29 @@ class TestRuleDateOrder(RuleSubclassTestBase):
         """Check that the string format of the Rule contains some relevant information."""
         assert any(needle in str(rule_instantiating) for needle in ['must be chronologically', 'in the future', 'in the past'])
 
+    @pytest.mark.parametrize("dates,expected", [
+        ([('2017-01-01', '2017-01-02'), ('2017-01-01', '2017-01-01')], True),  # all contexts in order
+        ([('2017-01-01', '2017-01-02'), ('2017-01-03', '2017-01-02')], False),  # second context out of order
+        ([('2017-01-03', '2017-01-02'), ('not-a-date', '2017-01-02')], False),  # failure before an invalid date
+        ([('not-a-date', '2017-01-02'), ('2017-01-03', '2017-01-02')], 'error'),  # invalid date before a failure
+        ([('2017-01-01', None), ('2017-01-03', '2017-01-02')], None),  # missing date before a failure
+        ([('2017-01-01', '2017-01-02'), ('2017-01-01', '2017-01-02')], True)  # repeated dates
+    ])
+    def test_is_valid_for_multiple_contexts(self, rule_constructor, dates, expected):
+        """Check that each context element is checked in document order, with the first context element that is not valid determining the result."""
+        contexts = ''.join(
+            '<context><less>{0}</less>{1}</context>'.format(less, '' if more is None else '<more>{0}</more>'.format(more))
+            for less, more in dates
+        )
+        dataset = iati.Dataset('<root>{0}</root>'.format(contexts))
+        rule = rule_constructor('//context', {'less': 'less', 'more': 'more'})
+
+        if expected == 'error':
+            with pytest.raises(ValueError):
+                rule.is_valid_for(dataset)
+        else:
+            assert rule.is_valid_for(dataset) is expected
+
 
 class TestRuleDependent(RuleSubclassTestBase):
     """A container for tests relating to RuleDependent."""
@@ -1511,6 +1584,33 @@ class TestRuleSum(RuleSubclassTestBase):
         rule = rule_constructor(valid_single_context, no_values_case)
         assert rule.is_valid_for(valid_dataset) is None
 
+    @pytest.mark.parametrize("values,expected", [
+        ([['50', '50'], ['25.5', '74.5']], True),  # all contexts sum correctly
+        ([['50', '50'], ['25.5', '74']], False),  # second context does not sum correctly
+        ([['50', '49'], ['not-a-number']], False),  # failure before a non-numeric value
+        ([['not-a-number'], ['50', '49']], 'error'),  # non-numeric value before a failure
+        ([[], ['50', '49']], None),  # no values before a failure
+        ([['1e2'], [' 100 ']], True),  # values that are not plain decimal numbers
+        ([['100.000000000000000000000000001', '-0.000000000000000000000000001']], True),  # total that Decimal arithmetic rounds to the `sum` value
+        ([['0.1', '0.2', '99.7']], True),  # values that cannot be represented using standard binary representation
+        ([['1e-9999999', '100']], True),  # value with a huge negative exponent
+        ([['1e-99999999', '100'], ['1e-99999999', '99']], False),
+        ([['0.' + '0' * 100000 + '1', '100']], True),  # value with a huge number of decimal places
+        ([['1e999999', '100']], False),  # value with a huge positive exponent
+        ([['1e999999', '-1e999999', '100']], True)
+    ])
+    def test_is_valid_for_multiple_contexts(self, rule_constructor, values, expected):
+        """Check that each context element is checked in document order, with the first context element that is not valid determining the result."""
+        contexts = ''.join('<context>{0}</context>'.format(''.join('<value>{0}</value>'.format(value) for value in context_values)) for context_values in values)
+        dataset = iati.Dataset('<root>{0}</root>'.format(contexts))
+        rule = rule_constructor('//context', {'paths': ['value'], 'sum': 100})
+
+        if expected == 'error':
+            with pytest.raises(ValueError):
+                rule.is_valid_for(dataset)
+        else:
+            assert rule.is_valid_for(dataset) is expected
+
 
 class TestRuleUnique(RuleSubclassTestBase):
     """A container for tests relating to RuleUnique."""
@@ -3,6 +3,7 @@
 import copy
 from lxml import etree
 import pytest
+from six.moves import cPickle as pickle
 import iati.codelists
 import iati.default
 import iati.exceptions
@@ -256,6 +257,132 @@ class TestSchemas(SchemaTestsBase):
         assert len(schema_initialised.rulesets) == 2
 
 
+class TestSchemaCopies(object):
+    """A container for tests relating to copies of Schemas, and the validators that they share."""
+
+    @pytest.fixture(params=[iati.ActivitySchema, iati.OrganisationSchema])
+    def schema_initialised(self, request):
+        """Create and return a single ActivitySchema or OrganisationSchema object at a version where both may be converted to validators."""
+        schema_class = request.param
+        path_func = iati.resources.get_activity_schema_paths if schema_class is iati.ActivitySchema else iati.resources.get_organisation_schema_paths
+
+        return schema_class(path_func('2.02')[0])
+
+    @pytest.fixture
+    def codelist_empty(self):
+        """Return a Codelist that contains no Codes."""
+        return iati.Codelist('test Codelist name')
+
+    @pytest.fixture
+    def ruleset_empty(self):
+        """Return a Ruleset that contains no Rules."""
+        return iati.Ruleset()
+
+    def test_schema_validator_reused(self, schema_initialised):
+        """Check that the validator for a Schema is only created once."""
+        assert schema_initialised.validator() is schema_initialised.validator()
+
+    def test_schema_validator_reused_after_tree_access(self, schema_initialised):
+        """Check that reading the base tree of a Schema that is not shared does not discard its validator."""
+        validator = schema_initialised.validator()
+
+        schema_initialised._schema_base_tree
+
+        assert schema_initialised.validator() is validator
+
+    def test_schema_validator_recreated_after_tree_assignment(self, schema_initialised):
+        """Check that a new validator is created once a base tree is assigned to a Schema."""
+        validator = schema_initialised.validator()
+
+        schema_initialised._schema_base_tree = schema_initialised._schema_base_tree
+
+        assert schema_initialised.validator() is not validator
+
+    def test_schema_copy_equal(self, schema_initialised, codelist_empty, ruleset_empty, cmp_func_equal_val):
+        """Check that a copy of a Schema is equal to the original."""
+        schema_initialised.codelists.add(codelist_empty)
+        schema_initialised.rulesets.add(ruleset_empty)
+
+        schema_copy = schema_initialised.copy()
+
+        assert isinstance(schema_copy, type(schema_initialised))
+        assert schema_copy._source_path == schema_initialised._source_path
+        assert cmp_func_equal_val(schema_initialised, schema_copy)
+
+    def test_schema_copy_shares_validator(self, schema_initialised):
+        """Check that a copy of a Schema shares the validator of the original."""
+        schema_copy = schema_initialised.copy()
+
+        assert schema_copy.validator() is schema_initialised.validator()
+
+    def test_schema_copy_independent_sets(self, schema_initialised, codelist_empty, ruleset_empty):
+        """Check that Codelists and Rulesets may be added to a copy of a Schema without affecting the original."""
+        schema_copy = schema_initialised.copy()
+
+        schema_copy.codelists.add(codelist_empty)
+        schema_copy.rulesets.add(ruleset_empty)
+
+        assert len(schema_copy.codelists) == 1
+        assert len(schema_copy.rulesets) == 1
+        assert not schema_initialised.codelists
+        assert not schema_initialised.rulesets
+
+    def test_schema_copy_independent_tree(self, schema_initialised):
+        """Check that the base tree of a copy of a Schema may be modified without affecting the original."""
+        original_tree_str = etree.tostring(schema_initialised._read_only_tree())
+        validator = schema_initialised.validator()
+        schema_copy = schema_initialised.copy()
+
+        schema_copy._schema_base_tree.getroot().set('version', 'a different version')
+
+        assert schema_copy._get_version() == 'a different version'
+        assert etree.tostring(schema_initialised._read_only_tree()) == original_tree_str
+        assert schema_initialised.validator() is validator
+        assert schema_copy.validator() is not validator
+
+    def test_schema_deepcopy_with_validator(self, schema_initialised, cmp_func_equal_val):
+        """Check that a Schema with a created validator may be deep copied."""
+        schema_initialised.validator()
+
+        schema_copy = copy.deepcopy(schema_initialised)
+
+        assert cmp_func_equal_val(schema_initialised, schema_copy)
+
+
+class TestSchemaPickling(object):
+    """A container for tests relating to pickling Schemas."""
+
+    @pytest.fixture(params=[iati.default.activity_schema, iati.default.organisation_schema])
+    def schema_populated(self, request):
+        """Return a populated default Schema at a version where both types of Schema may be converted to validators."""
+        return request.param('2.02')
+
+    def test_schema_pickle(self, schema_populated, cmp_func_equal_val):
+        """Check that a populated Schema is equal to the original when pickled and unpickled."""
+        unpickled_schema = pickle.loads(pickle.dumps(schema_populated, pickle.HIGHEST_PROTOCOL))
+
+        assert type(unpickled_schema) is type(schema_populated)  # pylint: disable=unidiomatic-typecheck
+        assert unpickled_schema._source_path == schema_populated._source_path
+        assert cmp_func_equal_val(schema_populated, unpickled_schema)
+
+    def test_schema_pickle_with_validator(self, schema_populated):
+        """Check that a Schema with a created validator may be pickled, with a new validator being created after unpickling."""
+        validator = schema_populated.validator()
+
+        unpickled_schema = pickle.loads(pickle.dumps(schema_populated, pickle.HIGHEST_PROTOCOL))
+
+        assert isinstance(unpickled_schema.validator(), etree.XMLSchema)
+        assert unpickled_schema.validator() is not validator
+
+    def test_schema_pickle_modified_tree(self, schema_populated):
+        """Check that modifications to the base tree of a Schema are retained when it is pickled and unpickled."""
+        schema_populated._schema_base_tree.getroot().set('version', 'a different version')
+
+        unpickled_schema = pickle.loads(pickle.dumps(schema_populated, pickle.HIGHEST_PROTOCOL))
+
+        assert unpickled_schema._get_version() == 'a different version'
+
+
 class TestSchemaEquality(SchemaTestsBase):
     """A container for tests relating to Schema equality."""
 
@@ -1,4 +1,8 @@
 """A module containing tests for the library implementation of accessing utilities."""
+import codecs
+import io
+import sys
+import threading
 from lxml import etree
 import pytest
 import six
@@ -206,6 +210,129 @@ class TestDefaultVersions(object):
             assert version.startswith(str(major_version))
 
 
+class TestParserProfiles(object):
+    """A container for tests relating to XML parser profiles."""
+
+    @pytest.mark.parametrize("profile", ['default', 'compact', 'huge', 'huge_compact'])
+    def test_parser_options(self, profile):
+        """Check that every profile disables network access and the expansion of entities."""
+        options = iati.utilities.parser_options(profile)
+
+        assert options['no_network'] is True
+        assert options['resolve_entities'] is False
+        assert options['load_dtd'] is False
+
+    @pytest.mark.parametrize("not_a_profile", ['not a profile', None, ['default']])
+    def test_parser_options_unknown_profile(self, not_a_profile):
+        """Check that an unknown profile raises a ValueError listing the available profiles."""
+        with pytest.raises(ValueError) as excinfo:
+            iati.utilities.get_parser(not_a_profile)
+
+        assert 'compact, default, huge, huge_compact' in str(excinfo.value)
+
+    def test_get_parser_reused_per_thread(self):
+        """Check that a parser is reused within a thread, but not shared between threads."""
+        other_thread_parsers = []
+        thread = threading.Thread(target=lambda: other_thread_parsers.append(iati.utilities.get_parser()))
+        thread.start()
+        thread.join()
+
+        assert iati.utilities.get_parser() is iati.utilities.get_parser('default')
+        assert iati.utilities.get_parser() is not iati.utilities.get_parser('compact')
+        assert iati.utilities.get_parser() is not other_thread_parsers[0]
+
+    def test_entities_not_expanded(self):
+        """Check that entities declared within the XML are not expanded."""
+        tree = iati.utilities.convert_xml_to_tree('<!DOCTYPE a [<!ENTITY e "expanded">]><a>&e;</a>')
+
+        assert 'expanded' not in etree.tostring(tree).decode()
+
+
+class TestSniffRoot(object):
+    """A container for tests relating to determining the root element of XML without parsing all of it."""
+
+    @pytest.mark.parametrize("xml, expected", [
+        (b'<iati-activities version="2.02"><iati-activity/></iati-activities>', ('iati-activities', '2.02')),
+        (u'<iati-organisations version="1.05"></iati-organisations>', ('iati-organisations', '1.05')),
+        (b'  \n<?xml version="1.0" encoding="UTF-8"?>\n<!-- a comment --><iati-activities version=" 2.03 ">', ('iati-activities', '2.03')),
+        (b'<iati-activities><iati-activity>', ('iati-activities', '1.01')),
+        (b'<iati-activities version="2.02"><unclosed', ('iati-activities', '2.02'))
+    ])
+    def test_sniff_root(self, xml, expected):
+        """Check that the name and version of the root element are determined, even when the rest of the XML is incomplete."""
+        assert iati.utilities.sniff_root(xml) == expected
+
+    @pytest.mark.parametrize("not_xml", [b'', b'   ', b'This is not XML.', b'<iati-activities version='])
+    def test_sniff_root_not_xml(self, not_xml):
+        """Check that nothing is determined when the source does not start with a complete start tag."""
+        assert iati.utilities.sniff_root(not_xml) == (None, None)
+
+    def test_sniff_root_file_read_partially(self):
+        """Check that only the start of a file is read to determine the root element."""
+        xml_file = io.BytesIO(b'<iati-activities version="2.02">' + b'<iati-activity/>' * 10000 + b'</iati-activities>')
+
+        assert iati.utilities.sniff_root(xml_file, 64) == ('iati-activities', '2.02')
+        assert xml_file.tell() <= 128
+
+    def test_sniff_root_matches_dataset_version(self):
+        """Check that the sniffed version matches the version of a Dataset created from the same XML."""
+        path = iati.tests.resources.get_test_data_path('valid_iati')
+        dataset = iati.utilities.load_as_dataset(path)
+
+        assert iati.utilities.sniff_root(iati.utilities.load_as_bytes(path)) == ('iati-activities', dataset.version)
+
+
+class TestEncodingDetection(object):
+    """A container for tests relating to detecting the encoding of files that are not UTF-8."""
+
+    @pytest.fixture
+    def no_chardet(self, monkeypatch):
+        """Prevent chardet from being imported, so that tests fail should it be needed."""
+        monkeypatch.setitem(sys.modules, 'chardet', None)
+
+    @pytest.fixture
+    def xml_str(self):
+        """An XML string containing characters outside of ASCII."""
+        return u'<?xml version="1.0"?>\n<iati-activities><iati-activity>na\u00efve caf\u00e9 \u2013 \u0178</iati-activity></iati-activities>'
+
+    @pytest.mark.parametrize("encoding", ['utf-16', 'utf-16-be', 'utf-32'])
+    def test_decode_byte_order_mark(self, no_chardet, xml_str, encoding):
+        """Check that bytes starting with a byte order mark are decoded without chardet, with the mark removed."""
+        loaded_bytes = xml_str.encode(encoding)
+        if encoding == 'utf-16-be':
+            loaded_bytes = codecs.BOM_UTF16_BE + loaded_bytes
+
+        assert iati.utilities._decode(loaded_bytes) == xml_str  # pylint: disable=protected-access
+
+    @pytest.mark.parametrize("encoding", ['ISO-8859-2', 'KOI8-R', 'Shift_JIS'])
+    def test_decode_xml_declaration(self, no_chardet, encoding):
+        """Check that bytes are decoded using the encoding stated in their XML declaration, without chardet."""
+        xml_str = u'<?xml version="1.0" encoding="{0}"?>\n<a>\u0443\u0436\u0435</a>'.format(encoding)
+        if encoding == 'ISO-8859-2':
+            xml_str = xml_str.replace(u'\u0443\u0436\u0435', u'\u017e\u0161\u0165')
+
+        assert iati.utilities._decode(xml_str.encode(encoding)) == xml_str  # pylint: disable=protected-access
+
+    def test_decode_windows_1252(self, no_chardet, xml_str):
+        """Check that bytes without a declared encoding that look like single-byte text are decoded as Windows-1252, without chardet."""
+        assert iati.utilities._decode(xml_str.encode('cp1252')) == xml_str  # pylint: disable=protected-access
+
+    def test_decode_falls_back_to_chardet(self, monkeypatch):
+        """Check that chardet is used when the encoding cannot be quickly determined."""
+        xml_str = u'<a>\u3053\u3093\u306b\u3061\u306f</a>'
+        detected = []
+
+        def detect(loaded_bytes):
+            """Record that detection was performed, then state the encoding."""
+            detected.append(loaded_bytes)
+            return {'encoding': 'EUC-JP'}
+
+        monkeypatch.setattr('chardet.detect', detect)
+
+        assert iati.utilities._decode(xml_str.encode('EUC-JP')) == xml_str  # pylint: disable=protected-access
+        assert len(detected) == 1
+
+
 class TestFileLoading(object):
     """A container for tests relating to loading files."""
 
@@ -1,6 +1,11 @@
 """A module containing tests for data validation."""
 # pylint: disable=too-many-lines
+import subprocess
+import sys
+from multiprocessing.pool import ThreadPool
+from lxml import etree
 import pytest
+from six.moves import cPickle as pickle
 import iati.data
 import iati.default
 import iati.schemas
@@ -482,6 +487,19 @@ class TestValidateIsXML(ValidationTestBase):
         """Perform check to see whether a parameter is valid XML. The parameter is valid XML."""
         assert iati.validator.is_xml(xml_str)
 
+    @pytest.mark.parametrize('module_name', ['chardet', 'jsonschema', 'pkg_resources', 'yaml'])
+    def test_xml_check_does_not_import_slow_dependencies(self, module_name):
+        """Check that importing the library and checking whether a value is valid XML does not import dependencies that are slow to import and unneeded to do so.
+
+        This is checked in a new interpreter since other tests will have imported the dependencies.
+
+        """
+        code = 'import sys; import iati.validator; assert iati.validator.is_xml("<a/>"); print("{0}" in sys.modules)'.format(module_name)
+
+        output = subprocess.check_output([sys.executable, '-c', code])
+
+        assert output.strip() == b'False'
+
     def test_xml_check_empty_string(self, empty_str):
         """Perform check to ensure an empty string is not valid XML."""
         assert not iati.validator.is_xml(empty_str)
@@ -635,6 +653,94 @@ class TestValidateIsXML(ValidationTestBase):
         assert result.contains_error_called('err-not-xml-content-at-end')
 
 
+class TestSniffNotXML(object):
+    """A container for tests relating to identifying values that are obviously not XML without parsing them."""
+
+    @pytest.fixture
+    def no_parsing(self, monkeypatch):
+        """Prevent values from being parsed or decoded, so that tests fail should this happen."""
+        def fail(*args, **kwargs):
+            """Fail if called."""
+            raise AssertionError('A value that is obviously not XML should not be parsed or decoded')
+
+        monkeypatch.setattr(iati.utilities, 'get_parser', fail)
+        monkeypatch.setattr(iati.utilities, '_decode', fail)
+
+    @pytest.mark.parametrize("not_xml", [
+        '',
+        b'  \n ',
+        'This is not XML.',
+        b'{"error": "Not Found"}',
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR',
+        u'\ufeffnot XML',
+        b'\xef\xbb\xbfnot XML'
+    ])
+    def test_not_xml_identified(self, not_xml, no_parsing):
+        """Check that empty values and values that do not start with a start tag result in a single error without being parsed."""
+        result = iati.validator.validate_is_xml(not_xml)
+
+        assert len(result) == 1
+        assert result.contains_error_called('err-not-xml-empty-document')
+        assert result[0].line_number == 1
+        assert result[0].column_number == 1
+
+    @pytest.mark.parametrize("not_xml", [
+        '',
+        b'  \n ',
+        'This is not XML.',
+        b'{"error": "Not Found"}',
+        b'\xef\xbb\xbfnot XML'
+    ])
+    def test_not_xml_matches_parser(self, not_xml):
+        """Check that the error for a value that is obviously not XML is the same as the parser reports for it."""
+        parser = iati.utilities.get_parser()
+        with pytest.raises(etree.XMLSyntaxError):
+            etree.fromstring(not_xml.strip(), parser)
+        expected = iati.validator._create_error_for_lxml_log_entry(parser.error_log[0])  # pylint: disable=protected-access
+
+        result = iati.validator._sniff_not_xml(not_xml)[0]  # pylint: disable=protected-access
+
+        assert result.name == expected.name
+        assert result.info == expected.info
+        assert result.help == expected.help
+        assert result.line_number == expected.line_number
+        assert result.column_number == expected.column_number
+        assert result.lxml_err_code == expected.lxml_err_code
+        assert str(result.err) == str(expected.err)
+
+    @pytest.mark.parametrize("maybe_xml", [
+        '<a/>',
+        b'  <not xml',
+        u'\ufeff<a/>',
+        u'<a/>'.encode('utf-16'),
+        u'<a/>'.encode('utf-16-le'),
+        u'<?xml version="1.0" encoding="CP424"?><a/>'.encode('CP424'),
+        ' ' * 2000 + '<a/>',
+        1
+    ])
+    def test_maybe_xml_not_identified(self, maybe_xml):
+        """Check that values that may be XML are left to the parser."""
+        assert iati.validator._sniff_not_xml(maybe_xml) is None  # pylint: disable=protected-access
+
+    def test_not_xml_dataset_from_bytes(self, monkeypatch):
+        """Check that creating a Dataset from bytes that are obviously not XML raises an error without the bytes being decoded."""
+        monkeypatch.setattr(iati.utilities, '_decode', None)
+
+        with pytest.raises(iati.exceptions.ValidationError) as excinfo:
+            iati.Dataset.from_bytes(b'<!-- not a start tag -->'[5:])
+
+        assert excinfo.value.error_log.contains_error_called('err-not-xml-empty-document')
+
+    def test_not_xml_validate_auto(self, no_parsing, tmpdir):
+        """Check that validating a file that is obviously not XML does not decode it."""
+        path = tmpdir.join('not-xml.json')
+        path.write_binary(b'{"error": "Not Found"}')
+
+        result = iati.validator.validate_auto(str(path))
+
+        assert result.contains_error_called('err-not-xml-empty-document')
+
+
 class TestIsValidIATIXML(ValidationTestBase):
     """A container for tests checking whether a value is valid IATI XML."""
 
@@ -1036,3 +1142,172 @@ class TestValidatorFullValidation(ValidateCodelistsBase):
 
         assert len(result.get_errors_or_warnings_by_category('rule')) > 1
         assert len(result.get_errors_or_warnings_by_name('err-ruleset-conformance-fail')) == 1
+
+
+class TestValidationPlan(ValidateCodelistsBase):
+    """A container for tests relating to plans compiled from Schemas for validation."""
+
+    @staticmethod
+    def error_summary(error_log):
+        """Summarise the contents of an error log so that logs created by different validation calls may be compared."""
+        return sorted((error.name, getattr(error, 'line_number', None), error.help) for error in error_log)
+
+    @pytest.fixture
+    def schema_ruleset_and_codelist(self, schema_ruleset):
+        """Return an Activity Schema with the Standard Ruleset and the Version Codelist added."""
+        schema_ruleset.codelists.add(iati.default.codelist('Version'))
+
+        return schema_ruleset
+
+    @pytest.mark.parametrize('data_name', [
+        'valid_iati',
+        'valid_iati_invalid_code',
+        'valid_std_ruleset',
+        'ruleset-std/invalid_std_ruleset_multiple_rule_errors'
+    ])
+    def test_plan_validate_matches_full_validation(self, schema_ruleset_and_codelist, data_name):
+        """Check that validating against a plan produces the same errors as full validation against the Schema that it was compiled from."""
+        data = iati.tests.resources.load_as_dataset(data_name)
+        plan = schema_ruleset_and_codelist.compile()
+
+        plan_result = plan.validate(data)
+        schema_result = iati.validator.full_validation(data, schema_ruleset_and_codelist)
+
+        assert isinstance(plan, iati.validator.ValidationPlan)
+        assert self.error_summary(plan_result) == self.error_summary(schema_result)
+
+    def test_plan_validate_not_xml(self, schema_basic):
+        """Check that validating something that is not XML against a plan produces the same errors as full validation."""
+        not_xml = 'This is not XML.'
+
+        result = schema_basic.compile().validate(not_xml)
+
+        assert len(result) == 1
+        assert result.contains_error_called('err-not-xml-empty-document')
+
+    def test_plan_accepted_by_validator_functions(self, schema_version):
+        """Check that a plan may be provided in place of a Schema to validation functions."""
+        valid_data = iati.tests.resources.load_as_dataset('valid_iati')
+        invalid_data = iati.tests.resources.load_as_dataset('valid_iati_invalid_code')
+        plan = schema_version.compile()
+
+        assert iati.validator.is_valid(valid_data, plan)
+        assert not iati.validator.is_valid(invalid_data, plan)
+        assert iati.validator.full_validation(invalid_data, plan).contains_error_called('err-code-not-on-codelist')
+
+    def test_plan_immutable(self, schema_basic):
+        """Check that a plan cannot be modified."""
+        plan = schema_basic.compile()
+
+        with pytest.raises(AttributeError):
+            plan._codelist_checks = tuple()  # pylint: disable=protected-access
+
+    def test_plan_unaffected_by_schema_changes(self, schema_basic):
+        """Check that changes made to a Schema after a plan is compiled from it do not affect the plan."""
+        data = iati.tests.resources.load_as_dataset('valid_iati_invalid_code')
+        plan = schema_basic.compile()
+
+        schema_basic.codelists.add(iati.default.codelist('Version'))
+
+        assert plan.is_valid(data)
+        assert not schema_basic.compile().is_valid(data)
+
+    def test_plan_pickle(self, schema_ruleset_and_codelist):
+        """Check that a plan produces the same errors when pickled and unpickled."""
+        data = iati.tests.resources.load_as_dataset('ruleset-std/invalid_std_ruleset_multiple_rule_errors')
+        plan = schema_ruleset_and_codelist.compile()
+
+        unpickled_plan = pickle.loads(pickle.dumps(plan, pickle.HIGHEST_PROTOCOL))
+
+        assert isinstance(unpickled_plan, iati.validator.ValidationPlan)
+        assert self.error_summary(unpickled_plan.validate(data)) == self.error_summary(plan.validate(data))
+
+    def test_plan_shared_between_threads(self, schema_ruleset_and_codelist):
+        """Check that a plan produces consistent results when used from multiple threads at once."""
+        datasets = [iati.tests.resources.load_as_dataset(name) for name in ['valid_iati', 'valid_iati_invalid_code', 'invalid_iati_missing_required_element'] * 4]
+        plan = schema_ruleset_and_codelist.compile()
+        expected = [self.error_summary(plan.validate(dataset)) for dataset in datasets]
+
+        pool = ThreadPool(4)
+        try:
+            results = pool.map(lambda dataset: self.error_summary(plan.validate(dataset)), datasets)
+        finally:
+            pool.close()
+            pool.join()
+
+        assert results == expected
+
+
+class TestValidateAuto(object):
+    """A container for tests relating to validating files against the Schema for the version of the Standard they state."""
+
+    def test_validate_auto_matches_full_validation(self):
+        """Check that validating a file produces the same errors as full validation against the default Schema at its version."""
+        path = iati.tests.resources.get_test_data_path('valid_std_ruleset')
+        dataset = iati.utilities.load_as_dataset(path)
+
+        result = iati.validator.validate_auto(path)
+        expected = iati.validator.full_validation(dataset, iati.default.activity_schema(dataset.version))
+
+        assert TestValidationPlan.error_summary(result) == TestValidationPlan.error_summary(expected)
+
+    def test_validate_auto_uses_cached_plan(self):
+        """Check that files at the same version are validated against the same cached plan."""
+        path = iati.tests.resources.get_test_data_path('valid_iati')
+
+        iati.validator.validate_auto(path)
+        hits_before = iati.default.cache_stats()['validation_plans']['hits']
+        iati.validator.validate_auto(path)
+
+        assert iati.default.cache_stats()['validation_plans']['hits'] == hits_before + 1
+
+    def test_validate_auto_not_xml(self):
+        """Check that a file that is not XML results in XML errors rather than an exception."""
+        path = iati.tests.resources.get_test_data_path('invalid')
+
+        result = iati.validator.validate_auto(path)
+        expected = iati.validator.validate_is_xml(iati.utilities.load_as_string(path))
+
+        assert result.contains_errors()
+        assert TestValidationPlan.error_summary(result) == TestValidationPlan.error_summary(expected)
+
+    def test_validate_auto_undetectable_encoding(self, monkeypatch, tmpdir):
+        """Check that a file that cannot be parsed, and whose encoding cannot be detected, results in an XML error rather than an exception."""
+        def undetectable(*args, **kwargs):
+            """Fail to detect an encoding."""
+            raise ValueError('The encoding could not be detected.')
+
+        monkeypatch.setattr(iati.utilities, '_decode', undetectable)
+        path = tmpdir.join('undetectable.xml')
+        path.write_binary(b'<iati-activities version="2.02"><iati-activity></iati-activities>')
+
+        result = iati.validator.validate_auto(str(path))
+
+        assert result.contains_error_called('err-not-xml-uncategorised-xml-syntax-error')
+
+    def test_validate_auto_not_iati_root(self):
+        """Check that a file that is not IATI data cannot be automatically validated."""
+        path = iati.tests.resources.get_test_data_path('valid_not_iati')
+
+        with pytest.raises(ValueError):
+            iati.validator.validate_auto(path)
+
+    def test_validate_auto_invalid_version(self, tmpdir):
+        """Check that a file stating a version that does not exist cannot be automatically validated."""
+        path = tmpdir.join('invalid_version.xml')
+        path.write('<iati-activities version="9.99"></iati-activities>')
+
+        with pytest.raises(ValueError):
+            iati.validator.validate_auto(str(path))
+
+
+class TestErrorCodes(object):
+    """A container for tests relating to the definitions of error codes."""
+
+    def test_get_error_codes_returns_copy(self):
+        """Check that modifying the returned error codes does not affect later ValidationErrors."""
+        error_codes = iati.validator.get_error_codes()
+        error_codes['err-code-not-on-codelist']['category'] = 'a different category'
+
+        assert iati.validator.get_error_codes()['err-code-not-on-codelist']['category'] == 'codelist'
+        assert iati.validator.ValidationError('err-code-not-on-codelist').category == 'codelist'
@@ -9,14 +9,34 @@ Example:
         dataset = iati.utilities.load_as_dataset(path)
 
 """
+import codecs
 import logging
 import os
+import re
+import threading
 from io import StringIO
-import chardet
 from lxml import etree
 import iati.constants
 
 
+_PARSERS = threading.local()
+"""threading.local: Holds the XML parsers that have been created for each thread, keyed by profile name."""
+
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+)
+"""tuple of (bytes, str): Byte order marks, and the encoding that they indicate. UTF-32 marks are listed first since the UTF-32LE mark starts with the UTF-16LE mark."""
+
+_XML_DECLARATION_ENCODING = re.compile(br'\s*<\?xml[^>]*?\sencoding\s*=\s*["\']([A-Za-z][A-Za-z0-9._-]*)["\']')
+"""Matches the encoding stated in the XML declaration of some bytes in an ASCII-compatible encoding."""
+
+_CONSECUTIVE_HIGH_BYTES = re.compile(b'[\x80-\xff]{2}')
+"""Matches a pair of adjacent non-ASCII bytes, as is found in multi-byte encodings but is uncommon in single-byte Western European text."""
+
+
 def add_namespace(tree, new_ns_name, new_ns_uri):
     """Add a namespace to a Schema.
 
@@ -125,7 +145,7 @@ def convert_xml_to_tree(xml):
 
     """
     try:
-        tree = etree.fromstring(xml)
+        tree = etree.fromstring(xml, get_parser())
         return tree
     except etree.XMLSyntaxError as xml_syntax_err:
         msg = "There was a problem with the provided XML, and it could therefore not be turned into a tree."
@@ -165,6 +185,37 @@ def dict_raise_on_duplicates(ordered_pairs):
     return duplicate_free_dict
 
 
+def get_parser(profile='default'):
+    """Return an XML parser configured with the specified profile.
+
+    Each thread is given its own parser for each profile, which is created on first use then reused, since lxml parsers may be reused but not shared between threads.
+
+    Args:
+        profile (str): The name of a profile in `iati.constants.PARSER_PROFILES`. Defaults to 'default'.
+
+    Returns:
+        etree.XMLParser: A parser for use by the calling thread.
+
+    Raises:
+        ValueError: When `profile` is not the name of a parser profile.
+
+    Warning:
+        Does not fully hide the lxml internal workings.
+
+    """
+    try:
+        parsers = _PARSERS.parsers
+    except AttributeError:
+        parsers = _PARSERS.parsers = dict()
+
+    try:
+        return parsers[profile]
+    except (KeyError, TypeError):
+        parser = etree.XMLParser(**parser_options(profile))
+        parsers[profile] = parser
+        return parser
+
+
 def load_as_bytes(path):
     """Load a file at the specified absolute path into a bytes object.
 
@@ -201,13 +252,14 @@ def load_as_dataset(path):
 
         ValueError: When a file at the specified path does not contain valid XML.
 
+    Note:
+        The file is memory-mapped and parsed without first being decoded. See `iati.Dataset.from_path()`.
+
     Todo:
         Ensure all reasonably possible OSErrors are documented here and in functions that call this.
 
     """
-    dataset_str = load_as_string(path)
-
-    return iati.Dataset(dataset_str)
+    return iati.Dataset.from_path(path)
 
 
 def load_as_string(path):
@@ -225,23 +277,84 @@ def load_as_string(path):
     """
     loaded_bytes = load_as_bytes(path)
 
+    return _decode(loaded_bytes)
+
+
+def _decode(loaded_bytes):
+    """Decode the contents of a file into a string, detecting its encoding if it is not UTF-8.
+
+    The encoding is determined from any byte order mark, then any XML declaration, then by checking whether the bytes look like Windows-1252 text. `chardet` is only used when none of these succeed.
+
+    Args:
+        loaded_bytes (bytes): The contents of a file.
+
+    Returns:
+        str (python3) / unicode (python2): The decoded contents.
+
+    Raises:
+        ValueError: When the encoding of the contents could not be detected.
+
+    """
     try:
-        loaded_str = loaded_bytes.decode('utf-8')
+        return loaded_bytes.decode('utf-8')
     except UnicodeDecodeError:
-        # the file was not UTF-8, so perform a (slow) test to detect encoding
-        # only use the first section of the file since this is generally enough and prevents big files taking ages
-        detected_info = chardet.detect(loaded_bytes[:25000])
+        pass
+
+    # the file was not UTF-8, so try the encodings that can be quickly determined from its bytes
+    for encoding in _candidate_encodings(loaded_bytes):
         try:
-            loaded_str = loaded_bytes.decode(detected_info['encoding'])
-            # in Python 2 it is necessary to strip the BOM when decoding from UTF-16BE
-            if detected_info['encoding'] == 'UTF-16' and loaded_str[:1] == u'\ufeff':
-                loaded_str = loaded_str[1:]
-        except TypeError:
-            raise ValueError('Could not detect encoding of file')
+            loaded_str = loaded_bytes.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+        # in Python 2 it is necessary to strip the BOM when decoding from UTF-16BE
+        if loaded_str[:1] == u'\ufeff':
+            loaded_str = loaded_str[1:]
+        return loaded_str
+
+    # perform a (slow) test to detect encoding
+    # only use the first section of the file since this is generally enough and prevents big files taking ages
+    import chardet  # imported here since it is only needed for files where the encoding cannot be quickly determined
+    detected_info = chardet.detect(loaded_bytes[:25000])
+    try:
+        loaded_str = loaded_bytes.decode(detected_info['encoding'])
+        # in Python 2 it is necessary to strip the BOM when decoding from UTF-16BE
+        if detected_info['encoding'] == 'UTF-16' and loaded_str[:1] == u'\ufeff':
+            loaded_str = loaded_str[1:]
+    except TypeError:
+        raise ValueError('Could not detect encoding of file')
 
     return loaded_str
 
 
+def _candidate_encodings(loaded_bytes):
+    """Determine the likely encodings of some bytes that are not UTF-8, without performing statistical analysis.
+
+    Args:
+        loaded_bytes (bytes): The contents of a file.
+
+    Yields:
+        str: Encodings to try decoding the bytes with, most likely first. These are indicated by a byte order mark, the XML declaration, or the bytes looking like single-byte text, in which case the encoding is assumed to be Windows-1252.
+
+    """
+    for byte_order_mark, encoding in _BYTE_ORDER_MARKS:
+        if loaded_bytes.startswith(byte_order_mark):
+            yield encoding
+            return
+
+    declaration = _XML_DECLARATION_ENCODING.match(loaded_bytes[:1024])
+    if declaration is not None:
+        try:
+            declared_encoding = codecs.lookup(declaration.group(1).decode('ascii')).name
+        except LookupError:
+            declared_encoding = None
+        # a declaration that can be read as ASCII is not in a wide encoding, whatever it states
+        if declared_encoding is not None and not declared_encoding.startswith(('utf-16', 'utf-32')):
+            yield declared_encoding
+
+    if _CONSECUTIVE_HIGH_BYTES.search(loaded_bytes[:25000]) is None:
+        yield 'cp1252'
+
+
 def load_as_tree(path):
     """Load a schema at the specified absolute path into an ElementTree.
 
@@ -264,7 +377,7 @@ def load_as_tree(path):
 
     """
     try:
-        doc = etree.parse(path)
+        doc = etree.parse(path, get_parser())
         return doc
     except OSError:
         raise
@@ -345,6 +458,75 @@ def log_warning(msg, *args, **kwargs):
     log(logging.WARN, msg, *args, **kwargs)
 
 
+def parser_options(profile='default'):
+    """Return the XML parser options for the specified profile.
+
+    Args:
+        profile (str): The name of a profile in `iati.constants.PARSER_PROFILES`. Defaults to 'default'.
+
+    Returns:
+        dict: Keyword arguments for `lxml.etree.XMLParser`, or for `lxml.etree.iterparse`.
+
+    Raises:
+        ValueError: When `profile` is not the name of a parser profile.
+
+    """
+    try:
+        options = iati.constants.PARSER_PROFILES[profile]
+    except (KeyError, TypeError):
+        msg = "{0} is not a parser profile. Available profiles are: {1}".format(profile, ', '.join(sorted(iati.constants.PARSER_PROFILES)))
+        log_error(msg)
+        raise ValueError(msg)
+
+    return dict(iati.constants.PARSER_OPTIONS, **options)
+
+
+def sniff_root(source, chunk_size=4096):
+    """Determine the name and version of the root element of some XML, without parsing all of it.
+
+    Only as much of the XML is read as is required to reach the end of the root element's start tag. This is generally within the first chunk.
+
+    Args:
+        source (bytes or str or file): The XML to examine. A file must be open for reading, and is read from its current position.
+        chunk_size (int): The number of bytes or characters to read at a time. Defaults to 4096.
+
+    Returns:
+        tuple: A tuple in the format: `(str, str)` - The first `str` is the name of the root element; The second `str` is the value of its `version` attribute, with surrounding whitespace removed. The version is `1.01` when there is no `version` attribute, in line with `iati.Dataset.version`. Both values are None when the source does not start with well-formed XML.
+
+    Warning:
+        For version 1 data, `iati.Dataset.version` additionally requires that each child element states the same version as the root element. This is not checked.
+
+    Example:
+        To determine the version of the Standard that a file states it is at::
+
+            with open(path, 'rb') as xml_file:
+                root_element_name, version = iati.utilities.sniff_root(xml_file)
+
+    """
+    if hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = (source[start:start + chunk_size] for start in range(0, len(source), chunk_size))
+
+    parser = etree.XMLPullParser(events=('start',), **parser_options())
+    started = False
+    for chunk in chunks:
+        if not isinstance(chunk, bytes):
+            chunk = chunk.encode('utf-8')
+        if not started:
+            # leading whitespace is permitted by Datasets, which strip it, but not by the parser
+            chunk = chunk.lstrip()
+            started = bool(chunk)
+        try:
+            parser.feed(chunk)
+        except etree.XMLSyntaxError:
+            return None, None
+        for _, root in parser.read_events():
+            return root.tag, root.get('version', '1.01').strip()
+
+    return None, None
+
+
 def versions_for_integer(integer):
     """Return a list containing the supported versions for the input integer version.
 
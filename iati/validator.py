@@ -1,8 +1,9 @@
 """A module containing validation functionality."""
 
+import codecs
 import sys
+import threading
 from lxml import etree
-import yaml
 import iati.default
 import iati.resources
 
@@ -32,7 +33,7 @@ class ValidationError(object):
             calling_locals = dict()
 
         try:
-            err_detail = get_error_codes()[err_name]
+            err_detail = _error_codes()[err_name]
         except (KeyError, TypeError):
             raise ValueError('{err_name} is not a known type of ValidationError.'.format(**locals()))
 
@@ -272,17 +273,156 @@ class ValidationErrorLog(object):
         return [err for err in self if err.status == 'warning']
 
 
-def _extract_codes_from_attrib(dataset, parent_el_xpath, attr_name, condition=None):
-    """Extract codes for checking from a Dataset. The codes are being extracted from attributes.
+class ValidationPlan(object):
+    """A precompiled and immutable set of the checks required to validate Datasets against a Schema.
+
+    A plan bundles the compiled XML Schema, the values on each Codelist, compiled XPaths for each Codelist mapping, and the Rules of each Ruleset. These are resolved once when the plan is created, rather than each time that a Dataset is validated.
+
+    A plan may be shared between threads and pickled in order to send it to worker processes. Create one with `iati.Schema.compile()`.
+
+    Note:
+        Validation against the compiled XML Schema is performed by one thread at a time, since lxml records the resulting errors on the compiled Schema. Use processes, such as those created by `iati.default.worker_pool()`, to perform this part of validation in parallel.
+
+    Warning:
+        Changes made to a Schema, or to its Codelists and Rulesets, after a plan has been created from it do not affect the plan.
+
+    """
+
+    __slots__ = ('_schema', '_validator', '_validator_lock', '_codelist_checks', '_rule_collections', '_frozen')
+
+    def __init__(self, schema):
+        """Initialise a ValidationPlan.
+
+        Args:
+            schema (iati.Schema): The Schema to validate Datasets against.
+
+        Raises:
+            iati.exceptions.SchemaError: An error occurred in the creation of the validator for the Schema.
+            ValueError: When a path in a Codelist mapping is looking for a type of information that is not supported.
+
+        """
+        mappings = iati.default.codelist_mapping()
+
+        self._schema = schema.copy()
+        self._validator = schema.validator()
+        self._validator_lock = threading.Lock()
+        self._codelist_checks = tuple(codelist_check for codelist in schema.codelists for codelist_check in _compile_codelist_checks(codelist, mappings))
+        self._rule_collections = tuple(tuple(ruleset.rules) for ruleset in schema.rulesets)
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        """Prevent modification once the plan has been created.
+
+        Raises:
+            AttributeError: Always, once the plan has been created.
+
+        """
+        if getattr(self, '_frozen', False):
+            raise AttributeError('A ValidationPlan cannot be modified. Compile a new plan from a modified Schema instead.')
+        super(ValidationPlan, self).__setattr__(name, value)
+
+    def __reduce__(self):
+        """Reduce the plan to the Schema it was created from for pickling.
+
+        The plan is compiled again when unpickled.
+
+        """
+        return (ValidationPlan, (self._schema,))
+
+    @property
+    def schema(self):
+        """iati.Schema: A copy of the Schema that the plan was created from."""
+        return self._schema.copy()
+
+    def is_valid(self, dataset):
+        """Determine whether a given Dataset is valid against the plan.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to check validity of.
+
+        Returns:
+            bool: A boolean indicating whether the given Dataset is valid.
+
+        Raises:
+            TypeError: Something was provided as a Dataset that is not a Dataset.
+
+        """
+        if self._check_is_iati_xml(dataset).contains_errors():
+            return False
+
+        return not self._check_codelists_and_rulesets(dataset).contains_errors()
+
+    def validate(self, dataset):
+        """Perform full validation on a Dataset.
+
+        This is equivalent to `iati.validator.full_validation()` against the Schema that the plan was created from.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to check validity of.
+
+        Returns:
+            iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+        """
+        error_log = ValidationErrorLog()
+
+        # a Dataset can only be created from well-formed XML, so re-parsing it would find nothing
+        if not isinstance(dataset, iati.data.Dataset):
+            error_log.extend(_check_is_xml(dataset))
+        try:
+            error_log.extend(self._check_is_iati_xml(dataset))
+        except TypeError:
+            return error_log
+        error_log.extend(self._check_codelists_and_rulesets(dataset))
+
+        return error_log
+
+    def _check_codelists_and_rulesets(self, dataset):
+        """Check whether a given Dataset has values from Codelists where expected, and conforms with Rulesets.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to check.
+
+        Returns:
+            iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+        """
+        error_log = ValidationErrorLog()
+
+        for codelist_check in self._codelist_checks:
+            codelist_check.check(dataset, error_log)
+        for rules in self._rule_collections:
+            error_log.extend(_check_rule_collection(dataset, rules))
+
+        return error_log
+
+    def _check_is_iati_xml(self, dataset):
+        """Check whether a given Dataset is valid against the compiled XML Schema.
+
+        Args:
+            dataset (iati.Dataset): The Dataset to check validity of.
+
+        Returns:
+            iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+        Raises:
+            TypeError: Something was provided as a Dataset that is not a Dataset.
+
+        """
+        with self._validator_lock:
+            return _check_against_validator(dataset, self._validator)
+
+
+def _attrib_parent_xpath(parent_el_xpath, attr_name, condition=None):
+    """Create an XPath to locate the elements that have an attribute containing codes.
 
     Args:
-        dataset (iati.data.Dataset): The Dataset to check Codelist values within.
         parent_el_xpath (str): An XPath to locate the element(s) with the attribute of interest.
-        attr_name (str): The name of the attribute to extract a code from.
-        condition (str): An optional XPath expression to limit the scope of what is extracted.
+        attr_name (str): The name of the attribute containing a code.
+        condition (str): An optional XPath expression to limit the scope of what is located.
 
     Returns:
-        list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
+        tuple: A tuple in the format: `(str, str)` - The first `str` is the XPath to locate elements with; The second `str` is the name of the attribute as it appears in lxml `attrib` dictionaries.
 
     """
     if condition is None:
@@ -299,62 +439,123 @@ def _extract_codes_from_attrib(dataset, parent_el_xpath, attr_name, condition=No
     if attr_name == 'xml:lang':
         attr_name = '{http://www.w3.org/XML/1998/namespace}lang'
 
-    parents_to_check = dataset.xml_tree.xpath(parent_el_xpath)
-
-    located_codes = list()
-    for parent in parents_to_check:
-        located_codes.append((parent.attrib[attr_name], parent.sourceline))
+    return parent_el_xpath, attr_name
 
-    return located_codes
 
-
-def _extract_codes_from_element_text(dataset, parent_el_xpath, condition=None):  # pylint: disable=invalid-name
-    """Extract codes for checking from a Dataset. The codes are being extracted from element text.
+def _element_text_parent_xpath(parent_el_xpath, condition=None):  # pylint: disable=invalid-name
+    """Create an XPath to locate the elements that have text containing codes.
 
     Args:
-        dataset (iati.data.Dataset): The Dataset to check Codelist values within.
-        parent_el_xpath (str): An XPath to locate the element(s) with the attribute of interest.
-        condition (str): An optional XPath expression to limit the scope of what is extracted.
+        parent_el_xpath (str): An XPath to locate the element(s) with the text of interest.
+        condition (str): An optional XPath expression to limit the scope of what is located.
 
     Returns:
-        list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
+        str: The XPath to locate elements with.
 
     """
-    # include the condition
     if condition:
         parent_el_xpath = parent_el_xpath + '[' + condition + ']'
 
-    parents_to_check = dataset.xml_tree.xpath(parent_el_xpath)
+    return parent_el_xpath
+
+
+class _CodelistCheck(object):
+    """A check that the codes at a location specified by a Codelist mapping are on the Codelist, with its XPath compiled.
+
+    Checks are created once per mapping, then may be run against any number of Datasets.
+
+    """
+
+    __slots__ = ('codelist', 'code_values', 'err_name', 'attr_name', 'el_name', 'parent_el_xpath', '_lookup_attr_name', '_xpath')
+
+    def __init__(self, codelist, mapping):
+        """Initialise a check.
+
+        Args:
+            codelist (iati.Codelist): The Codelist to check values from.
+            mapping (dict): A mapping for the Codelist, in the format `{"xpath": str, "condition": str or None}`.
+
+        Raises:
+            ValueError: When the path in the mapping is not looking for an attribute value or element text.
+
+        """
+        self.codelist = codelist
+        self.code_values = codelist.code_values
+        err_name_prefix = 'err' if codelist.complete else 'warn'
+        self.parent_el_xpath, last_xpath_section = mapping['xpath'].rsplit('/', 1)
+
+        if last_xpath_section.startswith('@'):
+            self.attr_name = last_xpath_section[1:]
+            self.el_name = None
+            xpath, self._lookup_attr_name = _attrib_parent_xpath(self.parent_el_xpath, self.attr_name, mapping['condition'])
+            self.err_name = err_name_prefix + '-code-not-on-codelist'
+        elif last_xpath_section == 'text()':
+            self.attr_name = None
+            self.el_name = self.parent_el_xpath.rsplit('/', 1)[-1]
+            self._lookup_attr_name = None
+            xpath = _element_text_parent_xpath(self.parent_el_xpath, mapping['condition'])
+            self.err_name = err_name_prefix + '-code-not-on-codelist-element-text'
+        else:
+            raise ValueError('mapping path does not locate attribute value or element text')
+
+        self._xpath = etree.XPath(xpath)
+
+    def extract_codes(self, dataset):
+        """Extract the codes that this check applies to from a Dataset.
+
+        Args:
+            dataset (iati.data.Dataset): The Dataset to extract codes from.
+
+        Returns:
+            list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
+
+        """
+        parents_to_check = self._xpath(dataset.xml_tree)
+
+        if self._lookup_attr_name is not None:
+            return [(parent.attrib[self._lookup_attr_name], parent.sourceline) for parent in parents_to_check]
+        return [(parent.text, parent.sourceline) for parent in parents_to_check]
+
+    def check(self, dataset, error_log):
+        """Add an error to an error log for each code in a Dataset that is not on the Codelist.
+
+        Args:
+            dataset (iati.data.Dataset): The Dataset to check Codelist values within.
+            error_log (iati.validator.ValidationErrorLog): The log to add errors to.
 
-    located_codes = list()
-    for parent in parents_to_check:
-        located_codes.append((parent.text, parent.sourceline))
+        """
+        for (code, line_number) in self.extract_codes(dataset):
+            if code not in self.code_values:
+                error_locals = {
+                    'dataset': dataset,
+                    'codelist': self.codelist,
+                    'code': code,
+                    'line_number': line_number,
+                    'attr_name': self.attr_name,
+                    'el_name': self.el_name,
+                    'parent_el_xpath': self.parent_el_xpath
+                }
+                error = ValidationError(self.err_name, error_locals)
+                error.actual_value = code
 
-    return located_codes
+                error_log.add(error)
 
 
-def _extract_codes(dataset, parent_el_xpath, last_xpath_section, condition=None):
-    """Extract codes for checking from a Dataset.
+def _compile_codelist_checks(codelist, mappings):
+    """Create the checks for each location that a Codelist is mapped to.
 
     Args:
-        dataset (iati.data.Dataset): The Dataset to check Codelist values within.
-        parent_el_xpath (str): An XPath to locate the element(s) with the code of interest.
-        last_xpath_section (str): The last section of the XPath, detailing how to find the code on the identified element(s).
-        condition (str): An optional XPath expression to limit the scope of what is extracted.
+        codelist (iati.codelists.Codelist): The Codelist to check values from.
+        mappings (dict): Codelist mappings, as returned by `iati.default.codelist_mapping()`.
 
-    list of tuple: A tuple in the format: `(str, int)` - The `str` is a matching code from within the Dataset; The `int` is the sourceline at which the parent element is located.
+    Returns:
+        list of _CodelistCheck: The checks for the Codelist.
 
     Raises:
-        ValueError: When a path in a mapping is not looking for an attribute value or element text.
+        ValueError: When a path in a mapping is looking for a type of information that is not supported.
 
     """
-    if last_xpath_section.startswith('@'):
-        attr_name = last_xpath_section[1:]
-        return _extract_codes_from_attrib(dataset, parent_el_xpath, attr_name, condition)
-    elif last_xpath_section == 'text()':
-        return _extract_codes_from_element_text(dataset, parent_el_xpath, condition)
-    else:
-        raise ValueError('mapping path does not locate attribute value or element text')
+    return [_CodelistCheck(codelist, mapping) for mapping in mappings[codelist.name]]
 
 
 def _check_codes(dataset, codelist):
@@ -373,25 +574,9 @@ def _check_codes(dataset, codelist):
     """
     error_log = ValidationErrorLog()
     mappings = iati.default.codelist_mapping()
-    err_name_prefix = 'err' if codelist.complete else 'warn'
-
-    for mapping in mappings[codelist.name]:
-        parent_el_xpath, last_xpath_section = mapping['xpath'].rsplit('/', 1)
-
-        located_codes = _extract_codes(dataset, parent_el_xpath, last_xpath_section, mapping['condition'])
-
-        for (code, line_number) in located_codes:  # `line_number` used via `locals()` # pylint: disable=unused-variable
-            if code not in codelist.codes:
-                if last_xpath_section.startswith('@'):
-                    attr_name = last_xpath_section[1:]  # used via `locals()`  # pylint: disable=unused-variable
-                    error = ValidationError(err_name_prefix + '-code-not-on-codelist', locals())
-                else:
-                    _, el_name = parent_el_xpath.rsplit('/', 1)  # used via `locals()` # pylint: disable=unused-variable
-                    error = ValidationError(err_name_prefix + '-code-not-on-codelist-element-text', locals())
 
-                error.actual_value = code
-
-                error_log.add(error)
+    for codelist_check in _compile_codelist_checks(codelist, mappings):
+        codelist_check.check(dataset, error_log)
 
     return error_log
 
@@ -433,13 +618,30 @@ def _check_is_iati_xml(dataset, schema):
         Create test against a bad Schema.
 
     """
-    error_log = ValidationErrorLog()
-
     try:
         validator = schema.validator()
     except iati.exceptions.SchemaError as err:
         raise err
 
+    return _check_against_validator(dataset, validator)
+
+
+def _check_against_validator(dataset, validator):
+    """Check whether a given Dataset is valid against a compiled XML Schema.
+
+    Args:
+        dataset (iati.data.Dataset): The Dataset to check validity of.
+        validator (etree.XMLSchema): The compiled Schema to validate the Dataset against.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+    Raises:
+        TypeError: Something was provided as a Dataset that is not a Dataset.
+
+    """
+    error_log = ValidationErrorLog()
+
     try:
         validator.assertValid(dataset.xml_tree)
     except etree.DocumentInvalid as doc_invalid:
@@ -465,13 +667,17 @@ def _check_is_xml(maybe_xml):
         Consider how a Dataset may be passed when creating errors so that context can be obtained.
 
     """
-    error_log = ValidationErrorLog()
-
     if isinstance(maybe_xml, iati.data.Dataset):
         maybe_xml = maybe_xml.xml_str
 
+    error_log = _sniff_not_xml(maybe_xml)
+    if error_log is not None:
+        return error_log
+
+    error_log = ValidationErrorLog()
+
     try:
-        parser = etree.XMLParser()
+        parser = iati.utilities.get_parser()
         _ = etree.fromstring(maybe_xml.strip(), parser)
     except etree.XMLSyntaxError:
         for log_entry in parser.error_log:
@@ -492,6 +698,86 @@ def _check_is_xml(maybe_xml):
     return error_log
 
 
+_SNIFF_LENGTH = 1024
+"""int: The number of characters or bytes at the start of a value that are checked to determine whether it is obviously not XML."""
+
+_EBCDIC_XML_DECLARATION = b'\x4c\x6f\xa7\x94'
+"""bytes: The start of an XML declaration, `<?xm`, in EBCDIC encodings."""
+
+
+def _sniff_not_xml(maybe_xml):
+    """Identify a value that is obviously not XML from its first characters, without parsing it.
+
+    Empty values and those that do not start with `<` are identified, which covers the HTTP error bodies, JSON and binary files that are commonly found in place of IATI data. The error produced is the same as the XML parser reports.
+
+    Args:
+        maybe_xml (str or bytes): A value that may or may not contain valid XML.
+
+    Returns:
+        iati.validator.ValidationErrorLog or None: A log containing a single `err-not-xml-empty-document` error if the value is obviously not XML. None if the value must be parsed to determine whether it is XML, or is not a string.
+
+    Note:
+        Bytes in UTF-16, UTF-32 or EBCDIC cannot be checked byte by byte, so always need parsing.
+
+    """
+    if isinstance(maybe_xml, bytes):
+        start = maybe_xml[:_SNIFF_LENGTH]
+        if start.startswith(codecs.BOM_UTF8):
+            start = start[len(codecs.BOM_UTF8):]
+        elif b'\x00' in start[:4] or start.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, _EBCDIC_XML_DECLARATION)):
+            return None
+        start_tag = b'<'
+    elif isinstance(maybe_xml, type(u'')):
+        start = maybe_xml[:_SNIFF_LENGTH].lstrip(u'\ufeff')
+        start_tag = u'<'
+    else:
+        return None
+
+    start = start.lstrip()
+    if not start:
+        if len(maybe_xml) > _SNIFF_LENGTH:
+            # only whitespace has been checked, so there may be XML later on
+            return None
+        err = _SniffedLogEntry('Document is empty')  # used via `locals()` # pylint: disable=unused-variable
+    elif start[:1] != start_tag:
+        err = _SniffedLogEntry("Start tag expected, '<' not found")  # used via `locals()` # pylint: disable=unused-variable
+    else:
+        return None
+
+    # configure local variables for the creation of the error
+    line_number = err.line  # used via `locals()` # pylint: disable=unused-variable
+    column_number = err.column  # used via `locals()` # pylint: disable=unused-variable
+
+    error_log = ValidationErrorLog()
+    error_log.add(ValidationError('err-not-xml-empty-document', locals()))
+
+    return error_log
+
+
+class _SniffedLogEntry(object):
+    """A stand-in for the lxml log entry that the parser reports for a value that `_sniff_not_xml()` identifies as obviously not XML.
+
+    Attributes:
+        message (str): The message that the parser reports.
+
+    """
+
+    filename = '<string>'
+    line = 1
+    column = 1
+    level_name = 'FATAL'
+    domain_name = 'PARSER'
+    type_name = 'ERR_DOCUMENT_EMPTY'
+
+    def __init__(self, message):
+        """Initialise a log entry with the message that the parser reports."""
+        self.message = message
+
+    def __str__(self):
+        """Return the log entry in the same format as an lxml log entry."""
+        return '{0}:{1}:{2}:{3}:{4}:{5}: {6}'.format(self.filename, self.line, self.column, self.level_name, self.domain_name, self.type_name, self.message)
+
+
 def _check_rules(dataset, ruleset):
     """Determine whether a given Dataset conforms with a provided Ruleset.
 
@@ -502,11 +788,25 @@ def _check_rules(dataset, ruleset):
     Returns:
         iati.validator.ValidationErrorLog: A log of the errors that occurred.
 
+    """
+    return _check_rule_collection(dataset, ruleset.rules)
+
+
+def _check_rule_collection(dataset, rules):
+    """Determine whether a given Dataset conforms with a collection of Rules that make up a Ruleset.
+
+    Args:
+        dataset (iati.data.Dataset): The Dataset to check Ruleset conformance with.
+        rules (iterable of iati.Rule): The Rules of the Ruleset to check conformance with.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
     """
     error_log = ValidationErrorLog()
     error_found = False
 
-    for rule in ruleset.rules:
+    for rule in rules:
         validation_status = rule.is_valid_for(dataset)
         if validation_status is None:
             # A result of `None` signifies that a rule was skipped.
@@ -667,7 +967,7 @@ def full_validation(dataset, schema):
 
     Args:
         dataset (iati.Dataset): The Dataset to check validity of.
-        schema (iati.Schema): The Schema to validate the Dataset against.
+        schema (iati.Schema or iati.validator.ValidationPlan): The Schema to validate the Dataset against. A plan compiled from a Schema may be provided to avoid resolving the Schema's Codelists and Rulesets on each call.
 
     Warning:
         Parameters are likely to change in some manner.
@@ -679,6 +979,9 @@ def full_validation(dataset, schema):
         Create test against a bad Schema.
 
     """
+    if isinstance(schema, ValidationPlan):
+        return schema.validate(dataset)
+
     error_log = ValidationErrorLog()
 
     error_log.extend(_check_is_xml(dataset))
@@ -705,8 +1008,42 @@ def get_error_codes():
         Raise the correct error for incorrect base_exception values.
         Raise an error when there is a problem with non-base_exception-related errors.
 
+    """
+    return {err_name: dict(err_detail) for err_name, err_detail in _error_codes().items()}
+
+
+_ERROR_CODES = dict()
+"""A cache of the possible error codes and their information, so that they are only loaded once."""
+
+
+def _error_codes():
+    """Return the cached dictionary of the possible error codes and their information, loading it if required.
+
+    Returns:
+        dict: A dictionary of error codes. It must not be modified.
+
+    Raises:
+        KeyError: When a specified base_exception is not a valid type of exception.
+
+    """
+    if not _ERROR_CODES:
+        _ERROR_CODES.update(_load_error_codes())
+
+    return _ERROR_CODES
+
+
+def _load_error_codes():
+    """Load the possible error codes and their information from disk.
+
+    Returns:
+        dict: A dictionary of error codes.
+
+    Raises:
+        KeyError: When a specified base_exception is not a valid type of exception.
+
     """
     err_codes_str = iati.utilities.load_as_string(iati.resources.create_lib_data_path('validation_err_codes.yaml'))
+    import yaml  # imported here since it is only needed once an error has occurred
     err_codes_list_of_dict = yaml.safe_load(err_codes_str)
     # yaml parses the values into a list of dicts, so they need combining into one
     err_codes_dict = {k: v for code in err_codes_list_of_dict for k, v in code.items()}
@@ -750,7 +1087,7 @@ def is_valid(dataset, schema):
 
     Args:
         dataset (iati.Dataset): The Dataset to check validity of.
-        schema (iati.Schema): The Schema to validate the Dataset against.
+        schema (iati.Schema or iati.validator.ValidationPlan): The Schema to validate the Dataset against. A plan compiled from a Schema may be provided to avoid resolving the Schema's Codelists and Rulesets on each call.
 
     Warning:
         Parameters are likely to change in some manner.
@@ -762,6 +1099,9 @@ def is_valid(dataset, schema):
         Create test against a bad Schema.
 
     """
+    if isinstance(schema, ValidationPlan):
+        return schema.is_valid(dataset)
+
     try:
         iati_xml = is_iati_xml(dataset, schema)
         if not iati_xml:
@@ -790,6 +1130,67 @@ def is_xml(maybe_xml):
     return not error_log.contains_errors()
 
 
+def validate_auto(path):
+    """Perform full validation on a file against the default Schema for the type of data it contains, at the version of the Standard that it states.
+
+    The type of data and version are sniffed from the start of the file, without parsing all of it. Validation is then performed against a cached ValidationPlan, so validating many files at a small number of versions only compiles a small number of plans.
+
+    Args:
+        path (str): The path to a file containing IATI XML.
+
+    Returns:
+        iati.validator.ValidationErrorLog: A log of the errors that occurred.
+
+    Raises:
+        FileNotFoundError (python3) / IOError (python2): When a file at the specified path does not exist.
+        ValueError: When the root element of the file is not `iati-activities` or `iati-organisations`.
+        ValueError: When the file states a version that is not a valid version of the IATI Standard.
+        iati.exceptions.SchemaError: An error occurred in the creation of the validator for the relevant Schema.
+
+    Example:
+        To validate every file in a directory::
+
+            error_logs = {path: iati.validator.validate_auto(path) for path in glob.glob('data/*.xml')}
+
+    """
+    plan_funcs = {
+        iati.ActivitySchema.ROOT_ELEMENT_NAME: iati.default.activity_validation_plan,
+        iati.OrganisationSchema.ROOT_ELEMENT_NAME: iati.default.organisation_validation_plan
+    }
+
+    xml_bytes = iati.utilities.load_as_bytes(path)
+    root_element_name, version = iati.utilities.sniff_root(xml_bytes)
+
+    if root_element_name is None:
+        # avoid parsing content that is obviously not XML
+        not_xml_log = _sniff_not_xml(xml_bytes)
+        if not_xml_log is not None:
+            return not_xml_log
+    else:
+        try:
+            plan_func = plan_funcs[root_element_name]
+        except KeyError:
+            raise ValueError('The root element of {0} is {1}, which is not the root element of IATI data.'.format(path, root_element_name))
+        plan = plan_func(version)
+
+    try:
+        dataset = iati.Dataset.from_bytes(xml_bytes)
+    except iati.exceptions.ValidationError as validation_err:
+        return validation_err.error_log
+    except ValueError as value_err:
+        # the bytes could not be parsed, and their encoding could not be detected to explain why
+        err = str(value_err)  # used via `locals()` # pylint: disable=unused-variable
+        error_log = ValidationErrorLog()
+        error_log.add(ValidationError('err-not-xml-uncategorised-xml-syntax-error', locals()))
+        return error_log
+
+    # the root element is sniffed from anything that starts with well-formed XML, so this is not expected
+    if root_element_name is None:
+        raise ValueError('The root element of {0} could not be determined.'.format(path))
+
+    return plan.validate(dataset)
+
+
 def validate_is_iati_xml(dataset, schema):
     """Check whether a Dataset contains valid IATI XML.
 